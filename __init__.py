@@ -9,8 +9,16 @@ from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from .const import DATA_DEVICE_INFO, DOMAIN, INFO_MAC, PLATFORMS
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    COOK_RETENTION_INTERVAL,
+    COOK_STORAGE_SCAN_INTERVAL,
+    DATA_DEVICE_INFO,
+    DOMAIN,
+    INFO_MAC,
+    PLATFORMS,
+)
 from .coordinator import PitbossDataUpdateCoordinator
 from .panel import (
     async_register_panel,
@@ -124,6 +132,25 @@ async def async_setup_entry(
             async_track_entity_id_rename_issues(hass, config_entry, device.id)
         )
 
+    config_entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            coordinator.async_schedule_retention,
+            COOK_RETENTION_INTERVAL,
+            cancel_on_shutdown=True,
+        )
+    )
+    coordinator.async_schedule_retention()
+    config_entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            coordinator.async_schedule_storage_scan,
+            COOK_STORAGE_SCAN_INTERVAL,
+            cancel_on_shutdown=True,
+        )
+    )
+    coordinator.async_schedule_storage_scan()
+
     config_entry.async_on_unload(
         config_entry.add_update_listener(
             lambda hass, entry: hass.config_entries.async_reload(entry.entry_id)
@@ -139,6 +166,7 @@ async def async_unload_entry(
     """Unload a config entry."""
 
     config_entry.runtime_data.cancel_pending_commands()
+    await config_entry.runtime_data.async_close_cook_archive()
     unload_ok = await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
     )
@@ -0,0 +1,95 @@
+"""Percentile reference curves across many archived Pit Boss cooks."""
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from math import isnan
+from typing import Any
+import warnings
+
+import numpy as np
+
+from .codec import Row
+
+
+def _to_json_list(values: np.ndarray) -> list[float | None]:
+    """Return rounded array values as a list with None for missing points."""
+
+    return [
+        None if isnan(value) else value for value in np.round(values, 2).tolist()
+    ]
+
+
+def aggregate_traces(
+    starts: Sequence[datetime],
+    traces: Sequence[Sequence[Row]],
+    step: timedelta,
+    channels: Sequence[str],
+    percentiles: Sequence[int],
+) -> dict[str, Any]:
+    """Return percentile bands of each channel across cooks on a shared grid.
+
+    Grid point ``i`` lies ``i * step`` after each cook's start. Every cook is
+    laid out on its own stretch of one long axis, so a single ``numpy.interp``
+    call per channel resamples all cooks at once. Points outside a cook's
+    sampled span are left out of that point's percentiles and ``count``.
+    """
+
+    cooks = [
+        (start, samples)
+        for start, samples in zip(starts, traces, strict=True)
+        if samples
+    ]
+    if not cooks:
+        return {
+            "cook_count": 0,
+            "count": [],
+            "channels": {
+                channel: {f"p{percentile}": [] for percentile in percentiles}
+                for channel in channels
+            },
+        }
+
+    positions = [
+        np.fromiter(
+            ((sample["timestamp"] - start) / step for sample in samples),
+            dtype=float,
+            count=len(samples),
+        )
+        for start, samples in cooks
+    ]
+    points = int(max(position[-1] for position in positions)) + 1
+    offsets = np.arange(len(cooks), dtype=float) * (points + 1)
+    axis = np.concatenate(
+        [
+            position + offset
+            for position, offset in zip(positions, offsets, strict=True)
+        ]
+    )
+    first = np.array([position[0] for position in positions])[:, None]
+    last = np.array([position[-1] for position in positions])[:, None]
+    grid = np.arange(points, dtype=float)
+    inside = (grid >= first) & (grid <= last)
+    targets = grid + offsets[:, None]
+
+    bands: dict[str, dict[str, list[float | None]]] = {}
+    for channel in channels:
+        values = np.fromiter(
+            (sample[channel] for _, samples in cooks for sample in samples),
+            dtype=float,
+            count=len(axis),
+        )
+        curves = np.where(inside, np.interp(targets, axis, values), np.nan)
+        with warnings.catch_warnings():
+            # Grid points no cook covers yield NaN, reported as None.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            levels = np.nanpercentile(curves, percentiles, axis=0)
+        bands[channel] = {
+            f"p{percentile}": _to_json_list(level)
+            for percentile, level in zip(percentiles, levels, strict=True)
+        }
+
+    return {
+        "cook_count": len(cooks),
+        "count": np.count_nonzero(inside, axis=0).tolist(),
+        "channels": bands,
+    }
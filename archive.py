@@ -0,0 +1,416 @@
+"""Storage backends for the sampled detail of completed Pit Boss cooks."""
+
+import asyncio
+from collections import Counter
+import contextlib
+from datetime import datetime
+import hashlib
+import mmap
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util.json import json_loads
+
+from .cache import LruCache
+from .codec import (
+    ROLLUP_DELTA_COLUMNS,
+    ROLLUP_PLAIN_COLUMNS,
+    SAMPLE_DELTA_COLUMNS,
+    SAMPLE_PLAIN_COLUMNS,
+    encode_columns,
+)
+from .const import (
+    COOK_ARCHIVE_COMPACTION_MIN_BYTES,
+    COOK_ARCHIVE_INDEX_STORAGE_VERSION,
+    COOK_DETAIL_STORAGE_VERSION,
+    COOK_DETAIL_STORE_CACHE_SIZE,
+    DOMAIN,
+)
+
+type StoredCookDetail = dict[str, Any]
+
+
+def cook_detail_key(entry_id: str, cook_id: str) -> str:
+    """Return the storage key of the per-cook detail file for a cook."""
+
+    cook_hash = hashlib.sha1(cook_id.encode(), usedforsecurity=False).hexdigest()
+    return f"{DOMAIN}_{entry_id}_cook_detail_{cook_hash}"
+
+
+class PitbossCookDetailStore(Store[StoredCookDetail]):
+    """Store for the sampled detail of one completed Pit Boss cook."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: StoredCookDetail,
+    ) -> StoredCookDetail:
+        """Migrate row-per-sample detail to the columnar format."""
+
+        if old_major_version == 1:
+            samples = [
+                {**sample, "timestamp": datetime.fromisoformat(sample["timestamp"])}
+                for sample in old_data.get("samples", [])
+            ]
+            rollups = [
+                {**rollup, "timestamp": datetime.fromisoformat(rollup["timestamp"])}
+                for rollup in old_data.get("rollups", [])
+            ]
+            return {
+                **old_data,
+                "samples": encode_columns(
+                    samples, SAMPLE_DELTA_COLUMNS, SAMPLE_PLAIN_COLUMNS
+                ),
+                "rollups": encode_columns(
+                    rollups, ROLLUP_DELTA_COLUMNS, ROLLUP_PLAIN_COLUMNS
+                ),
+            }
+
+        raise NotImplementedError
+
+
+class CookDetailArchive:
+    """Default backend that keeps each cook's detail in its own ``Store`` file."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the archive for one config entry."""
+
+        self.hass = hass
+        self.entry_id = entry_id
+        self._stores: LruCache[str, Store[StoredCookDetail]] = LruCache(
+            COOK_DETAIL_STORE_CACHE_SIZE
+        )
+
+    async def async_load(self, cook_id: str) -> StoredCookDetail | None:
+        """Return the stored detail for a cook, if any."""
+
+        return await self._get_store(cook_id).async_load()
+
+    async def async_save(self, cook_id: str, detail: StoredCookDetail) -> None:
+        """Persist the stored detail for a cook."""
+
+        await self._get_store(cook_id).async_save(detail)
+
+    async def async_remove(self, cook_id: str) -> None:
+        """Delete the stored detail for a cook."""
+
+        await self._get_store(cook_id).async_remove()
+        self._stores.pop(cook_id)
+
+    async def async_remove_many(self, cook_ids: list[str]) -> None:
+        """Delete the stored detail for several cooks concurrently."""
+
+        await asyncio.gather(*map(self.async_remove, cook_ids))
+
+    async def async_detail_sizes(self, cook_ids: list[str]) -> dict[str, int]:
+        """Return the size in bytes of each cook's detail file that exists."""
+
+        return await self.hass.async_add_executor_job(
+            self._file_sizes,
+            {
+                cook_id: self.hass.config.path(
+                    STORAGE_DIR, cook_detail_key(self.entry_id, cook_id)
+                )
+                for cook_id in cook_ids
+            },
+        )
+
+    def store_cache_stats(self) -> dict[str, Any]:
+        """Return size and hit statistics for the cached store handles."""
+
+        return self._stores.as_dict()
+
+    def _get_store(self, cook_id: str) -> Store[StoredCookDetail]:
+        """Return the per-cook detail store for a completed cook.
+
+        Only the most recently used handles are kept; an evicted one is simply
+        recreated, since every save is written through before it returns.
+        """
+
+        if (store := self._stores.get(cook_id)) is None:
+            store = PitbossCookDetailStore(
+                self.hass,
+                COOK_DETAIL_STORAGE_VERSION,
+                cook_detail_key(self.entry_id, cook_id),
+            )
+            self._stores.put(cook_id, store)
+
+        return store
+
+    @staticmethod
+    def _file_sizes(paths: dict[str, str]) -> dict[str, int]:
+        """Return the size of each file that exists, keyed like ``paths``."""
+
+        sizes: dict[str, int] = {}
+        for key, path in paths.items():
+            with contextlib.suppress(FileNotFoundError):
+                sizes[key] = os.path.getsize(path)
+        return sizes
+
+
+class PackedCookDetailArchive(CookDetailArchive):
+    """Backend that appends every cook's detail to one data file per entry.
+
+    A small ``Store`` maps each cook to the offset and length of its record.
+    Deleting a cook only drops it from that map; the space is reclaimed by a
+    background compaction that copies live records to a new file generation.
+    Detail still held in per-cook files moves into the packed file on first read.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the packed archive for one config entry."""
+
+        super().__init__(hass, entry_id)
+        self._index_store: Store[dict[str, Any]] = Store(
+            hass,
+            COOK_ARCHIVE_INDEX_STORAGE_VERSION,
+            f"{DOMAIN}_{entry_id}_cook_archive_index",
+        )
+        self._lock = asyncio.Lock()
+        self._loaded = False
+        self._generation = 0
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._dead_bytes = 0
+        self._pending: dict[str, StoredCookDetail] = {}
+        self._readers: Counter[str] = Counter()
+        self._retired_paths: set[str] = set()
+
+    @property
+    def path(self) -> str:
+        """Return the path of the current data file."""
+
+        return self._data_path(self._generation)
+
+    async def async_load(self, cook_id: str) -> StoredCookDetail | None:
+        """Return the stored detail for a cook, read through ``mmap``.
+
+        The data file and the record's location are taken together under the
+        lock, and a compacted file is kept until the reads of it finish.
+        """
+
+        if (detail := self._pending.get(cook_id)) is not None:
+            return detail
+
+        async with self._lock:
+            await self._async_load_index()
+            path = self.path
+            if (location := self._offsets.get(cook_id)) is not None:
+                self._readers[path] += 1
+
+        if location is None:
+            if (detail := await super().async_load(cook_id)) is not None:
+                await self.async_save(cook_id, detail)
+                await super().async_remove(cook_id)
+            return detail
+
+        try:
+            return await self.hass.async_add_executor_job(
+                self._read_record, path, *location
+            )
+        finally:
+            self._readers[path] -= 1
+            if not self._readers[path]:
+                del self._readers[path]
+                if path in self._retired_paths:
+                    self._retired_paths.discard(path)
+                    await self.hass.async_add_executor_job(self._remove_file, path)
+
+    async def async_save(self, cook_id: str, detail: StoredCookDetail) -> None:
+        """Append the stored detail for a cook to the data file."""
+
+        self._pending[cook_id] = detail
+        try:
+            async with self._lock:
+                await self._async_load_index()
+                payload = json_bytes(detail)
+                offset = await self.hass.async_add_executor_job(
+                    self._append_record, self.path, payload
+                )
+                if (previous := self._offsets.get(cook_id)) is not None:
+                    self._dead_bytes += previous[1]
+                self._offsets[cook_id] = (offset, len(payload))
+                await self._async_save_index()
+        finally:
+            self._pending.pop(cook_id, None)
+
+    async def async_remove(self, cook_id: str) -> None:
+        """Drop a cook from the offset index and compact once enough is dead."""
+
+        await self.async_remove_many([cook_id])
+
+    async def async_remove_many(self, cook_ids: list[str]) -> None:
+        """Drop several cooks from the offset index with one index write."""
+
+        remove_file = super().async_remove
+        async with self._lock:
+            await self._async_load_index()
+            unpacked: list[str] = []
+            for cook_id in cook_ids:
+                if (location := self._offsets.pop(cook_id, None)) is None:
+                    unpacked.append(cook_id)
+                else:
+                    self._dead_bytes += location[1]
+            await asyncio.gather(*map(remove_file, unpacked))
+            if len(unpacked) == len(cook_ids):
+                return
+            await self._async_save_index()
+
+        live_bytes = sum(length for _offset, length in self._offsets.values())
+        if self._dead_bytes >= max(COOK_ARCHIVE_COMPACTION_MIN_BYTES, live_bytes):
+            self.hass.async_create_background_task(
+                self.async_compact(), f"{DOMAIN} cook archive compaction"
+            )
+
+    async def async_detail_sizes(self, cook_ids: list[str]) -> dict[str, int]:
+        """Return each cook's record length, or its file size if not yet packed."""
+
+        async with self._lock:
+            await self._async_load_index()
+            sizes = {
+                cook_id: self._offsets[cook_id][1]
+                for cook_id in cook_ids
+                if cook_id in self._offsets
+            }
+        if unpacked := [cook_id for cook_id in cook_ids if cook_id not in sizes]:
+            sizes |= await super().async_detail_sizes(unpacked)
+        return sizes
+
+    async def async_cook_ids(self) -> set[str]:
+        """Return the ids of the cooks held in the data file."""
+
+        await self._async_load_index()
+        return set(self._offsets)
+
+    async def async_clear(self) -> None:
+        """Delete the data file and the offset index."""
+
+        async with self._lock:
+            await self._async_load_index()
+            if self._readers[self.path]:
+                self._retired_paths.add(self.path)
+            else:
+                await self.hass.async_add_executor_job(self._remove_file, self.path)
+            await self._index_store.async_remove()
+            self._generation = 0
+            self._offsets = {}
+            self._dead_bytes = 0
+
+    async def async_compact(self) -> None:
+        """Copy live records to a new data file and drop the old one."""
+
+        async with self._lock:
+            await self._async_load_index()
+            if not self._dead_bytes:
+                return
+
+            old_path = self.path
+            self._offsets = await self.hass.async_add_executor_job(
+                self._rewrite_records,
+                old_path,
+                self._data_path(self._generation + 1),
+                dict(self._offsets),
+            )
+            self._generation += 1
+            self._dead_bytes = 0
+            # The old file is only removed once the index points past it and
+            # no read of it is still in flight.
+            await self._async_save_index()
+            if self._readers[old_path]:
+                self._retired_paths.add(old_path)
+            else:
+                await self.hass.async_add_executor_job(self._remove_file, old_path)
+
+    def _data_path(self, generation: int) -> str:
+        """Return the data file path for one compaction generation."""
+
+        return self.hass.config.path(
+            STORAGE_DIR, f"{DOMAIN}_{self.entry_id}_cook_archive.{generation}.pack"
+        )
+
+    async def _async_load_index(self) -> None:
+        """Load the offset index on first use."""
+
+        if self._loaded:
+            return
+
+        stored_index = await self._index_store.async_load() or {}
+        self._generation = stored_index.get("generation", 0)
+        self._offsets = {
+            cook_id: (offset, length)
+            for cook_id, (offset, length) in stored_index.get("cooks", {}).items()
+        }
+        self._dead_bytes = stored_index.get("dead_bytes", 0)
+        self._loaded = True
+
+    async def _async_save_index(self) -> None:
+        """Persist the offset index."""
+
+        await self._index_store.async_save(
+            {
+                "generation": self._generation,
+                "cooks": {
+                    cook_id: [offset, length]
+                    for cook_id, (offset, length) in self._offsets.items()
+                },
+                "dead_bytes": self._dead_bytes,
+            }
+        )
+
+    @staticmethod
+    def _read_record(path: str, offset: int, length: int) -> StoredCookDetail:
+        """Decode one record straight from a memory map of the data file."""
+
+        with (
+            open(path, "rb") as data_file,
+            mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            record = memoryview(mapped)[offset : offset + length]
+            try:
+                return json_loads(record)
+            finally:
+                record.release()
+
+    @staticmethod
+    def _append_record(path: str, payload: bytes) -> int:
+        """Append one record to the data file and return its offset."""
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "ab") as data_file:
+            offset = data_file.seek(0, os.SEEK_END)
+            data_file.write(payload)
+            data_file.flush()
+            os.fsync(data_file.fileno())
+        return offset
+
+    @staticmethod
+    def _rewrite_records(
+        old_path: str, new_path: str, offsets: dict[str, tuple[int, int]]
+    ) -> dict[str, tuple[int, int]]:
+        """Copy live records into a new data file and return their new offsets."""
+
+        new_offsets: dict[str, tuple[int, int]] = {}
+        with open(new_path, "wb") as new_file:
+            if offsets:
+                with (
+                    open(old_path, "rb") as old_file,
+                    mmap.mmap(old_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                ):
+                    for cook_id, (offset, length) in sorted(
+                        offsets.items(), key=lambda item: item[1][0]
+                    ):
+                        new_offsets[cook_id] = (new_file.tell(), length)
+                        new_file.write(mapped[offset : offset + length])
+            new_file.flush()
+            os.fsync(new_file.fileno())
+        return new_offsets
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        """Delete a data file that is no longer referenced."""
+
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
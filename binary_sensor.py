@@ -77,6 +77,7 @@ async def async_setup_entry(
                 for description in SENSOR_TYPES
             ),
             PitbossCookActiveBinarySensor(coordinator, device_id),
+            PitbossFlameOutBinarySensor(coordinator, device_id),
             PitbossProbeStallBinarySensor(coordinator, device_id, "P1ActTemp"),
             PitbossProbeStallBinarySensor(coordinator, device_id, "P2ActTemp"),
             PitbossProbeDoneBinarySensor(
@@ -170,6 +171,29 @@ class PitbossCookActiveBinarySensor(PitbossEntity, BinarySensorEntity):
         return self.coordinator.is_cook_active()
 
 
+class PitbossFlameOutBinarySensor(PitbossEntity, BinarySensorEntity):
+    """Warn when the grill appears to be losing its fire."""
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_icon = "mdi:fire-alert"
+
+    def __init__(self, coordinator, device_id: str) -> None:
+        """Initialize the flame-out warning sensor."""
+        super().__init__(
+            coordinator,
+            device_id,
+            BinarySensorEntityDescription(
+                key="flame_out",
+                translation_key="flame_out",
+            ),
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if a flame-out has been confirmed."""
+        return self.coordinator.is_flame_out_detected()
+
+
 class PitbossProbeDoneBinarySensor(PitbossEntity, BinarySensorEntity):
     """Indicate when a probe has reached its target temperature."""
 
@@ -0,0 +1,65 @@
+"""Size-bounded caches used by the Pit Boss cook archive."""
+
+from collections import OrderedDict
+from typing import Any
+
+
+class LruCache[_K, _V]:
+    """Mapping that evicts its least recently used entry once full."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize an empty cache holding at most ``max_size`` entries."""
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[_K, _V] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a key is cached, without counting a lookup."""
+
+        return key in self._entries
+
+    def get(self, key: _K) -> _V | None:
+        """Return a cached value and mark it as most recently used."""
+
+        if (value := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Cache a value, evicting the least recently used entry if needed."""
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: _K) -> _V | None:
+        """Drop a cached value and return it, if it was cached."""
+
+        return self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+
+        self._entries.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the size and hit statistics of the cache."""
+
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,132 @@
+"""Merged listing of the completed cooks of every Pit Boss config entry."""
+
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import replace
+from heapq import merge
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import COOK_SORT_START, DOMAIN
+from .index import CookIndex, CookIndexEntry, CookQuery, key_range
+
+type CookSerializer = Callable[[CookIndexEntry], dict[str, Any]]
+type CatalogKey = tuple[int, str, str]
+
+
+class CookCatalog:
+    """Completed cooks of every loaded config entry in one start order.
+
+    Each coordinator registers its in-memory index once loaded. The merged
+    order is built with a k-way merge of the per-entry start orders and then
+    kept current as cooks are archived or deleted, so listing across grills
+    never re-sorts. Keys are ``(start, cook id, entry id)``; annotation edits
+    change the shared index entries in place and need no update here.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty catalog."""
+
+        self._sources: dict[str, tuple[CookIndex, CookSerializer]] = {}
+        self._by_start: list[CatalogKey] = []
+
+    def __contains__(self, entry_id: object) -> bool:
+        """Return whether a config entry's cooks are held in the catalog."""
+
+        return entry_id in self._sources
+
+    def __len__(self) -> int:
+        """Return the number of cooks in the catalog."""
+
+        return len(self._by_start)
+
+    def register(
+        self, entry_id: str, index: CookIndex, serialize: CookSerializer
+    ) -> None:
+        """Merge a config entry's loaded cook index into the catalog."""
+
+        self.unregister(entry_id)
+        self._sources[entry_id] = (index, serialize)
+        self._by_start = list(
+            merge(
+                self._by_start,
+                ((start, cook_id, entry_id) for start, cook_id in index.start_keys),
+            )
+        )
+
+    def unregister(self, entry_id: str) -> None:
+        """Drop a config entry's cooks from the catalog."""
+
+        if self._sources.pop(entry_id, None) is not None:
+            self._by_start = [key for key in self._by_start if key[2] != entry_id]
+
+    def add(self, entry_id: str, entry: CookIndexEntry) -> None:
+        """Place a newly archived cook of a registered entry in the order."""
+
+        if entry_id not in self._sources:
+            return
+
+        key = (entry.start, entry.id, entry_id)
+        position = bisect_left(self._by_start, key)
+        if position == len(self._by_start) or self._by_start[position] != key:
+            self._by_start.insert(position, key)
+
+    def remove(self, entry_id: str, entry: CookIndexEntry) -> None:
+        """Drop a deleted cook from the order."""
+
+        key = (entry.start, entry.id, entry_id)
+        position = bisect_left(self._by_start, key)
+        if position < len(self._by_start) and self._by_start[position] == key:
+            del self._by_start[position]
+
+    @staticmethod
+    def covers(query: CookQuery) -> bool:
+        """Return whether the merged start order can answer a query.
+
+        Tag filters and duration ordering are answered faster from each
+        entry's own indexes.
+        """
+
+        return query.sort == COOK_SORT_START and not query.tags
+
+    def query(self, query: CookQuery) -> tuple[list[dict[str, Any]], str | None]:
+        """Return one page of serialized cooks across entries and its cursor."""
+
+        low, high = key_range(self._by_start, query)
+        # Catalog keys end with the entry id, so the range alone applies a
+        # cursor that carries one; the per-cook check only needs the filters.
+        filters = query
+        if query.cursor is not None and len(query.cursor) == 3:
+            filters = replace(query, cursor=None)
+        positions = (
+            range(high - 1, low - 1, -1) if query.descending else range(low, high)
+        )
+        wanted = None if query.limit is None else query.limit + 1
+        matched: list[tuple[str, CookIndexEntry]] = []
+        for position in positions:
+            _, cook_id, entry_id = self._by_start[position]
+            entry = self._sources[entry_id][0].get(cook_id)
+            if entry is not None and filters.matches(entry):
+                matched.append((entry_id, entry))
+                if len(matched) == wanted:
+                    break
+
+        entries, next_cursor = query.page([entry for _, entry in matched])
+        return [
+            self._sources[entry_id][1](entry)
+            for entry_id, entry in matched[: len(entries)]
+        ], next_cursor
+
+
+DATA_COOK_CATALOG: HassKey[CookCatalog] = HassKey(f"{DOMAIN}_cook_catalog")
+
+
+@callback
+def async_get_cook_catalog(hass: HomeAssistant) -> CookCatalog:
+    """Return the catalog shared by every Pit Boss config entry."""
+
+    if (catalog := hass.data.get(DATA_COOK_CATALOG)) is None:
+        catalog = hass.data[DATA_COOK_CATALOG] = CookCatalog()
+    return catalog
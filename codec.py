@@ -0,0 +1,132 @@
+"""Columnar, delta-encoded storage format for Pit Boss cook traces."""
+
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate
+from typing import Any
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+ROLLUP_CHANNELS = ("grill_actual", "probe1_actual", "probe2_actual")
+ROLLUP_DELTA_COLUMNS = tuple(
+    f"{channel}_{stat}" for channel in ROLLUP_CHANNELS for stat in ("min", "max")
+)
+ROLLUP_PLAIN_COLUMNS = ("count", *(f"{channel}_mean" for channel in ROLLUP_CHANNELS))
+SAMPLE_DELTA_COLUMNS = ("grill_actual", "grill_set", "probe1_actual", "probe2_actual")
+SAMPLE_PLAIN_COLUMNS = ("probe1_stalled",)
+SAMPLE_CHANNELS = (*SAMPLE_DELTA_COLUMNS, *SAMPLE_PLAIN_COLUMNS)
+
+type Columns = dict[str, list[Any]]
+type Row = dict[str, Any]
+
+
+def to_epoch_microseconds(timestamp: datetime) -> int:
+    """Return a timestamp as integer microseconds since the Unix epoch."""
+
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_microseconds(microseconds: int) -> datetime:
+    """Return the UTC timestamp for integer microseconds since the Unix epoch."""
+
+    return _EPOCH + timedelta(microseconds=microseconds)
+
+
+def _delta_encode(values: Iterable[int]) -> list[int]:
+    """Return each value as its difference from the previous one."""
+
+    deltas: list[int] = []
+    previous = 0
+    for value in values:
+        deltas.append(value - previous)
+        previous = value
+    return deltas
+
+
+def encode_columns(
+    rows: Sequence[Row],
+    delta_columns: Sequence[str],
+    plain_columns: Sequence[str] = (),
+) -> Columns:
+    """Encode timestamped rows as one array per column.
+
+    Timestamps become epoch microseconds and, like the integer columns in
+    ``delta_columns``, are stored as differences from the previous row; the
+    first entry is therefore the absolute starting value.
+    """
+
+    columns: Columns = {
+        "timestamp": _delta_encode(
+            to_epoch_microseconds(row["timestamp"]) for row in rows
+        )
+    }
+    for column in delta_columns:
+        columns[column] = _delta_encode(row[column] for row in rows)
+    for column in plain_columns:
+        columns[column] = [row.get(column) for row in rows]
+    return columns
+
+
+def encode_epoch_rows(
+    rows: Sequence[Sequence[Any]],
+    delta_columns: Sequence[str],
+    plain_columns: Sequence[str] = (),
+) -> Columns:
+    """Encode value tuples the way ``encode_columns`` encodes rows.
+
+    Each tuple holds the timestamp in epoch microseconds followed by the
+    ``delta_columns`` and then the ``plain_columns`` values, as read from a
+    database, so no timestamp is turned into a datetime and back.
+    """
+
+    names = ("timestamp", *delta_columns, *plain_columns)
+    values = list(zip(*rows, strict=True)) or [()] * len(names)
+    columns: Columns = {}
+    for position, (name, column) in enumerate(zip(names, values, strict=True)):
+        columns[name] = (
+            _delta_encode(column) if position <= len(delta_columns) else list(column)
+        )
+    return columns
+
+
+def to_offset_columns(
+    rows: Sequence[Row], columns: Sequence[str], base: int
+) -> Columns:
+    """Return rows as one plain array per column for display.
+
+    Only ``columns`` are built. Timestamps become integer milliseconds after
+    ``base``, itself in epoch milliseconds, under ``offsets``.
+    """
+
+    projected: Columns = {
+        "offsets": [
+            to_epoch_microseconds(row["timestamp"]) // 1000 - base for row in rows
+        ]
+    }
+    for column in columns:
+        projected[column] = [row.get(column) for row in rows]
+    return projected
+
+
+def decode_columns(
+    columns: Columns,
+    delta_columns: Sequence[str],
+    plain_columns: Sequence[str] = (),
+) -> list[Row]:
+    """Decode columns written by ``encode_columns`` back into rows."""
+
+    timestamps = [
+        from_epoch_microseconds(microseconds)
+        for microseconds in accumulate(columns.get("timestamp", []))
+    ]
+    names = ("timestamp", *delta_columns, *plain_columns)
+    values = [
+        timestamps,
+        *(list(accumulate(columns[column])) for column in delta_columns),
+        *(
+            columns.get(column, [None] * len(timestamps))
+            for column in plain_columns
+        ),
+    ]
+    return [dict(zip(names, row, strict=True)) for row in zip(*values, strict=True)]
@@ -22,7 +22,20 @@ from homeassistant.helpers.selector import (
 )
 
 from .const import (
+    ARCHIVE_BACKEND_PACKED,
+    ARCHIVE_BACKEND_SQLITE,
+    ARCHIVE_BACKEND_STORE,
+    CONF_ARCHIVE_BACKEND,
+    CONF_CAPTURE_POLL_LIMIT,
+    CONF_DETAIL_RETENTION_COOKS,
+    CONF_DETAIL_RETENTION_DAYS,
+    CONF_DROP_UNANNOTATED_COOKS,
     DATA_DEVICE_INFO,
+    DEFAULT_ARCHIVE_BACKEND,
+    DEFAULT_CAPTURE_POLL_LIMIT,
+    DEFAULT_DETAIL_RETENTION_COOKS,
+    DEFAULT_DETAIL_RETENTION_DAYS,
+    DEFAULT_DROP_UNANNOTATED_COOKS,
     DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
     DISCOVERY_PARALLELISM,
@@ -378,6 +391,21 @@ class PitbossOptionsFlow(config_entries.OptionsFlow):
         current_interval = self.config_entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
+        current_capture_limit = self.config_entry.options.get(
+            CONF_CAPTURE_POLL_LIMIT, DEFAULT_CAPTURE_POLL_LIMIT
+        )
+        current_archive_backend = self.config_entry.options.get(
+            CONF_ARCHIVE_BACKEND, DEFAULT_ARCHIVE_BACKEND
+        )
+        current_retention_days = self.config_entry.options.get(
+            CONF_DETAIL_RETENTION_DAYS, DEFAULT_DETAIL_RETENTION_DAYS
+        )
+        current_retention_cooks = self.config_entry.options.get(
+            CONF_DETAIL_RETENTION_COOKS, DEFAULT_DETAIL_RETENTION_COOKS
+        )
+        current_drop_unannotated = self.config_entry.options.get(
+            CONF_DROP_UNANNOTATED_COOKS, DEFAULT_DROP_UNANNOTATED_COOKS
+        )
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
@@ -385,6 +413,31 @@ class PitbossOptionsFlow(config_entries.OptionsFlow):
                     vol.Required(CONF_SCAN_INTERVAL, default=current_interval): vol.All(
                         int, vol.Range(min=5, max=300)
                     ),
+                    vol.Required(
+                        CONF_CAPTURE_POLL_LIMIT, default=current_capture_limit
+                    ): vol.All(int, vol.Range(min=240, max=40320)),
+                    vol.Required(
+                        CONF_ARCHIVE_BACKEND, default=current_archive_backend
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[
+                                ARCHIVE_BACKEND_STORE,
+                                ARCHIVE_BACKEND_PACKED,
+                                ARCHIVE_BACKEND_SQLITE,
+                            ],
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_ARCHIVE_BACKEND,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_DETAIL_RETENTION_DAYS, default=current_retention_days
+                    ): vol.All(int, vol.Range(min=0, max=3650)),
+                    vol.Required(
+                        CONF_DETAIL_RETENTION_COOKS, default=current_retention_cooks
+                    ): vol.All(int, vol.Range(min=0, max=10000)),
+                    vol.Required(
+                        CONF_DROP_UNANNOTATED_COOKS, default=current_drop_unannotated
+                    ): bool,
                 }
             ),
         )
@@ -6,6 +6,12 @@ from homeassistant.const import Platform
 
 DOMAIN = "pitboss"
 
+CONF_ARCHIVE_BACKEND = "archive_backend"
+CONF_CAPTURE_POLL_LIMIT = "capture_poll_limit"
+CONF_DETAIL_RETENTION_COOKS = "detail_retention_cooks"
+CONF_DETAIL_RETENTION_DAYS = "detail_retention_days"
+CONF_DROP_UNANNOTATED_COOKS = "drop_unannotated_cooks"
+
 DATA_DEVICE_INFO = "device_info"
 
 INFO_APP = "app"
@@ -26,18 +32,60 @@ INFO_WIFI_SSID = "wifi_ssid"
 INFO_WIFI_STA_IP = "wifi_sta_ip"
 INFO_WIFI_STATUS = "wifi_status"
 
+ARCHIVE_BACKEND_PACKED = "packed"
+ARCHIVE_BACKEND_SQLITE = "sqlite"
+ARCHIVE_BACKEND_STORE = "store"
+DEFAULT_ARCHIVE_BACKEND = ARCHIVE_BACKEND_STORE
+DEFAULT_CAPTURE_POLL_LIMIT = 5760  # 24 hours at the default scan interval
+DEFAULT_DETAIL_RETENTION_COOKS = 0  # 0 keeps full detail regardless of count
+DEFAULT_DETAIL_RETENTION_DAYS = 0  # 0 keeps full detail regardless of age
+DEFAULT_DROP_UNANNOTATED_COOKS = False
 DEFAULT_NAME = "Pit Boss"
 DEFAULT_SCAN_INTERVAL = 15  # seconds
 DISCOVERY_PARALLELISM = 32
 DISCOVERY_TIMEOUT_SECONDS = 1
 SUPPORTED_MODEL_IDS = {"PBL-0F78550"}
+COOK_AGGREGATE_CACHE_SIZE = 8
+COOK_AGGREGATE_MAX_COOKS = 200
+COOK_AGGREGATE_PERCENTILES = (10, 25, 50, 75, 90)
+COOK_ARCHIVE_CHANGELOG_SIZE = 500
+COOK_ARCHIVE_COMPACTION_MIN_BYTES = 1024 * 1024
+COOK_ARCHIVE_INDEX_STORAGE_VERSION = 1
+COOK_BATCH_MAX_COOKS = 20
+COOK_BATCH_PARALLELISM = 4
 COOK_CONFIRMATION_WINDOW = timedelta(hours=1)
+COOK_DETAIL_CACHE_SIZE = 8
+COOK_DETAIL_STORE_CACHE_SIZE = 32
 COOK_END_GRACE_PERIOD = timedelta(minutes=30)
+COOK_EXECUTOR_ROW_THRESHOLD = 1000
+COOK_FORMAT_COLUMNAR = "columnar"
+COOK_FORMAT_ROWS = "rows"
+COOK_JOURNAL_SAVE_DELAY = 5
+COOK_LIST_MAX_LIMIT = 500
+COOK_RETENTION_BATCH_SIZE = 25
+COOK_RETENTION_INTERVAL = timedelta(hours=6)
+COOK_RETENTION_SAMPLE_INTERVAL = timedelta(minutes=30)
 COOK_SAMPLE_INTERVAL = timedelta(minutes=5)
-COOK_STORAGE_SAVE_DELAY = 30
-COOK_STORAGE_VERSION = 2
-COOK_DETAIL_STORAGE_VERSION = 1
+COOK_SORT_DURATION = "duration"
+COOK_SORT_START = "start"
+COOK_STORAGE_SCAN_BATCH_DELAY = 1  # seconds between removal batches
+COOK_STORAGE_SCAN_BATCH_SIZE = 20
+COOK_STORAGE_SCAN_INTERVAL = timedelta(hours=24)
+COOK_SEGMENT_STORAGE_VERSION = 2
+COOK_STORAGE_VERSION = 3
+COOK_DETAIL_STORAGE_VERSION = 2
 DONE_CONFIRMATION_WINDOW = timedelta(minutes=5)
+FLAME_OUT_CONFIRMATION_WINDOW = timedelta(minutes=2)
+FLAME_OUT_MINIMUM_DEFICIT_C = 8
+FLAME_OUT_MINIMUM_DEFICIT_F = 15
+FLAME_OUT_POLL_INTERVAL = timedelta(seconds=5)
+FLAME_OUT_TREND_THRESHOLD_C = 33.0
+FLAME_OUT_TREND_THRESHOLD_F = 60.0
+FLAME_OUT_TREND_WINDOW = timedelta(minutes=10)
+PREHEAT_TOLERANCE_C = 6
+PREHEAT_TOLERANCE_F = 10
+PROBE_ETA_MINIMUM_WINDOW = timedelta(minutes=10)
+PROBE_ETA_TOLERANCE = timedelta(minutes=5)
 STALL_CONFIRMATION_WINDOW = timedelta(minutes=20)
 STALL_MINIMUM_TEMPERATURE_C = 60
 STALL_MINIMUM_TEMPERATURE_F = 140
@@ -1,36 +1,75 @@
 """Data update coordinator for the Pitboss integration."""
 
+from array import array
 import asyncio
+from bisect import bisect_left, bisect_right
 from collections import deque
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from dataclasses import replace
 from datetime import datetime, timedelta
-import hashlib
 import logging
+from operator import itemgetter
 from typing import Any
 
 from aiohttp import ClientError
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     TimestampDataUpdateCoordinator,
     UpdateFailed,
 )
-from homeassistant.util.dt import utcnow
+from homeassistant.util.dt import utc_from_timestamp, utcnow
 
 from .const import (
+    ARCHIVE_BACKEND_PACKED,
+    ARCHIVE_BACKEND_SQLITE,
+    CONF_ARCHIVE_BACKEND,
+    CONF_CAPTURE_POLL_LIMIT,
+    CONF_DETAIL_RETENTION_COOKS,
+    CONF_DETAIL_RETENTION_DAYS,
+    CONF_DROP_UNANNOTATED_COOKS,
+    COOK_AGGREGATE_CACHE_SIZE,
+    COOK_AGGREGATE_MAX_COOKS,
+    COOK_AGGREGATE_PERCENTILES,
+    COOK_ARCHIVE_CHANGELOG_SIZE,
+    COOK_BATCH_PARALLELISM,
     COOK_CONFIRMATION_WINDOW,
-    COOK_DETAIL_STORAGE_VERSION,
+    COOK_DETAIL_CACHE_SIZE,
     COOK_END_GRACE_PERIOD,
+    COOK_EXECUTOR_ROW_THRESHOLD,
+    COOK_FORMAT_COLUMNAR,
+    COOK_FORMAT_ROWS,
+    COOK_JOURNAL_SAVE_DELAY,
+    COOK_RETENTION_BATCH_SIZE,
+    COOK_RETENTION_SAMPLE_INTERVAL,
     COOK_SAMPLE_INTERVAL,
-    COOK_STORAGE_SAVE_DELAY,
+    COOK_SEGMENT_STORAGE_VERSION,
+    COOK_SORT_START,
     COOK_STORAGE_VERSION,
+    DEFAULT_ARCHIVE_BACKEND,
+    DEFAULT_CAPTURE_POLL_LIMIT,
+    DEFAULT_DETAIL_RETENTION_COOKS,
+    DEFAULT_DETAIL_RETENTION_DAYS,
+    DEFAULT_DROP_UNANNOTATED_COOKS,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     DONE_CONFIRMATION_WINDOW,
+    FLAME_OUT_CONFIRMATION_WINDOW,
+    FLAME_OUT_MINIMUM_DEFICIT_C,
+    FLAME_OUT_MINIMUM_DEFICIT_F,
+    FLAME_OUT_POLL_INTERVAL,
+    FLAME_OUT_TREND_THRESHOLD_C,
+    FLAME_OUT_TREND_THRESHOLD_F,
+    FLAME_OUT_TREND_WINDOW,
+    PREHEAT_TOLERANCE_C,
+    PREHEAT_TOLERANCE_F,
+    PROBE_ETA_MINIMUM_WINDOW,
+    PROBE_ETA_TOLERANCE,
     STALL_CONFIRMATION_WINDOW,
     STALL_MINIMUM_TEMPERATURE_C,
     STALL_MINIMUM_TEMPERATURE_F,
@@ -38,15 +77,62 @@ from .const import (
     TEMPERATURE_TREND_INTERVAL,
     TEMPERATURE_TREND_WINDOW,
 )
+from .aggregate import aggregate_traces
+from .archive import CookDetailArchive, PackedCookDetailArchive, cook_detail_key
+from .cache import LruCache
+from .catalog import async_get_cook_catalog
+from .codec import (
+    ROLLUP_CHANNELS,
+    ROLLUP_DELTA_COLUMNS,
+    ROLLUP_PLAIN_COLUMNS,
+    SAMPLE_DELTA_COLUMNS,
+    SAMPLE_CHANNELS,
+    SAMPLE_PLAIN_COLUMNS,
+    decode_columns,
+    encode_columns,
+    from_epoch_microseconds,
+    to_epoch_microseconds,
+    to_offset_columns,
+)
+from .database import SqliteCookArchive
+from .downsample import downsample_rollups, downsample_samples, resample_samples
+from .index import CookIndex, CookIndexEntry, CookQuery
+from .integrity import async_scan_cook_storage
+from .journal import CookJournal, JournalRecord
 from .pitboss_api import PitbossApi
 
 _LOGGER = logging.getLogger(__name__)
 
+_PROBE_TARGET_KEYS = {
+    "P1SetTemp": "P1ActTemp",
+    "P2SetTemp": "P2ActTemp",
+}
+_TREND_WINDOW_REBASE_AFTER = TEMPERATURE_TREND_WINDOW * 4
+_CAPTURED_STATE_KEYS = {
+    "FanOn": "fan",
+    "IgniterOn": "igniter",
+    "MotorOn": "auger",
+    "LightOn": "light",
+    "Priming": "prime",
+}
+
 type CookAnnotations = dict[str, Any]
 type CookDetail = dict[str, Any]
 type CookError = dict[str, Any]
+type CookPhase = dict[str, Any]
+type CookRollup = dict[str, Any]
 type CookSample = dict[str, Any]
 type CookSession = dict[str, Any]
+type CookStateTransitions = dict[str, list[tuple[datetime, bool]]]
+
+
+def _put_journaled_value(values: list[Any], index: int, value: Any) -> None:
+    """Replace or append one journaled list entry by its position."""
+
+    if index < len(values):
+        values[index] = value
+    else:
+        values.append(value)
 
 
 def _default_cook_annotations() -> CookAnnotations:
@@ -64,6 +150,7 @@ def _default_cook_summary_metrics() -> dict[str, Any]:
         "peak_probe1_actual": None,
         "peak_probe2_actual": None,
         "sample_count": 0,
+        **{f"{name}_duty_cycle": None for name in _CAPTURED_STATE_KEYS.values()},
     }
 
 
@@ -84,6 +171,223 @@ def _migrate_legacy_cook_session(session: dict[str, Any]) -> CookSession:
     }
 
 
+def _preheat_tolerance(cook: CookSession) -> int:
+    """Return how far below its set point the grill counts as preheated."""
+
+    if cook.get("unit") == "C":
+        return PREHEAT_TOLERANCE_C
+    return PREHEAT_TOLERANCE_F
+
+
+def _label_cook_sample(
+    sample: CookSample,
+    done_at: datetime | None,
+    tolerance: int,
+    preheated: bool,
+    stalled: bool,
+) -> tuple[str, bool, bool]:
+    """Return the phase of one sample and the updated preheated and stall flags."""
+
+    if not preheated and sample["grill_set"] > 0:
+        preheated = sample["grill_actual"] >= sample["grill_set"] - tolerance
+
+    if done_at is not None and sample["timestamp"] >= done_at:
+        phase = "rest"
+    elif not preheated:
+        phase = "preheat"
+    elif sample.get("probe1_stalled"):
+        phase = "stall"
+        stalled = True
+    elif stalled:
+        phase = "finish"
+    else:
+        phase = "smoke"
+    return phase, preheated, stalled
+
+
+class TemperatureTrendWindow(deque[tuple[datetime, int]]):
+    """Rolling temperature history that keeps least-squares sums up to date.
+
+    Timestamps are measured in seconds from an anchor so the running sums stay
+    small; the anchor is moved forward once it falls too far behind the window.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trend window."""
+
+        super().__init__()
+        self._anchor: datetime | None = None
+        self._sum_t = 0.0
+        self._sum_y = 0.0
+        self._sum_tt = 0.0
+        self._sum_ty = 0.0
+
+    def append(self, item: tuple[datetime, int]) -> None:
+        """Add a reading to the end of the window."""
+
+        timestamp, temperature = item
+        if self._anchor is None:
+            self._anchor = timestamp
+        super().append(item)
+        if timestamp - self._anchor > _TREND_WINDOW_REBASE_AFTER:
+            self._rebase()
+            return
+        self._add(timestamp, temperature, 1)
+
+    def popleft(self) -> tuple[datetime, int]:
+        """Remove and return the oldest reading."""
+
+        item = super().popleft()
+        if not self:
+            self.clear()
+        else:
+            self._add(item[0], item[1], -1)
+        return item
+
+    def clear(self) -> None:
+        """Remove all readings and reset the running sums."""
+
+        super().clear()
+        self._anchor = None
+        self._sum_t = self._sum_y = self._sum_tt = self._sum_ty = 0.0
+
+    def slope(self) -> float | None:
+        """Return the least-squares trend in degrees per second."""
+
+        count = len(self)
+        if count < 2:
+            return None
+
+        denominator = count * self._sum_tt - self._sum_t**2
+        if denominator <= 1e-9 * count * self._sum_tt:
+            return None
+        return (count * self._sum_ty - self._sum_t * self._sum_y) / denominator
+
+    def _add(self, timestamp: datetime, temperature: int, sign: int) -> None:
+        """Add or remove one reading from the running sums."""
+
+        offset = (timestamp - self._anchor).total_seconds()
+        self._sum_t += sign * offset
+        self._sum_y += sign * temperature
+        self._sum_tt += sign * offset * offset
+        self._sum_ty += sign * offset * temperature
+
+    def _rebase(self) -> None:
+        """Move the anchor to the oldest reading and rebuild the sums."""
+
+        self._anchor = self[0][0]
+        self._sum_t = self._sum_y = self._sum_tt = self._sum_ty = 0.0
+        for timestamp, temperature in self:
+            self._add(timestamp, temperature, 1)
+
+
+class CookPhaseTracker:
+    """Phase of the active cook, kept current from its newest sample.
+
+    Samples before the newest no longer change, so each is labelled once as
+    it settles; only the newest, which later polls may still replace, is
+    labelled again on every update.
+    """
+
+    def __init__(self) -> None:
+        """Start tracking a cook with no samples."""
+
+        self._settled = 0
+        self._preheated = False
+        self._stalled = False
+        self._count = 0
+        self._phase: str | None = None
+        self._start: datetime | None = None
+
+    def current(self, active_cook: CookSession) -> tuple[int, CookPhase] | None:
+        """Return the index and the open phase of the active cook's newest sample."""
+
+        samples = active_cook["samples"]
+        if not samples:
+            return None
+
+        tolerance = _preheat_tolerance(active_cook)
+        done_at = active_cook["done_at"]
+        for position in range(self._settled, len(samples) - 1):
+            sample = samples[position]
+            phase, self._preheated, self._stalled = _label_cook_sample(
+                sample, done_at, tolerance, self._preheated, self._stalled
+            )
+            if phase != self._phase:
+                self._start = (
+                    active_cook["start"] if self._phase is None else sample["timestamp"]
+                )
+                self._phase = phase
+                self._count += 1
+        self._settled = max(self._settled, len(samples) - 1)
+
+        sample = samples[-1]
+        phase, _, _ = _label_cook_sample(
+            sample, done_at, tolerance, self._preheated, self._stalled
+        )
+        if phase == self._phase:
+            return self._count - 1, {"phase": phase, "start": self._start, "end": None}
+        start = active_cook["start"] if self._phase is None else sample["timestamp"]
+        return self._count, {"phase": phase, "start": start, "end": None}
+
+
+class CookCaptureRing:
+    """Bounded, array-backed capture of every poll during the active cook."""
+
+    channels = SAMPLE_DELTA_COLUMNS
+
+    def __init__(self, capacity: int) -> None:
+        """Preallocate storage for a fixed number of polls."""
+
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = {
+            channel: array("h", bytes(2 * capacity)) for channel in self.channels
+        }
+        self._next = 0
+        self._size = 0
+        self.appended = 0
+
+    def __len__(self) -> int:
+        """Return the number of captured polls."""
+
+        return self._size
+
+    def append(self, sample: CookSample) -> None:
+        """Capture one poll, overwriting the oldest once the ring is full."""
+
+        index = self._next
+        self._timestamps[index] = sample["timestamp"].timestamp()
+        for channel, values in self._values.items():
+            values[index] = sample[channel]
+        self._next = (index + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self.appended += 1
+
+    def rows(self, since: int = 0) -> list[CookSample]:
+        """Return the captured polls in chronological order.
+
+        With ``since``, only polls appended after the first ``since`` are
+        returned, as far as the ring still holds them.
+        """
+
+        count = min(self._size, self.appended - since)
+        first = (self._next - count) % self.capacity
+        rows: list[CookSample] = []
+        for offset in range(count):
+            index = (first + offset) % self.capacity
+            rows.append(
+                {
+                    "timestamp": utc_from_timestamp(self._timestamps[index]),
+                    **{
+                        channel: values[index]
+                        for channel, values in self._values.items()
+                    },
+                }
+            )
+        return rows
+
+
 class PitbossCookIndexStore(Store[dict[str, Any]]):
     """Store for the Pit Boss cook archive index."""
 
@@ -93,10 +397,14 @@ class PitbossCookIndexStore(Store[dict[str, Any]]):
         old_minor_version: int,
         old_data: dict[str, Any],
     ) -> dict[str, Any]:
-        """Migrate older cook storage to the indexed format."""
+        """Migrate older cook storage to the indexed format.
+
+        Sessions from a single-file index are returned unchanged; the
+        coordinator splits them into month segments after loading.
+        """
 
         if old_major_version == 1:
-            return {
+            old_data = {
                 "sessions": [
                     _migrate_legacy_cook_session(session)
                     for session in old_data.get("sessions", [])
@@ -112,6 +420,31 @@ class PitbossCookIndexStore(Store[dict[str, Any]]):
                 ),
             }
 
+        if old_major_version < 3:
+            return old_data
+
+        raise NotImplementedError
+
+
+class PitbossCookSegmentStore(Store[dict[str, Any]]):
+    """Store for one month segment of the Pit Boss cook archive index."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate ISO timestamps in a segment to epoch microseconds."""
+
+        if old_major_version == 1:
+            return {
+                "sessions": [
+                    CookIndexEntry.from_stored(session).as_stored()
+                    for session in old_data.get("sessions", [])
+                ]
+            }
+
         raise NotImplementedError
 
 
@@ -138,52 +471,266 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
         )
         self.api = api
         self.config_entry = config_entry
+        self._default_update_interval = self.update_interval
         self._store: Store[dict[str, Any]] = PitbossCookIndexStore(
             hass,
             COOK_STORAGE_VERSION,
             f"{DOMAIN}_{config_entry.entry_id}_cook_sessions",
         )
-        self._cook_detail_stores: dict[str, Store[dict[str, Any]]] = {}
+        archive_backend = config_entry.options.get(
+            CONF_ARCHIVE_BACKEND, DEFAULT_ARCHIVE_BACKEND
+        )
+        self._cook_database: SqliteCookArchive | None = None
+        self._detail_archive: CookDetailArchive | SqliteCookArchive
+        if archive_backend == ARCHIVE_BACKEND_SQLITE:
+            self._cook_database = SqliteCookArchive(hass, config_entry.entry_id)
+            self._detail_archive = self._cook_database
+        elif archive_backend == ARCHIVE_BACKEND_PACKED:
+            self._detail_archive = PackedCookDetailArchive(hass, config_entry.entry_id)
+        else:
+            self._detail_archive = CookDetailArchive(hass, config_entry.entry_id)
+        self._cook_detail_cache: LruCache[str, CookDetail] = LruCache(
+            COOK_DETAIL_CACHE_SIZE
+        )
+        self._cook_aggregate_cache: LruCache[
+            tuple[CookQuery, timedelta, tuple[str, ...]], dict[str, Any]
+        ] = LruCache(COOK_AGGREGATE_CACHE_SIZE)
+        self._retention_lock = asyncio.Lock()
+        self._retention_stats: dict[str, Any] = {
+            "last_run": None,
+            "cooks_downsampled": 0,
+            "cooks_deleted": 0,
+            "bytes_reclaimed": 0,
+        }
+        self._storage_scan_summary: dict[str, Any] | None = None
+        # Versions start from the load time so they keep increasing across
+        # restarts without being stored; changes before the floor are unknown.
+        self._archive_version = to_epoch_microseconds(utcnow())
+        self._archive_changelog_floor = self._archive_version
+        self._archive_changelog: deque[tuple[int, str, CookIndexEntry | None]] = (
+            deque()
+        )
+        self._cook_change_listeners: set[Callable[[dict[str, Any]], None]] = set()
+        self._active_cook_listeners: set[Callable[[dict[str, Any]], None]] = set()
+        self._subscription_closers: set[CALLBACK_TYPE] = set()
+        self._active_cook_phase: str | None = None
+        self._active_cook_phases = CookPhaseTracker()
+        self._cook_segment_stores: dict[str, Store[dict[str, Any]]] = {}
+        self._cook_segments: dict[str, list[CookIndexEntry]] = {}
+        self._dirty_cook_segments: set[str] = set()
+        self._cook_segment_list_changed = False
+        self._journal = CookJournal(
+            hass, f"{DOMAIN}_{config_entry.entry_id}_active_cook.journal"
+        )
+        self._journaled_header: dict[str, Any] | None = None
+        self._journaled_summary: dict[str, Any] | None = None
+        self._journaled_errors: list[dict[str, Any]] = []
+        self._journaled_samples = 0
+        self._journaled_rollups = 0
+        self._journaled_transitions: dict[str, int] = {}
+        self._journaled_capture = 0
         self._command_lock = asyncio.Lock()
         self._debounced_commands: dict[
             str, tuple[Callable[[], Awaitable[None]], Callable[[], None]]
         ] = {}
         self._pending_command_tasks: set[asyncio.Task[None]] = set()
-        self._temperature_history: dict[str, deque[tuple[datetime, int]]] = {
-            "GrillActTemp": deque(),
-            "P1ActTemp": deque(),
-            "P2ActTemp": deque(),
+        self._pending_archive_tasks: set[asyncio.Task[None]] = set()
+        self._temperature_history: dict[str, TemperatureTrendWindow] = {
+            "GrillActTemp": TemperatureTrendWindow(),
+            "P1ActTemp": TemperatureTrendWindow(),
+            "P2ActTemp": TemperatureTrendWindow(),
         }
         self._virtual_probe_targets: dict[str, int | None] = {"P2SetTemp": None}
         self._probe_target_reached_at: dict[str, datetime | None] = {
             "P1SetTemp": None,
             "P2SetTemp": None,
         }
-        self._cook_sessions: list[CookSession] = []
+        self._probe_eta: dict[str, datetime | None] = {
+            "P1SetTemp": None,
+            "P2SetTemp": None,
+        }
+        self._cook_sessions = CookIndex()
+        self._cook_catalog = async_get_cook_catalog(hass)
         self._active_cook: CookSession | None = None
+        self._capture_poll_limit: int = config_entry.options.get(
+            CONF_CAPTURE_POLL_LIMIT, DEFAULT_CAPTURE_POLL_LIMIT
+        )
+        self._active_cook_capture = CookCaptureRing(self._capture_poll_limit)
         self._probe1_absent_since: datetime | None = None
         self._previous_probe1_stall = False
+        self._flame_out_history = TemperatureTrendWindow()
+        self._flame_out_grill_set: int | None = None
+        self._flame_out_auger_on_at: datetime | None = None
+        self._flame_out_suspected_since: datetime | None = None
+        self._flame_out_detected = False
         self._active_device_error_message: str | None = None
         self._last_update_error_message: str | None = None
 
     async def async_initialize(self) -> None:
-        """Load persisted cook session data."""
+        """Load persisted cook session data and replay the active cook journal."""
 
-        if (stored_data := await self._store.async_load()) is None:
-            return
+        stored_data = await self._store.async_load() or {}
+        if "sessions" in stored_data:
+            stored_sessions = stored_data["sessions"]
+        else:
+            stored_sessions = []
+            for segment in stored_data.get("segments", []):
+                segment_data = await self._get_cook_segment_store(segment).async_load()
+                stored_sessions.extend((segment_data or {}).get("sessions", []))
+        sessions = await self._async_convert_cook_data(
+            len(stored_sessions), self._deserialize_cook_sessions, stored_sessions
+        )
 
-        self._cook_sessions = [
-            self._deserialize_cook_session(session)
-            for session in stored_data.get("sessions", [])
-        ]
-        if active_session := stored_data.get("active_session"):
+        # Loaded cooks are merged into the cross-entry catalog in one pass.
+        self._cook_catalog.unregister(self.config_entry.entry_id)
+        self._cook_sessions = CookIndex()
+        self._cook_segments = {}
+        for session in sessions:
+            self._add_cook_session(session)
+        self._dirty_cook_segments.clear()
+        self._cook_segment_list_changed = False
+
+        # Archives written before the journal existed kept the active cook inline.
+        active_session = stored_data.get("active_session")
+        if journaled_session := self._replay_active_cook_journal(
+            await self._journal.async_load()
+        ):
+            active_session = journaled_session
+
+        if active_session:
+            capture = active_session.pop("capture", [])
             self._active_cook = self._deserialize_active_cook(active_session)
+            for polls in capture:
+                for poll in decode_columns(polls, SAMPLE_DELTA_COLUMNS):
+                    self._active_cook_capture.append(poll)
             self._probe1_absent_since = (
                 None
                 if active_session.get("probe1_absent_since") is None
                 else datetime.fromisoformat(active_session["probe1_absent_since"])
             )
             self._restore_active_cook_runtime_state()
+            if journaled_session:
+                self._mark_active_cook_journaled()
+            else:
+                self._schedule_store_save()
+                await self._journal.async_flush()
+
+        # With the SQLite backend only the latest cook is kept in memory; the
+        # JSON stores are imported once and then removed.
+        if self._cook_database is not None:
+            if stored_data:
+                await self._async_import_cook_archive(stored_data, sessions)
+            self._cook_sessions = CookIndex.from_entries(
+                CookIndexEntry.from_stored(session)
+                for session in await self._cook_database.async_list_sessions(limit=1)
+            )
+        else:
+            # Cooks left in another backend by an options change move over
+            # before the stores they came from are removed.
+            exported = await self._async_export_cook_database()
+            if not isinstance(self._detail_archive, PackedCookDetailArchive):
+                await self._async_unpack_cook_detail()
+            # A single-file index is rewritten as segments once the active cook
+            # it may carry has been moved to the journal.
+            if "sessions" in stored_data:
+                self._dirty_cook_segments.update(self._cook_segments)
+                self._cook_segment_list_changed = True
+            if exported or "sessions" in stored_data:
+                await self._async_save_cook_index()
+            if exported:
+                await SqliteCookArchive(
+                    self.hass, self.config_entry.entry_id
+                ).async_remove_database()
+
+        if self._cook_database is None:
+            self._cook_catalog.register(
+                self.config_entry.entry_id,
+                self._cook_sessions,
+                self._serialize_cook_entry,
+            )
+
+    async def async_flush_cook_journal(self) -> None:
+        """Write any pending active-cook journal records now."""
+
+        await self._journal.async_flush()
+
+    async def async_close_cook_archive(self) -> None:
+        """Flush the journal, withdraw the cooks from listing and close the archive.
+
+        Subscribers are told, so they can subscribe again once it reloads.
+        Archive writes still in flight finish before anything is closed.
+        """
+
+        for close in list(self._subscription_closers):
+            close()
+        while self._pending_archive_tasks:
+            for result in await asyncio.gather(
+                *self._pending_archive_tasks, return_exceptions=True
+            ):
+                if isinstance(result, Exception):
+                    _LOGGER.warning(
+                        "Could not finish writing the Pit Boss cook archive: %s",
+                        result,
+                    )
+        await self._journal.async_close()
+        self._cook_catalog.unregister(self.config_entry.entry_id)
+        if self._cook_database is not None:
+            await self._cook_database.async_close()
+
+    async def _async_import_cook_archive(
+        self, stored_data: dict[str, Any], sessions: list[CookIndexEntry]
+    ) -> None:
+        """Move completed cooks from the JSON stores into the SQLite archive."""
+
+        per_cook_archive = CookDetailArchive(self.hass, self.config_entry.entry_id)
+        packed_archive = PackedCookDetailArchive(self.hass, self.config_entry.entry_id)
+        cooks: list[tuple[dict[str, Any], CookDetail | None]] = []
+        for session in sessions:
+            if (detail := await per_cook_archive.async_load(session.id)) is None:
+                detail = await packed_archive.async_load(session.id)
+            cooks.append((session.as_stored(), detail))
+        await self._cook_database.async_import_cooks(cooks)
+
+        # The JSON stores are only dropped once the import has committed.
+        await per_cook_archive.async_remove_many([session.id for session in sessions])
+        await packed_archive.async_clear()
+        for segment in stored_data.get("segments", []):
+            await self._get_cook_segment_store(segment).async_remove()
+        self._cook_segment_stores.clear()
+        await self._store.async_remove()
+
+    async def _async_export_cook_database(self) -> bool:
+        """Move completed cooks from a SQLite archive into the JSON stores.
+
+        Returns whether a database was found. It is only removed by the
+        caller once the index holding its cooks has been saved.
+        """
+
+        database = SqliteCookArchive(self.hass, self.config_entry.entry_id)
+        if not await database.async_exists():
+            return False
+
+        known_ids = {session.id for session in self._cook_sessions}
+        for stored in reversed(await database.async_list_sessions()):
+            session = CookIndexEntry.from_stored(stored)
+            if (detail := await database.async_load(session.id)) is not None:
+                await self._detail_archive.async_save(session.id, detail)
+            if session.id not in known_ids:
+                self._add_cook_session(session)
+        await database.async_close()
+        return True
+
+    async def _async_unpack_cook_detail(self) -> None:
+        """Move detail held in a packed data file into per-cook files."""
+
+        packed_archive = PackedCookDetailArchive(self.hass, self.config_entry.entry_id)
+        if not (cook_ids := await packed_archive.async_cook_ids()):
+            return
+
+        for cook_id in cook_ids:
+            if (detail := await packed_archive.async_load(cook_id)) is not None:
+                await self._detail_archive.async_save(cook_id, detail)
+        await packed_archive.async_clear()
 
     async def _async_update_data(self) -> None:
         """Update data via APIs."""
@@ -193,7 +740,9 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
             self._last_update_error_message = None
             now = utcnow()
             self._record_temperature_history(now)
+            self._update_flame_out_detector(now)
             self._update_probe_target_reached_times(now)
+            self._update_probe_etas(now)
             self._update_cook_tracking(now)
         except (ClientError, TimeoutError) as ex:
             detail = str(ex) or type(ex).__name__
@@ -285,27 +834,9 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
     def get_temperature_change_rate(self, key: str) -> float | None:
         """Return the temperature trend in degrees per hour."""
 
-        history = self._temperature_history[key]
-        if len(history) < 2:
-            return None
-
-        start_time = history[0][0]
-        time_points = [
-            (timestamp - start_time).total_seconds() for timestamp, _temp in history
-        ]
-        temperatures = [temp for _timestamp, temp in history]
-
-        mean_time = sum(time_points) / len(time_points)
-        mean_temp = sum(temperatures) / len(temperatures)
-        denominator = sum((time_point - mean_time) ** 2 for time_point in time_points)
-        if denominator <= 0:
+        if (degrees_per_second := self._temperature_history[key].slope()) is None:
             return None
 
-        numerator = sum(
-            (time_point - mean_time) * (temp - mean_temp)
-            for time_point, temp in zip(time_points, temperatures, strict=True)
-        )
-        degrees_per_second = numerator / denominator
         return round(
             degrees_per_second * TEMPERATURE_TREND_INTERVAL.total_seconds(),
             1,
@@ -315,14 +846,18 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
         """Store a local-only probe target and refresh dependent entities."""
 
         self._virtual_probe_targets[key] = value
-        self._update_probe_target_reached_times(utcnow())
+        now = utcnow()
+        self._update_probe_target_reached_times(now)
+        self._update_probe_etas(now, force=True)
         self.async_update_listeners()
         self._schedule_store_save()
 
     def update_probe_target_reached_times(self) -> None:
         """Recalculate target-reached tracking after an optimistic target change."""
 
-        self._update_probe_target_reached_times(utcnow())
+        now = utcnow()
+        self._update_probe_target_reached_times(now)
+        self._update_probe_etas(now, force=True)
         self.async_update_listeners()
         self._schedule_store_save()
 
@@ -393,6 +928,16 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
             return None
         return utcnow() - reached_at
 
+    def is_flame_out_detected(self) -> bool:
+        """Return if the grill appears to be losing its fire."""
+
+        return self._flame_out_detected
+
+    def get_probe_eta(self, target_key: str) -> datetime | None:
+        """Return when the probe is expected to reach its target."""
+
+        return self._probe_eta[target_key]
+
     def is_cook_active(self) -> bool:
         """Return if a cook session is currently active and confirmed."""
 
@@ -413,43 +958,499 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
 
         if not self._cook_sessions:
             return None
-        return timedelta(seconds=self._cook_sessions[-1]["duration_seconds"])
+        return timedelta(seconds=self._cook_sessions[-1].duration_seconds)
 
     def get_last_cook_start(self) -> datetime | None:
         """Return the start of the most recently completed cook."""
 
         if not self._cook_sessions:
             return None
-        return self._cook_sessions[-1]["start"]
+        return self._cook_sessions[-1].start_datetime
 
     def get_last_cook_end(self) -> datetime | None:
         """Return the end of the most recently completed cook."""
 
         if not self._cook_sessions:
             return None
-        return self._cook_sessions[-1]["end"]
+        return self._cook_sessions[-1].end_datetime
 
     def list_cooks(self) -> list[dict[str, Any]]:
         """Return completed cook summaries in reverse chronological order."""
 
         return [
-            self._serialize_cook_session(session, include_config_entry=True)
+            self._serialize_cook_entry(session)
             for session in reversed(self._cook_sessions)
         ]
 
-    async def async_get_cook(self, cook_id: str) -> dict[str, Any] | None:
-        """Return a completed cook with its sampled trace."""
+    async def async_query_cooks(
+        self, query: CookQuery
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Return one filtered page of completed cook summaries and its cursor."""
+
+        sessions, next_cursor = await self._async_query_cook_sessions(query)
+        return [
+            self._serialize_cook_entry(session) for session in sessions
+        ], next_cursor
+
+    async def _async_query_cook_sessions(
+        self, query: CookQuery
+    ) -> tuple[list[CookIndexEntry], str | None]:
+        """Return one filtered page of completed cooks and its cursor."""
+
+        query = query.for_entry(self.config_entry.entry_id)
+        if self._cook_database is None:
+            return self._cook_sessions.query(query)
+        return query.page(
+            [
+                CookIndexEntry.from_stored(session)
+                for session in await self._cook_database.async_query_sessions(query)
+            ]
+        )
+
+    async def async_aggregate_cooks(
+        self, query: CookQuery, step: timedelta, channels: Sequence[str]
+    ) -> dict[str, Any]:
+        """Return percentile curves across the completed cooks matching a query.
+
+        Traces are aligned on ``step`` grid points from each cook's start. Only
+        the newest ``COOK_AGGREGATE_MAX_COOKS`` matches are taken, which is
+        flagged as ``truncated``. Their samples are decoded on their own and
+        bypass the detail cache, so an aggregate does not evict the cooks
+        being viewed. Results are cached per query until the archive changes.
+        """
+
+        query = replace(
+            query,
+            sort=COOK_SORT_START,
+            descending=True,
+            limit=COOK_AGGREGATE_MAX_COOKS,
+            cursor=None,
+        )
+        key = (query, step, tuple(channels))
+        if (aggregate := self._cook_aggregate_cache.get(key)) is not None:
+            return aggregate
+
+        version = self._archive_version
+        sessions, next_cursor = await self._async_query_cook_sessions(query)
+        semaphore = asyncio.Semaphore(COOK_BATCH_PARALLELISM)
+
+        async def _load(session: CookIndexEntry) -> list[CookSample]:
+            if session.id in self._cook_detail_cache:
+                return self._cook_detail_cache.get(session.id)["samples"]
+            async with semaphore:
+                stored_detail = await self._detail_archive.async_load(session.id)
+            samples = (stored_detail or {}).get("samples", {})
+            return await self._async_convert_cook_data(
+                len(samples.get("timestamp", [])),
+                decode_columns,
+                samples,
+                SAMPLE_DELTA_COLUMNS,
+                SAMPLE_PLAIN_COLUMNS,
+            )
+
+        traces = await asyncio.gather(*(_load(session) for session in sessions))
+        aggregate = await self._async_convert_cook_data(
+            sum(map(len, traces)),
+            aggregate_traces,
+            [from_epoch_microseconds(session.start) for session in sessions],
+            traces,
+            step,
+            channels,
+            COOK_AGGREGATE_PERCENTILES,
+        )
+        aggregate["truncated"] = next_cursor is not None
+        if version == self._archive_version:
+            self._cook_aggregate_cache.put(key, aggregate)
+        return aggregate
+
+    @property
+    def archive_version(self) -> int:
+        """Return the version of the completed-cook archive."""
+
+        return self._archive_version
+
+    def get_cook_changes(self, since_version: int) -> dict[str, Any] | None:
+        """Return the cooks added, changed or deleted after an archive version.
+
+        Returns None when those changes are no longer held, in which case the
+        caller has to send the full list again.
+        """
 
-        if (session := self._get_cook_session(cook_id)) is None:
+        if not self._archive_changelog_floor <= since_version <= self._archive_version:
             return None
 
-        detail = await self._async_load_cook_detail(cook_id)
+        changes: dict[str, CookIndexEntry | None] = {}
+        for version, cook_id, session in reversed(self._archive_changelog):
+            if version <= since_version:
+                break
+            changes.setdefault(cook_id, session)
+        return self._serialize_cook_changes(changes)
+
+    @callback
+    def async_subscribe_cook_changes(
+        self,
+        listener: Callable[[dict[str, Any]], None],
+        on_close: CALLBACK_TYPE | None = None,
+    ) -> CALLBACK_TYPE:
+        """Call a listener with each archive change; return an unsubscribe.
+
+        ``on_close`` is called if the archive is closed while subscribed.
+        """
+
+        self._cook_change_listeners.add(listener)
+        if on_close is not None:
+            self._subscription_closers.add(on_close)
+
+        @callback
+        def _unsubscribe() -> None:
+            self._cook_change_listeners.discard(listener)
+            self._subscription_closers.discard(on_close)
+
+        return _unsubscribe
+
+    def _record_cook_change(
+        self, cook_id: str, session: CookIndexEntry | None
+    ) -> None:
+        """Bump the archive version for a changed, or deleted, cook."""
+
+        self._record_cook_changes({cook_id: session})
+
+    def _record_cook_changes(
+        self, changes: dict[str, CookIndexEntry | None]
+    ) -> None:
+        """Bump the archive version once for changed, or deleted, cooks."""
+
+        self._archive_version += 1
+        self._cook_aggregate_cache.clear()
+        self._archive_changelog.extend(
+            (self._archive_version, cook_id, session)
+            for cook_id, session in changes.items()
+        )
+        while len(self._archive_changelog) > COOK_ARCHIVE_CHANGELOG_SIZE:
+            self._archive_changelog_floor = self._archive_changelog.popleft()[0]
+        if self._cook_change_listeners:
+            serialized = self._serialize_cook_changes(changes)
+            for listener in list(self._cook_change_listeners):
+                listener(serialized)
+
+    def _serialize_cook_changes(
+        self, changes: dict[str, CookIndexEntry | None]
+    ) -> dict[str, Any]:
+        """Serialize changed cooks and deleted cook ids with the current version."""
+
+        return {
+            "version": self._archive_version,
+            "cooks": [
+                self._serialize_cook_entry(session)
+                for session in changes.values()
+                if session is not None
+            ],
+            "deleted_cook_ids": [
+                cook_id for cook_id, session in changes.items() if session is None
+            ],
+        }
+
+    async def async_list_cooks(self) -> list[dict[str, Any]]:
+        """Return completed cook summaries, newest first, from either backend."""
+
+        if self._cook_database is None:
+            return self.list_cooks()
+
+        return [
+            self._serialize_cook_entry(CookIndexEntry.from_stored(session))
+            for session in await self._cook_database.async_list_sessions()
+        ]
+
+    def get_cook_archive_diagnostics(self) -> dict[str, Any]:
+        """Return cache statistics for the cook archive."""
+
+        diagnostics: dict[str, Any] = {
+            "backend": self.config_entry.options.get(
+                CONF_ARCHIVE_BACKEND, DEFAULT_ARCHIVE_BACKEND
+            ),
+            "detail_cache": self._cook_detail_cache.as_dict(),
+            "aggregate_cache": self._cook_aggregate_cache.as_dict(),
+            "retention": dict(self._retention_stats),
+            "integrity": self._storage_scan_summary,
+        }
+        if isinstance(self._detail_archive, CookDetailArchive):
+            diagnostics["detail_store_cache"] = self._detail_archive.store_cache_stats()
+        return diagnostics
+
+    def get_active_cook_capture(
+        self, channels: Sequence[str] = SAMPLE_DELTA_COLUMNS
+    ) -> dict[str, Any] | None:
+        """Return every poll captured for the active cook, one array per channel.
+
+        Timestamps are millisecond offsets from the cook start, sent once as
+        ``time_base``. The capture ring is discarded when the cook closes.
+        """
+
+        if (active_cook := self._active_cook) is None:
+            return None
+
+        base = to_epoch_microseconds(active_cook["start"]) // 1000
+        return {
+            "id": active_cook["id"],
+            "format": COOK_FORMAT_COLUMNAR,
+            "time_base": base,
+            "polls": to_offset_columns(
+                self._active_cook_capture.rows(), channels, base
+            ),
+        }
+
+    def get_active_cook_trace(self) -> dict[str, Any] | None:
+        """Return the active cook with its sampled trace, errors and phases."""
+
+        if self._active_cook is None:
+            return None
+
+        phases = self._segment_cook_phases(self._active_cook)
+        self._active_cook_phase = phases[-1]["phase"] if phases else None
         return {
-            **self._serialize_cook_session(session, include_config_entry=True),
+            **self._serialize_active_cook_event_header(),
             "samples": [
-                self._serialize_cook_sample(sample) for sample in detail["samples"]
+                self._serialize_cook_sample(sample)
+                for sample in self._active_cook["samples"]
             ],
+            "phases": [self._serialize_cook_phase(phase) for phase in phases],
+        }
+
+    @callback
+    def async_subscribe_active_cook(
+        self,
+        listener: Callable[[dict[str, Any]], None],
+        on_close: CALLBACK_TYPE | None = None,
+    ) -> CALLBACK_TYPE:
+        """Call a listener with each incremental change to the active cook.
+
+        ``on_close`` is called if the archive is closed while subscribed.
+        """
+
+        self._active_cook_listeners.add(listener)
+        if on_close is not None:
+            self._subscription_closers.add(on_close)
+
+        @callback
+        def _unsubscribe() -> None:
+            self._active_cook_listeners.discard(listener)
+            self._subscription_closers.discard(on_close)
+
+        return _unsubscribe
+
+    async def async_get_cook(
+        self,
+        cook_id: str,
+        max_points: int | None = None,
+        *,
+        data_format: str = COOK_FORMAT_ROWS,
+        channels: Sequence[str] = SAMPLE_CHANNELS,
+    ) -> dict[str, Any] | None:
+        """Return a completed cook with its sampled trace.
+
+        With ``max_points`` the samples and rollups are reduced to about that
+        many points each, keeping the shape of every channel. The columnar
+        format holds only ``channels``, one array each.
+        """
+
+        if (session := await self._async_get_cook_session(cook_id)) is None:
+            return None
+
+        detail = await self._async_load_cook_detail(cook_id)
+        return await self._async_convert_cook_data(
+            len(detail["samples"]) + len(detail["rollups"]),
+            self._serialize_cook_with_detail,
+            session,
+            detail,
+            max_points,
+            data_format,
+            channels,
+        )
+
+    async def async_get_cook_window(
+        self,
+        cook_id: str,
+        start: datetime,
+        end: datetime,
+        max_points: int | None = None,
+        *,
+        data_format: str = COOK_FORMAT_ROWS,
+        channels: Sequence[str] = SAMPLE_CHANNELS,
+    ) -> dict[str, Any] | None:
+        """Return a completed cook with the part of its trace inside a window.
+
+        Loaded detail is cached, so zooming within a cook costs a few binary
+        searches and serializing only the window.
+        """
+
+        if (session := await self._async_get_cook_session(cook_id)) is None:
+            return None
+
+        window = self._slice_cook_detail(
+            await self._async_load_cook_detail(cook_id), start, end
+        )
+        return await self._async_convert_cook_data(
+            len(window["samples"]) + len(window["rollups"]),
+            self._serialize_cook_with_detail,
+            session,
+            window,
+            max_points,
+            data_format,
+            channels,
+        )
+
+    async def async_get_cook_resampled(
+        self, cook_id: str, step: timedelta, channels: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """Return a completed cook with its trace resampled onto a fixed grid.
+
+        Grid points are ``step`` apart from the cook start, so the traces of
+        different cooks line up point for point in overlays.
+        """
+
+        if (session := await self._async_get_cook_session(cook_id)) is None:
+            return None
+
+        detail = await self._async_load_cook_detail(cook_id)
+        return await self._async_convert_cook_data(
+            len(detail["samples"]),
+            self._serialize_resampled_cook,
+            session,
+            detail,
+            step,
+            channels,
+        )
+
+    def _serialize_resampled_cook(
+        self,
+        session: CookIndexEntry,
+        detail: CookDetail,
+        step: timedelta,
+        channels: Sequence[str],
+    ) -> dict[str, Any]:
+        """Serialize a completed cook with its trace on a grid from its start."""
+
+        return {
+            **self._serialize_cook_entry(session),
+            "samples": resample_samples(
+                detail["samples"],
+                from_epoch_microseconds(session.start),
+                step,
+                channels,
+            ),
+        }
+
+    def _slice_cook_detail(
+        self, detail: CookDetail, start: datetime, end: datetime
+    ) -> CookDetail:
+        """Return the part of a cook's detail that falls inside a time window.
+
+        Samples, rollups and state runs are time-sorted and cut with binary
+        searches. Rollup buckets and state runs already in progress at the
+        window start are kept, as are errors whose span overlaps the window.
+        """
+
+        by_timestamp = itemgetter("timestamp")
+        by_run_start = itemgetter(0)
+        samples = detail["samples"]
+        rollups = detail["rollups"]
+        transitions: CookStateTransitions = {}
+        for name, runs in detail["state_transitions"].items():
+            first = max(bisect_right(runs, start, key=by_run_start) - 1, 0)
+            transitions[name] = runs[
+                first : bisect_right(runs, end, key=by_run_start)
+            ]
+
+        return {
+            **detail,
+            "samples": samples[
+                bisect_left(samples, start, key=by_timestamp) : bisect_right(
+                    samples, end, key=by_timestamp
+                )
+            ],
+            "rollups": rollups[
+                bisect_right(
+                    rollups, start - COOK_SAMPLE_INTERVAL, key=by_timestamp
+                ) : bisect_right(rollups, end, key=by_timestamp)
+            ],
+            "errors": [
+                error
+                for error in detail["errors"]
+                if error["timestamp"] <= end
+                and (error.get("end") is None or error["end"] >= start)
+            ],
+            "state_transitions": transitions,
+        }
+
+    def _serialize_cook_with_detail(
+        self,
+        session: CookIndexEntry,
+        detail: CookDetail,
+        max_points: int | None = None,
+        data_format: str = COOK_FORMAT_ROWS,
+        channels: Sequence[str] = SAMPLE_CHANNELS,
+    ) -> dict[str, Any]:
+        """Serialize a completed cook together with its sampled trace."""
+
+        samples = detail["samples"]
+        rollups = detail["rollups"]
+        if max_points is not None:
+            samples = downsample_samples(samples, max_points)
+            rollups = downsample_rollups(rollups, max_points)
+        cook = {
+            **self._serialize_cook_entry(session),
             "errors": [self._serialize_cook_error(error) for error in detail["errors"]],
+            "state_transitions": self._serialize_state_transitions(
+                detail["state_transitions"]
+            ),
+        }
+        if data_format == COOK_FORMAT_COLUMNAR:
+            return cook | self._serialize_cook_columns(
+                session, samples, rollups, channels
+            )
+
+        return cook | {
+            "samples": [self._serialize_cook_sample(sample) for sample in samples],
+            "rollups": [self._serialize_cook_rollup(rollup) for rollup in rollups],
+        }
+
+    def _serialize_cook_columns(
+        self,
+        session: CookIndexEntry,
+        samples: list[CookSample],
+        rollups: list[CookRollup],
+        channels: Sequence[str],
+    ) -> dict[str, Any]:
+        """Serialize a cook trace as one array per requested channel.
+
+        Timestamps are millisecond offsets from the cook start, sent once as
+        ``time_base``; rollups carry the min/max/mean of requested channels.
+        """
+
+        base = session.start // 1000
+        means = [
+            f"{channel}_mean" for channel in ROLLUP_CHANNELS if channel in channels
+        ]
+        rollup_columns = to_offset_columns(
+            rollups,
+            [
+                "count",
+                *(
+                    f"{channel}_{stat}"
+                    for channel in ROLLUP_CHANNELS
+                    if channel in channels
+                    for stat in ("min", "max")
+                ),
+            ],
+            base,
+        )
+        for column in means:
+            rollup_columns[column] = [round(rollup[column], 2) for rollup in rollups]
+        return {
+            "format": COOK_FORMAT_COLUMNAR,
+            "time_base": base,
+            "samples": to_offset_columns(samples, channels, base),
+            "rollups": rollup_columns,
         }
 
     async def async_update_cook_annotations(
@@ -461,54 +1462,416 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
     ) -> dict[str, Any] | None:
         """Update the mutable annotations for a completed cook."""
 
-        if (session := self._get_cook_session(cook_id)) is None:
-            return None
+        updated = await self.async_bulk_update_cook_annotations(
+            [cook_id], tags=tags, notes=notes
+        )
+        return updated[0] if updated else None
+
+    async def async_bulk_update_cook_annotations(
+        self,
+        cook_ids: list[str],
+        *,
+        tags: list[str] | None = None,
+        notes: str | None | object = None,
+    ) -> list[dict[str, Any]]:
+        """Update the annotations of several completed cooks at once.
+
+        Changes are applied in memory and persisted with one write, and
+        listeners hear about them in one notification. Unknown cook ids are
+        skipped; the updated cooks are returned.
+        """
+
+        sessions = await self._async_get_cook_sessions(cook_ids)
+        if not sessions:
+            return []
+
+        for session in sessions:
+            if tags is not None:
+                if self._cook_sessions.get(session.id) is session:
+                    self._cook_sessions.set_tags(session, self._normalize_tags(tags))
+                else:
+                    session.annotations["tags"] = self._normalize_tags(tags)
+            if notes is not ...:
+                session.annotations["notes"] = self._normalize_notes(notes)
+            self._cook_detail_cache.pop(session.id)
+
+        if self._cook_database is not None:
+            await self._cook_database.async_save_sessions(
+                [session.as_stored() for session in sessions]
+            )
+            for session in sessions:
+                if session.id in self._cook_sessions:
+                    self._cook_sessions.add(session)
+        else:
+            self._dirty_cook_segments.update(
+                self._get_cook_segment_key(session) for session in sessions
+            )
+            await self._async_save_cook_index()
+        self._record_cook_changes({session.id: session for session in sessions})
+        return [self._serialize_cook_entry(session) for session in sessions]
+
+    async def async_delete_cook(self, cook_id: str) -> bool:
+        """Delete one completed cook and its sampled detail data."""
+
+        return bool(await self.async_bulk_delete_cooks([cook_id]))
+
+    async def async_bulk_delete_cooks(self, cook_ids: list[str]) -> list[str]:
+        """Delete several completed cooks and their sampled detail at once.
+
+        Detail is removed concurrently, the index is saved once and listeners
+        are notified once. Unknown cook ids are skipped; the ids of the
+        deleted cooks are returned.
+        """
+
+        sessions = await self._async_get_cook_sessions(cook_ids)
+        if not sessions:
+            return []
+
+        deleted = [session.id for session in sessions]
+        for session in sessions:
+            self._remove_cook_session(session)
+            self._cook_detail_cache.pop(session.id)
+        self._record_cook_changes(dict.fromkeys(deleted))
+        await self._detail_archive.async_remove_many(deleted)
+        if self._cook_database is not None and not self._cook_sessions:
+            self._cook_sessions = CookIndex.from_entries(
+                CookIndexEntry.from_stored(latest)
+                for latest in await self._cook_database.async_list_sessions(limit=1)
+            )
+        await self._async_save_cook_index()
+        self.async_update_listeners()
+        return deleted
+
+    @callback
+    def async_schedule_retention(self, _now: datetime | None = None) -> None:
+        """Start a background run of the archive retention policy."""
+
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_enforce_retention(), f"{DOMAIN} cook retention"
+        )
+
+    async def async_enforce_retention(self) -> int:
+        """Apply the retention policy to a batch of archived cooks.
+
+        Cooks outside both the kept count and the kept age have their detail
+        downsampled or, when enabled and unannotated, are dropped. At most
+        ``COOK_RETENTION_BATCH_SIZE`` cooks are changed per run, so a large
+        backlog is worked off over several runs. Returns the bytes reclaimed.
+        """
+
+        if self._retention_lock.locked():
+            return 0
+
+        async with self._retention_lock:
+            drop_unannotated = self.config_entry.options.get(
+                CONF_DROP_UNANNOTATED_COOKS, DEFAULT_DROP_UNANNOTATED_COOKS
+            )
+            expired = await self._async_cooks_past_detail_retention(drop_unannotated)
+            reclaimed = 0
+            changed = 0
+            dropped: list[str] = []
+            for session in expired:
+                if changed >= COOK_RETENTION_BATCH_SIZE:
+                    break
+                annotated = bool(
+                    session.annotations["tags"] or session.annotations["notes"]
+                )
+                if drop_unannotated and not annotated:
+                    dropped.append(session.id)
+                elif not session.detail_downsampled:
+                    reclaimed += await self._async_downsample_cook_detail(session)
+                    self._retention_stats["cooks_downsampled"] += 1
+                else:
+                    continue
+                changed += 1
+
+            if dropped:
+                sizes = await self._detail_archive.async_detail_sizes(dropped)
+                deleted = await self.async_bulk_delete_cooks(dropped)
+                reclaimed += sum(sizes.get(cook_id, 0) for cook_id in deleted)
+                self._retention_stats["cooks_deleted"] += len(deleted)
+
+            await self._async_save_cook_index()
+            self._retention_stats["last_run"] = utcnow().isoformat()
+            self._retention_stats["bytes_reclaimed"] += reclaimed
+            if changed:
+                _LOGGER.debug(
+                    "Cook retention changed %s cooks and reclaimed %s bytes",
+                    changed,
+                    reclaimed,
+                )
+            return reclaimed
+
+    @callback
+    def async_schedule_storage_scan(self, _now: datetime | None = None) -> None:
+        """Start a background integrity scan of the stored cook files."""
+
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_scan_cook_storage(), f"{DOMAIN} cook storage scan"
+        )
+
+    async def async_scan_cook_storage(self) -> dict[str, Any]:
+        """Remove orphaned cook files and flag cooks whose detail is missing."""
+
+        entry_id = self.config_entry.entry_id
+        expected_detail: dict[str, str] = {}
+        if self._cook_database is None:
+            packed_ids = (
+                await self._detail_archive.async_cook_ids()
+                if isinstance(self._detail_archive, PackedCookDetailArchive)
+                else set()
+            )
+            expected_detail = {
+                cook_detail_key(entry_id, session.id): session.id
+                for session in self._cook_sessions
+                if session.id not in packed_ids
+            }
+
+        known_entry_ids = {
+            entry.entry_id for entry in self.hass.config_entries.async_entries(DOMAIN)
+        }
+        summary = await async_scan_cook_storage(
+            self.hass, entry_id, expected_detail, known_entry_ids | {entry_id}
+        )
+        if summary["missing_detail"]:
+            _LOGGER.warning(
+                "Sampled detail is missing for %s archived Pit Boss cooks: %s",
+                len(summary["missing_detail"]),
+                ", ".join(summary["missing_detail"]),
+            )
+        self._storage_scan_summary = summary
+        return summary
+
+    async def _async_cooks_past_detail_retention(
+        self, drop_unannotated: bool
+    ) -> list[CookIndexEntry]:
+        """Return archived cooks, newest first, that no longer keep full detail.
+
+        The SQLite archive is asked for one batch of the cooks retention still
+        has to act on, instead of listing every session.
+        """
+
+        keep_cooks = self.config_entry.options.get(
+            CONF_DETAIL_RETENTION_COOKS, DEFAULT_DETAIL_RETENTION_COOKS
+        )
+        keep_days = self.config_entry.options.get(
+            CONF_DETAIL_RETENTION_DAYS, DEFAULT_DETAIL_RETENTION_DAYS
+        )
+        if not keep_cooks and not keep_days:
+            return []
+
+        cutoff = (
+            to_epoch_microseconds(utcnow() - timedelta(days=keep_days))
+            if keep_days
+            else None
+        )
+        if self._cook_database is not None:
+            candidates = await self._cook_database.async_list_retention_candidates(
+                keep_cooks, cutoff, drop_unannotated, COOK_RETENTION_BATCH_SIZE
+            )
+            return [CookIndexEntry.from_stored(session) for session in candidates]
+
+        sessions = list(reversed(self._cook_sessions))
+        return [
+            session
+            for position, session in enumerate(sessions)
+            if (not keep_cooks or position >= keep_cooks)
+            and (cutoff is None or session.start < cutoff)
+        ]
+
+    async def _async_downsample_cook_detail(self, session: CookIndexEntry) -> int:
+        """Replace a cook's detail with its downsampled form; return bytes saved."""
+
+        reclaimed = 0
+        if (
+            stored_detail := await self._detail_archive.async_load(session.id)
+        ) is not None:
+            downsampled = await self._async_convert_cook_data(
+                len(stored_detail.get("samples", {}).get("timestamp", [])),
+                self._downsample_stored_detail,
+                stored_detail,
+            )
+            reclaimed = len(json_bytes(stored_detail)) - len(json_bytes(downsampled))
+
+        session.detail_downsampled = True
+        self._cook_detail_cache.pop(session.id)
+        self._record_cook_change(session.id, session)
+        if self._cook_database is not None:
+            if stored_detail is None:
+                await self._cook_database.async_save_session(session.as_stored())
+            else:
+                await self._cook_database.async_save_cook(
+                    session.as_stored(), downsampled
+                )
+            return reclaimed
+
+        if stored_detail is not None:
+            await self._detail_archive.async_save(session.id, downsampled)
+        self._dirty_cook_segments.add(self._get_cook_segment_key(session))
+        return reclaimed
+
+    def _downsample_stored_detail(self, stored_detail: CookDetail) -> CookDetail:
+        """Keep one sample per retention interval and drop the rollups."""
+
+        samples: list[CookSample] = []
+        for sample in decode_columns(
+            stored_detail.get("samples", {}),
+            SAMPLE_DELTA_COLUMNS,
+            SAMPLE_PLAIN_COLUMNS,
+        ):
+            if (
+                not samples
+                or sample["timestamp"] - samples[-1]["timestamp"]
+                >= COOK_RETENTION_SAMPLE_INTERVAL
+            ):
+                samples.append(sample)
+
+        return {
+            **stored_detail,
+            "samples": encode_columns(
+                samples, SAMPLE_DELTA_COLUMNS, SAMPLE_PLAIN_COLUMNS
+            ),
+            "rollups": encode_columns([], ROLLUP_DELTA_COLUMNS, ROLLUP_PLAIN_COLUMNS),
+        }
+
+    def _update_probe_target_reached_times(self, timestamp: datetime) -> None:
+        """Update timestamps for when each probe most recently reached target."""
+
+        for target_key, actual_key in _PROBE_TARGET_KEYS.items():
+            target = self.get_probe_target_temperature(target_key)
+            actual = int(self.api.get_state_value(actual_key))
+
+            if target is None or actual < target:
+                self._probe_target_reached_at[target_key] = None
+                continue
+
+            if self._probe_target_reached_at[target_key] is None:
+                self._probe_target_reached_at[target_key] = timestamp
+
+    def _update_flame_out_detector(self, timestamp: datetime) -> None:
+        """Watch for a falling grill temperature while the auger keeps feeding.
+
+        The device only reports ``NoPellets`` once the fire is out. A grill that
+        keeps cooling at an unchanged set point while the auger runs is an
+        earlier sign, so a suspected flame-out switches to fast polling until it
+        is either confirmed or cleared.
+        """
+
+        grill_actual = int(self.api.get_state_value("GrillActTemp"))
+        grill_set = int(self.api.get_state_value("GrillSetTemp"))
+        if grill_set != self._flame_out_grill_set:
+            self._flame_out_grill_set = grill_set
+            self._flame_out_history.clear()
+
+        history = self._flame_out_history
+        history.append((timestamp, grill_actual))
+        cutoff = timestamp - FLAME_OUT_TREND_WINDOW
+        while history[0][0] < cutoff:
+            history.popleft()
+
+        if self.api.get_state_value("MotorOn"):
+            self._flame_out_auger_on_at = timestamp
+
+        if not self._is_flame_out_pattern(timestamp, grill_actual, grill_set):
+            self._flame_out_suspected_since = None
+            self.update_interval = self._default_update_interval
+            if self._flame_out_detected:
+                self._flame_out_detected = False
+                self._close_flame_out_error(timestamp)
+                self.async_update_listeners()
+            return
+
+        if self._flame_out_detected:
+            return
+
+        if self._flame_out_suspected_since is None:
+            self._flame_out_suspected_since = timestamp
+            self.update_interval = FLAME_OUT_POLL_INTERVAL
+            return
+
+        if timestamp - self._flame_out_suspected_since < FLAME_OUT_CONFIRMATION_WINDOW:
+            return
+
+        self._flame_out_detected = True
+        self.update_interval = self._default_update_interval
+        self._record_cook_error(
+            self._flame_out_suspected_since,
+            "flame_out",
+            "Grill temperature is falling while the auger is feeding",
+        )
+        self.async_update_listeners()
 
-        if tags is not None:
-            session["annotations"]["tags"] = self._normalize_tags(tags)
-        if notes is not ...:
-            session["annotations"]["notes"] = self._normalize_notes(notes)
+    def _is_flame_out_pattern(
+        self, timestamp: datetime, grill_actual: int, grill_set: int
+    ) -> bool:
+        """Return if recent grill readings match the flame-out pattern."""
 
-        await self._store.async_save(self._serialize_store_data())
-        return self._serialize_cook_session(session, include_config_entry=True)
+        if grill_set <= 0 or self._flame_out_auger_on_at is None:
+            return False
+        if timestamp - self._flame_out_auger_on_at > FLAME_OUT_TREND_WINDOW:
+            return False
 
-    async def async_delete_cook(self, cook_id: str) -> bool:
-        """Delete one completed cook and its sampled detail data."""
+        history = self._flame_out_history
+        if history[-1][0] - history[0][0] < FLAME_OUT_TREND_WINDOW / 2:
+            return False
 
-        if self._get_cook_session(cook_id) is None:
+        if self.api.is_fahrenheit():
+            minimum_deficit = FLAME_OUT_MINIMUM_DEFICIT_F
+            trend_threshold = FLAME_OUT_TREND_THRESHOLD_F
+        else:
+            minimum_deficit = FLAME_OUT_MINIMUM_DEFICIT_C
+            trend_threshold = FLAME_OUT_TREND_THRESHOLD_C
+        if grill_set - grill_actual < minimum_deficit:
             return False
 
-        self._cook_sessions = [
-            session for session in self._cook_sessions if session["id"] != cook_id
-        ]
+        if (degrees_per_second := history.slope()) is None:
+            return False
+        return (
+            degrees_per_second * TEMPERATURE_TREND_INTERVAL.total_seconds()
+            <= -trend_threshold
+        )
 
-        detail_store = self._cook_detail_stores.pop(cook_id, None)
-        if detail_store is None:
-            detail_store = self._get_cook_detail_store(cook_id)
-            self._cook_detail_stores.pop(cook_id, None)
+    def _update_probe_etas(self, timestamp: datetime, *, force: bool = False) -> None:
+        """Refresh the published probe ETAs when they move beyond the tolerance."""
 
-        await detail_store.async_remove()
-        await self._store.async_save(self._serialize_store_data())
-        self.async_update_listeners()
-        return True
+        for target_key, actual_key in _PROBE_TARGET_KEYS.items():
+            eta = self._estimate_probe_eta(timestamp, actual_key, target_key)
+            published = self._probe_eta[target_key]
+            if (
+                force
+                or eta is None
+                or published is None
+                or abs(eta - published) > PROBE_ETA_TOLERANCE
+            ):
+                self._probe_eta[target_key] = eta
 
-    def _update_probe_target_reached_times(self, timestamp: datetime) -> None:
-        """Update timestamps for when each probe most recently reached target."""
+    def _estimate_probe_eta(
+        self, timestamp: datetime, actual_key: str, target_key: str
+    ) -> datetime | None:
+        """Extrapolate the current probe trend to its target temperature."""
 
-        probe_target_pairs = {
-            "P1SetTemp": "P1ActTemp",
-            "P2SetTemp": "P2ActTemp",
-        }
-        for target_key, actual_key in probe_target_pairs.items():
-            target = self.get_probe_target_temperature(target_key)
-            actual = int(self.api.get_state_value(actual_key))
+        if (target := self.get_probe_target_temperature(target_key)) is None:
+            return None
 
-            if target is None or actual < target:
-                self._probe_target_reached_at[target_key] = None
-                continue
+        actual = int(self.api.get_state_value(actual_key))
+        if actual <= 0 or actual >= target:
+            return None
 
-            if self._probe_target_reached_at[target_key] is None:
-                self._probe_target_reached_at[target_key] = timestamp
+        history = self._temperature_history[actual_key]
+        if len(history) < 2 or history[-1][0] - history[0][0] < PROBE_ETA_MINIMUM_WINDOW:
+            return None
+
+        # A stalled probe has no meaningful trend to extrapolate.
+        if self.is_probe_stalled(actual_key):
+            return None
+
+        if (degrees_per_second := history.slope()) is None or (
+            degrees_per_second * TEMPERATURE_TREND_INTERVAL.total_seconds()
+            <= STALL_TREND_THRESHOLD
+        ):
+            return None
+
+        return timestamp + timedelta(seconds=(target - actual) / degrees_per_second)
 
     def _update_cook_tracking(self, timestamp: datetime) -> None:
         """Track cook sessions based on Probe 1 being connected for at least an hour."""
@@ -521,14 +1884,20 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
             if self._probe1_absent_since is not None:
                 self._probe1_absent_since = None
                 store_state_changed = True
-            if self._active_cook is None:
+            cook_created = self._active_cook is None
+            if cook_created:
                 self._active_cook = self._create_active_cook(timestamp)
+                self._active_cook_capture = CookCaptureRing(self._capture_poll_limit)
                 self._active_device_error_message = None
                 self._last_update_error_message = None
+                self._active_cook_phase = None
+                self._active_cook_phases = CookPhaseTracker()
+                self._publish_active_cook_header()
                 entity_state_changed = True
                 store_state_changed = True
 
-            if self._record_active_cook_sample(timestamp):
+            sample_changed = self._record_active_cook_sample(timestamp)
+            if sample_changed:
                 store_state_changed = True
 
             self._sync_device_error_state(timestamp)
@@ -564,6 +1933,10 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
                 self.async_update_listeners()
             if store_state_changed:
                 self._schedule_store_save()
+            self._publish_active_cook_progress(
+                header_changed=entity_state_changed and not cook_created,
+                sample_changed=sample_changed,
+            )
             return
 
         self._previous_probe1_stall = False
@@ -589,17 +1962,23 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
             self._active_cook["duration_seconds"] = int(
                 (cook_end - self._active_cook["start"]).total_seconds()
             )
-            self._cook_sessions.append(
-                self._cook_summary_from_active_cook(self._active_cook)
-            )
-            self._schedule_cook_detail_save(completed_cook)
+            self._update_active_cook_duty_cycles(cook_end)
+            self._active_cook["phases"] = self._segment_cook_phases(self._active_cook)
+            session = self._cook_summary_from_active_cook(self._active_cook)
+            self._add_cook_session(session)
+            self._record_cook_change(session.id, session)
+        else:
+            completed_cook = None
 
         self._active_cook = None
+        self._active_cook_capture = CookCaptureRing(self._capture_poll_limit)
         self._probe1_absent_since = None
         self._active_device_error_message = None
         self._last_update_error_message = None
+        self._reset_journal_position()
         self.async_update_listeners()
-        self._schedule_store_save()
+        self._publish_active_cook_header()
+        self._create_archive_task(self._async_compact_cook_journal(completed_cook))
 
     def _create_active_cook(self, timestamp: datetime) -> CookSession:
         """Create a new active cook session."""
@@ -617,32 +1996,106 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
             "annotations": _default_cook_annotations(),
             "errors": [],
             "samples": [],
+            "rollups": [],
+            "state_transitions": {name: [] for name in _CAPTURED_STATE_KEYS.values()},
             "last_sample_bucket": None,
         }
 
     def _record_active_cook_sample(self, timestamp: datetime) -> bool:
-        """Record or replace the current 5-minute sample for the active cook."""
+        """Record or replace the current 5-minute sample for the active cook.
+
+        Every poll is also kept in the bounded full-resolution capture ring and
+        folded into the min/max/mean rollup for its bucket. Returns whether the
+        bucket sample, summary or device states changed; rollup updates alone
+        are persisted with the next such change.
+        """
 
         if self._active_cook is None:
             return False
 
         sample = self._build_cook_sample(timestamp)
-        summary_changed = self._update_active_cook_summary(sample)
+        changed = self._update_active_cook_summary(sample)
         bucket = self._get_sample_bucket(timestamp)
+        self._active_cook_capture.append(sample)
+        self._update_active_cook_rollup(bucket, sample)
+        if self._record_active_cook_state_transitions(timestamp):
+            changed = True
         samples = self._active_cook["samples"]
-        sample_changed = False
 
         if samples and self._active_cook["last_sample_bucket"] == bucket:
-            if samples[-1] != sample:
+            # A poll repeating the bucket's readings keeps the stored sample.
+            if {**samples[-1], "timestamp": timestamp} != sample:
                 samples[-1] = sample
-                sample_changed = True
+                changed = True
         else:
             samples.append(sample)
             self._active_cook["last_sample_bucket"] = bucket
-            sample_changed = True
+            changed = True
 
         self._active_cook["summary"]["sample_count"] = len(samples)
-        return sample_changed or summary_changed
+        return changed
+
+    def _update_active_cook_rollup(self, bucket: datetime, sample: CookSample) -> None:
+        """Fold one poll into the min/max/mean rollup for its sample bucket."""
+
+        rollups = self._active_cook.setdefault("rollups", [])
+        if not rollups or rollups[-1]["timestamp"] != bucket:
+            rollups.append(
+                {
+                    "timestamp": bucket,
+                    "count": 0,
+                    **{
+                        f"{channel}_{stat}": sample[channel]
+                        for channel in ROLLUP_CHANNELS
+                        for stat in ("min", "max", "mean")
+                    },
+                }
+            )
+
+        rollup = rollups[-1]
+        rollup["count"] += 1
+        for channel in ROLLUP_CHANNELS:
+            value = sample[channel]
+            rollup[f"{channel}_min"] = min(rollup[f"{channel}_min"], value)
+            rollup[f"{channel}_max"] = max(rollup[f"{channel}_max"], value)
+            rollup[f"{channel}_mean"] += (
+                value - rollup[f"{channel}_mean"]
+            ) / rollup["count"]
+
+    def _record_active_cook_state_transitions(self, timestamp: datetime) -> bool:
+        """Append run-length transitions for on/off device states that changed.
+
+        Returns whether any transition was appended.
+        """
+
+        transitions = self._active_cook.setdefault(
+            "state_transitions", {name: [] for name in _CAPTURED_STATE_KEYS.values()}
+        )
+        changed = False
+        for state_key, name in _CAPTURED_STATE_KEYS.items():
+            value = bool(self.api.get_state_value(state_key))
+            runs = transitions.setdefault(name, [])
+            if not runs or runs[-1][1] != value:
+                runs.append((timestamp, value))
+                changed = True
+        return changed
+
+    def _update_active_cook_duty_cycles(self, end: datetime) -> None:
+        """Summarize each captured state as its on-time percentage of the cook."""
+
+        summary = self._active_cook["summary"]
+        total_seconds = (end - self._active_cook["start"]).total_seconds()
+        for name, runs in self._active_cook.get("state_transitions", {}).items():
+            if total_seconds <= 0 or not runs:
+                summary[f"{name}_duty_cycle"] = None
+                continue
+
+            on_seconds = 0.0
+            run_ends = [run[0] for run in runs[1:]] + [end]
+            for (timestamp, value), run_end in zip(runs, run_ends, strict=True):
+                if value:
+                    on_seconds += (min(run_end, end) - timestamp).total_seconds()
+            summary[f"{name}_duty_cycle"] = round(100 * on_seconds / total_seconds, 1)
 
     def _build_cook_sample(self, timestamp: datetime) -> CookSample:
         """Build the current cook sample from the latest device state."""
@@ -671,13 +2124,13 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
         if source == "update" and self._last_update_error_message == normalized_message:
             return
 
-        self._active_cook.setdefault("errors", []).append(
-            {
-                "timestamp": timestamp,
-                "source": source,
-                "message": normalized_message,
-            }
-        )
+        error: CookError = {
+            "timestamp": timestamp,
+            "source": source,
+            "message": normalized_message,
+        }
+        self._active_cook.setdefault("errors", []).append(error)
+        self._publish_active_cook_error(error)
         if source == "update":
             self._last_update_error_message = normalized_message
         self._schedule_store_save()
@@ -695,11 +2148,25 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
                 and error.get("end") is None
             ):
                 error["end"] = timestamp
+                self._publish_active_cook_error(error)
                 self._schedule_store_save()
                 break
 
         self._active_device_error_message = None
 
+    def _close_flame_out_error(self, timestamp: datetime) -> None:
+        """Close the open flame-out warning range, if one was recorded."""
+
+        if self._active_cook is None:
+            return
+
+        for error in reversed(self._active_cook.get("errors", [])):
+            if error.get("source") == "flame_out" and error.get("end") is None:
+                error["end"] = timestamp
+                self._publish_active_cook_error(error)
+                self._schedule_store_save()
+                break
+
     def _sync_device_error_state(self, timestamp: datetime) -> None:
         """Track device-reported error state changes for the active cook."""
 
@@ -758,89 +2225,264 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
             microsecond=0,
         )
 
-    def _cook_summary_from_active_cook(self, active_cook: CookSession) -> CookSession:
+    def _cook_summary_from_active_cook(
+        self, active_cook: CookSession
+    ) -> CookIndexEntry:
         """Return the immutable summary stored for a completed cook."""
 
-        return {
-            "id": active_cook["id"],
-            "start": active_cook["start"],
-            "confirmed_start": active_cook["confirmed_start"],
-            "end": active_cook["end"],
-            "duration_seconds": active_cook["duration_seconds"],
-            "done_at": active_cook["done_at"],
-            "stall_count": active_cook["stall_count"],
-            "unit": active_cook["unit"],
-            "summary": dict(active_cook["summary"]),
-            "annotations": {
-                "tags": list(active_cook["annotations"]["tags"]),
-                "notes": active_cook["annotations"]["notes"],
-            },
-        }
+        return CookIndexEntry.from_cook(active_cook)
 
-    def _get_cook_session(self, cook_id: str) -> CookSession | None:
-        """Return a completed cook session by id."""
+    def _segment_cook_phases(self, active_cook: CookSession) -> list[CookPhase]:
+        """Split a finished cook into preheat, smoke, stall, finish and rest phases.
+
+        Samples are labelled in a single pass and consecutive samples with the
+        same label are merged into one phase that ends where the next begins.
+        """
 
-        for session in self._cook_sessions:
-            if session["id"] == cook_id:
-                return session
-        return None
+        tolerance = _preheat_tolerance(active_cook)
+        done_at = active_cook["done_at"]
+        phases: list[CookPhase] = []
+        preheated = False
+        stalled = False
 
-    def _get_cook_detail_store(self, cook_id: str) -> Store[dict[str, Any]]:
-        """Return the per-cook detail store for a completed cook."""
+        for sample in active_cook.get("samples", []):
+            timestamp = sample["timestamp"]
+            phase, preheated, stalled = _label_cook_sample(
+                sample, done_at, tolerance, preheated, stalled
+            )
+            if phases and phases[-1]["phase"] == phase:
+                continue
+            if phases:
+                phases[-1]["end"] = timestamp
+            phases.append({"phase": phase, "start": timestamp, "end": None})
 
-        if cook_id not in self._cook_detail_stores:
-            cook_hash = hashlib.sha1(
-                cook_id.encode(), usedforsecurity=False
-            ).hexdigest()
-            self._cook_detail_stores[cook_id] = Store(
-                self.hass,
-                COOK_DETAIL_STORAGE_VERSION,
-                f"{DOMAIN}_{self.config_entry.entry_id}_cook_detail_{cook_hash}",
+        if phases:
+            phases[0]["start"] = active_cook["start"]
+            phases[-1]["end"] = active_cook["end"]
+
+        return phases
+
+    def _publish_active_cook_event(self, event_type: str, **data: Any) -> None:
+        """Send one incremental active-cook event to every subscriber."""
+
+        for listener in list(self._active_cook_listeners):
+            listener({"type": event_type, **data})
+
+    def _publish_active_cook_header(self) -> None:
+        """Send the active cook without its trace, or None once it has ended."""
+
+        if not self._active_cook_listeners:
+            return
+
+        self._publish_active_cook_event(
+            "cook",
+            cook=(
+                None
+                if self._active_cook is None
+                else self._serialize_active_cook_event_header()
+            ),
+        )
+
+    def _publish_active_cook_progress(
+        self, header_changed: bool, sample_changed: bool
+    ) -> None:
+        """Send the latest sample if it changed, and the phase once it changes.
+
+        The latest sample either extends the trace or replaces the sample of
+        the current bucket; its index tells subscribers which. A poll that
+        repeats the stored readings sends nothing.
+        """
+
+        if not self._active_cook_listeners:
+            return
+
+        if header_changed:
+            self._publish_active_cook_header()
+        samples = self._active_cook["samples"]
+        if sample_changed and samples:
+            self._publish_active_cook_event(
+                "sample",
+                index=len(samples) - 1,
+                sample=self._serialize_cook_sample(samples[-1]),
+                summary=dict(self._active_cook["summary"]),
+            )
+        current = self._active_cook_phases.current(self._active_cook)
+        if current is not None and current[1]["phase"] != self._active_cook_phase:
+            index, phase = current
+            self._active_cook_phase = phase["phase"]
+            self._publish_active_cook_event(
+                "phase", index=index, phase=self._serialize_cook_phase(phase)
             )
 
-        return self._cook_detail_stores[cook_id]
+    def _publish_active_cook_error(self, error: CookError) -> None:
+        """Send a newly recorded or newly closed active-cook error."""
+
+        if not self._active_cook_listeners:
+            return
+
+        errors = self._active_cook["errors"]
+        index = next(
+            position
+            for position in range(len(errors) - 1, -1, -1)
+            if errors[position] is error
+        )
+        self._publish_active_cook_event(
+            "error", index=index, error=self._serialize_cook_error(error)
+        )
+
+    def _get_cook_session(self, cook_id: str) -> CookIndexEntry | None:
+        """Return a completed cook session by id."""
+
+        return self._cook_sessions.get(cook_id)
+
+    async def _async_get_cook_sessions(
+        self, cook_ids: list[str]
+    ) -> list[CookIndexEntry]:
+        """Return the completed cooks with the given ids, skipping unknown ones."""
+
+        return [
+            session
+            for cook_id in dict.fromkeys(cook_ids)
+            if (session := await self._async_get_cook_session(cook_id)) is not None
+        ]
+
+    async def _async_get_cook_session(self, cook_id: str) -> CookIndexEntry | None:
+        """Return a completed cook session by id from either backend."""
+
+        if self._cook_database is None:
+            return self._get_cook_session(cook_id)
+
+        stored_session = await self._cook_database.async_get_session(cook_id)
+        return (
+            None
+            if stored_session is None
+            else CookIndexEntry.from_stored(stored_session)
+        )
+
+    async def _async_convert_cook_data[_T](
+        self, rows: int, func: Callable[..., _T], *args: Any
+    ) -> _T:
+        """Convert bulk cook data to or from its stored form.
+
+        Conversions of ``COOK_EXECUTOR_ROW_THRESHOLD`` rows or more run in the
+        executor so building dicts and parsing timestamps does not stall the
+        event loop; smaller ones stay inline to avoid the thread hand-off.
+        """
+
+        if rows < COOK_EXECUTOR_ROW_THRESHOLD:
+            return func(*args)
+        return await self.hass.async_add_executor_job(func, *args)
 
     async def _async_load_cook_detail(self, cook_id: str) -> CookDetail:
-        """Load the detail record for a completed cook."""
+        """Load the detail record for a completed cook.
+
+        Recently decoded records are served from a small LRU cache.
+        """
+
+        if (detail := self._cook_detail_cache.get(cook_id)) is not None:
+            return detail
 
         if (
-            stored_detail := await self._get_cook_detail_store(cook_id).async_load()
+            stored_detail := await self._detail_archive.async_load(cook_id)
         ) is None:
-            return {"id": cook_id, "samples": [], "errors": []}
+            return {
+                "id": cook_id,
+                "samples": [],
+                "errors": [],
+                "rollups": [],
+                "state_transitions": {},
+            }
+
+        detail = await self._async_convert_cook_data(
+            len(stored_detail.get("samples", {}).get("timestamp", []))
+            + len(stored_detail.get("rollups", {}).get("timestamp", [])),
+            self._deserialize_cook_detail,
+            stored_detail,
+        )
+        self._cook_detail_cache.put(cook_id, detail)
+        return detail
+
+    def _deserialize_cook_detail(self, stored_detail: dict[str, Any]) -> CookDetail:
+        """Decode the stored columnar detail record of a completed cook."""
 
         return {
             "id": stored_detail["id"],
-            "samples": [
-                self._deserialize_cook_sample(sample)
-                for sample in stored_detail.get("samples", [])
-            ],
+            "samples": decode_columns(
+                stored_detail.get("samples", {}),
+                SAMPLE_DELTA_COLUMNS,
+                SAMPLE_PLAIN_COLUMNS,
+            ),
             "errors": [
                 self._deserialize_cook_error(error)
                 for error in stored_detail.get("errors", [])
             ],
+            "rollups": decode_columns(
+                stored_detail.get("rollups", {}),
+                ROLLUP_DELTA_COLUMNS,
+                ROLLUP_PLAIN_COLUMNS,
+            ),
+            "state_transitions": self._deserialize_state_transitions(
+                stored_detail.get("state_transitions", {})
+            ),
         }
 
-    def _schedule_cook_detail_save(self, active_cook: CookSession) -> None:
-        """Persist sampled detail data for a completed cook."""
+    async def _async_compact_cook_journal(
+        self, completed_cook: CookSession | None
+    ) -> None:
+        """Fold a finished cook into the archive, then discard its journal."""
+
+        async def _async_persist_completed_cook() -> None:
+            if completed_cook is None:
+                await self._async_save_cook_index()
+                return
+
+            self._cook_detail_cache.pop(completed_cook["id"])
+            # The closed cook is no longer mutated, so it can be encoded off-loop.
+            detail = await self._async_convert_cook_data(
+                len(completed_cook.get("samples", []))
+                + len(completed_cook.get("rollups", [])),
+                self._serialize_cook_detail,
+                completed_cook,
+            )
+            if self._cook_database is not None:
+                await self._cook_database.async_save_cook(
+                    self._cook_summary_from_active_cook(completed_cook).as_stored(),
+                    detail,
+                )
+            else:
+                await self._detail_archive.async_save(completed_cook["id"], detail)
+            await self._async_save_cook_index()
 
-        detail_store = self._get_cook_detail_store(active_cook["id"])
-        detail_store.async_delay_save(
-            lambda: self._serialize_cook_detail(active_cook), COOK_STORAGE_SAVE_DELAY
-        )
+        await self._journal.async_compact(_async_persist_completed_cook)
 
     def _serialize_cook_detail(self, active_cook: CookSession) -> CookDetail:
-        """Serialize the sampled detail data for a completed cook."""
+        """Serialize the sampled detail data for a completed cook.
+
+        Samples and rollups are stored as one delta-encoded array per channel.
+        """
 
         return {
             "id": active_cook["id"],
-            "samples": [
-                self._serialize_cook_sample(sample)
-                for sample in active_cook.get("samples", [])
-            ],
+            "samples": encode_columns(
+                active_cook.get("samples", []),
+                SAMPLE_DELTA_COLUMNS,
+                SAMPLE_PLAIN_COLUMNS,
+            ),
             "errors": [
                 self._serialize_cook_error(error)
                 for error in active_cook.get("errors", [])
             ],
+            "rollups": encode_columns(
+                [
+                    self._round_cook_rollup(rollup)
+                    for rollup in active_cook.get("rollups", [])
+                ],
+                ROLLUP_DELTA_COLUMNS,
+                ROLLUP_PLAIN_COLUMNS,
+            ),
+            "state_transitions": self._serialize_state_transitions(
+                active_cook.get("state_transitions", {})
+            ),
         }
 
     def _serialize_cook_sample(self, sample: CookSample) -> dict[str, Any]:
@@ -864,6 +2506,54 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
 
         return deserialized
 
+    def _round_cook_rollup(self, rollup: CookRollup) -> CookRollup:
+        """Return a rollup with its running means rounded for storage."""
+
+        rounded = dict(rollup)
+        for channel in ROLLUP_CHANNELS:
+            rounded[f"{channel}_mean"] = round(rollup[f"{channel}_mean"], 2)
+
+        return rounded
+
+    def _serialize_cook_rollup(self, rollup: CookRollup) -> dict[str, Any]:
+        """Serialize one per-bucket min/max/mean rollup."""
+
+        return {
+            **self._round_cook_rollup(rollup),
+            "timestamp": rollup["timestamp"].isoformat(),
+        }
+
+    def _deserialize_cook_rollup(self, rollup: dict[str, Any]) -> CookRollup:
+        """Deserialize one per-bucket min/max/mean rollup."""
+
+        return {
+            **rollup,
+            "timestamp": datetime.fromisoformat(rollup["timestamp"]),
+        }
+
+    def _serialize_state_transitions(
+        self, transitions: CookStateTransitions
+    ) -> dict[str, list[list[Any]]]:
+        """Serialize run-length state transitions as compact timestamp/value pairs."""
+
+        return {
+            name: [[timestamp.isoformat(), value] for timestamp, value in runs]
+            for name, runs in transitions.items()
+        }
+
+    def _deserialize_state_transitions(
+        self, transitions: dict[str, list[list[Any]]]
+    ) -> CookStateTransitions:
+        """Deserialize run-length state transitions."""
+
+        return {
+            name: [
+                (datetime.fromisoformat(timestamp), bool(value))
+                for timestamp, value in runs
+            ]
+            for name, runs in transitions.items()
+        }
+
     def _serialize_cook_error(self, error: CookError) -> dict[str, Any]:
         """Serialize one cook-time error entry."""
 
@@ -900,8 +2590,9 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
             return
 
         self._temperature_history = {
-            "P1ActTemp": deque(),
-            "P2ActTemp": deque(),
+            "GrillActTemp": TemperatureTrendWindow(),
+            "P1ActTemp": TemperatureTrendWindow(),
+            "P2ActTemp": TemperatureTrendWindow(),
         }
 
         samples = self._active_cook.get("samples", [])
@@ -916,6 +2607,9 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
         for sample in samples:
             if sample["timestamp"] < cutoff:
                 continue
+            self._temperature_history["GrillActTemp"].append(
+                (sample["timestamp"], sample["grill_actual"])
+            )
             self._temperature_history["P1ActTemp"].append(
                 (sample["timestamp"], sample["probe1_actual"])
             )
@@ -959,29 +2653,255 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
         return cleaned or None
 
     def _schedule_store_save(self) -> None:
-        """Persist cook session state with a small write delay."""
+        """Persist cook session state with a small write delay.
 
-        self._store.async_delay_save(
-            self._serialize_store_data, COOK_STORAGE_SAVE_DELAY
-        )
+        Changes to the active cook are appended to its journal; the archive
+        index itself is only rewritten when completed sessions change.
+        """
+
+        if self._active_cook is not None:
+            self._journal.async_delay_append(
+                self._active_cook_journal_records, COOK_JOURNAL_SAVE_DELAY
+            )
+            return
+
+        if self._dirty_cook_segments:
+            self._create_archive_task(self._async_save_cook_index())
+
+    @callback
+    def _create_archive_task(self, target: Coroutine[Any, Any, None]) -> None:
+        """Start an archive write that closing the archive waits for."""
+
+        task = self.hass.async_create_task(target)
+        self._pending_archive_tasks.add(task)
+        task.add_done_callback(self._pending_archive_tasks.discard)
 
     def _serialize_store_data(self) -> dict[str, Any]:
-        """Return cook session data for storage."""
+        """Return the list of month segments that make up the archive index."""
 
-        return {
-            "sessions": [
-                self._serialize_cook_session(session) for session in self._cook_sessions
-            ],
-            "active_session": (
-                None
-                if self._active_cook is None
-                else self._serialize_active_cook(self._active_cook)
-            ),
+        return {"segments": sorted(self._cook_segments)}
+
+    def _get_cook_segment_key(self, session: CookIndexEntry) -> str:
+        """Return the month segment a completed cook is indexed under."""
+
+        return session.start_datetime.strftime("%Y-%m")
+
+    def _get_cook_segment_store(self, segment: str) -> Store[dict[str, Any]]:
+        """Return the storage object for one month segment of the index."""
+
+        if segment not in self._cook_segment_stores:
+            self._cook_segment_stores[segment] = PitbossCookSegmentStore(
+                self.hass,
+                COOK_SEGMENT_STORAGE_VERSION,
+                f"{DOMAIN}_{self.config_entry.entry_id}_cook_sessions_{segment}",
+            )
+
+        return self._cook_segment_stores[segment]
+
+    def _add_cook_session(self, session: CookIndexEntry) -> None:
+        """Add a completed cook to the index and mark its segment dirty."""
+
+        if self._cook_database is not None:
+            self._cook_sessions = CookIndex.from_entries([session])
+            return
+
+        segment = self._get_cook_segment_key(session)
+        if segment not in self._cook_segments:
+            self._cook_segments[segment] = []
+            self._cook_segment_list_changed = True
+        self._cook_segments[segment].append(session)
+        self._cook_sessions.add(session)
+        self._cook_catalog.add(self.config_entry.entry_id, session)
+        self._dirty_cook_segments.add(segment)
+
+    def _remove_cook_session(self, session: CookIndexEntry) -> None:
+        """Remove a completed cook from the index and mark its segment dirty."""
+
+        self._cook_sessions.remove(session.id)
+        if self._cook_database is not None:
+            return
+
+        self._cook_catalog.remove(self.config_entry.entry_id, session)
+
+        segment = self._get_cook_segment_key(session)
+        self._cook_segments[segment] = [
+            other
+            for other in self._cook_segments[segment]
+            if other.id != session.id
+        ]
+        if not self._cook_segments[segment]:
+            del self._cook_segments[segment]
+            self._cook_segment_list_changed = True
+        self._dirty_cook_segments.add(segment)
+
+    async def _async_save_cook_index(self) -> None:
+        """Rewrite dirty index segments, and the segment list if it changed."""
+
+        dirty_segments = sorted(self._dirty_cook_segments)
+        self._dirty_cook_segments.clear()
+        for segment in dirty_segments:
+            segment_store = self._get_cook_segment_store(segment)
+            if segment in self._cook_segments:
+                await segment_store.async_save(
+                    {
+                        "sessions": [
+                            session.as_stored()
+                            for session in self._cook_segments[segment]
+                        ]
+                    }
+                )
+            else:
+                await segment_store.async_remove()
+                self._cook_segment_stores.pop(segment, None)
+
+        if self._cook_segment_list_changed:
+            self._cook_segment_list_changed = False
+            await self._store.async_save(self._serialize_store_data())
+
+    def _reset_journal_position(self) -> None:
+        """Forget what has been journaled so the next cook starts from scratch."""
+
+        self._journaled_header = None
+        self._journaled_summary = None
+        self._journaled_errors = []
+        self._journaled_samples = 0
+        self._journaled_rollups = 0
+        self._journaled_transitions = {}
+        self._journaled_capture = 0
+
+    def _mark_active_cook_journaled(self) -> None:
+        """Record that the restored active cook is already fully journaled."""
+
+        self._journaled_header = self._serialize_active_cook_header(self._active_cook)
+        self._journaled_summary = dict(self._active_cook["summary"])
+        self._journaled_errors = [
+            self._serialize_cook_error(error) for error in self._active_cook["errors"]
+        ]
+        self._journaled_samples = len(self._active_cook["samples"])
+        self._journaled_rollups = len(self._active_cook.get("rollups", []))
+        self._journaled_transitions = {
+            name: len(runs)
+            for name, runs in self._active_cook.get("state_transitions", {}).items()
         }
+        self._journaled_capture = self._active_cook_capture.appended
 
-    def _serialize_cook_session(
-        self, session: CookSession, *, include_config_entry: bool = False
-    ) -> dict[str, Any]:
+    def _active_cook_journal_records(self) -> list[JournalRecord]:
+        """Return journal records for active-cook changes since the last append.
+
+        The newest sample and rollup are rewritten in place until their bucket
+        closes, so each append repeats them; older entries are never resent.
+        The summary and each error are only written again when they change.
+        """
+
+        if (active_cook := self._active_cook) is None:
+            return []
+
+        records: list[JournalRecord] = []
+        header = self._serialize_active_cook_header(active_cook)
+        if header != self._journaled_header:
+            records.append({"type": "header", "cook": header})
+            self._journaled_header = header
+
+        summary = active_cook["summary"]
+        if summary != self._journaled_summary:
+            records.append({"type": "summary", "summary": dict(summary)})
+            self._journaled_summary = dict(summary)
+
+        for index, error in enumerate(active_cook["errors"]):
+            serialized_error = self._serialize_cook_error(error)
+            if index < len(self._journaled_errors):
+                if self._journaled_errors[index] == serialized_error:
+                    continue
+                self._journaled_errors[index] = serialized_error
+            else:
+                self._journaled_errors.append(serialized_error)
+            records.append({"type": "error", "index": index, "error": serialized_error})
+
+        samples = active_cook["samples"]
+        for index in range(max(self._journaled_samples - 1, 0), len(samples)):
+            records.append(
+                {
+                    "type": "sample",
+                    "index": index,
+                    "sample": self._serialize_cook_sample(samples[index]),
+                }
+            )
+        self._journaled_samples = len(samples)
+
+        rollups = active_cook.get("rollups", [])
+        for index in range(max(self._journaled_rollups - 1, 0), len(rollups)):
+            records.append(
+                {
+                    "type": "rollup",
+                    "index": index,
+                    "rollup": self._serialize_cook_rollup(rollups[index]),
+                }
+            )
+        self._journaled_rollups = len(rollups)
+
+        for name, runs in active_cook.get("state_transitions", {}).items():
+            for index in range(self._journaled_transitions.get(name, 0), len(runs)):
+                timestamp, value = runs[index]
+                records.append(
+                    {
+                        "type": "transition",
+                        "name": name,
+                        "index": index,
+                        "transition": [timestamp.isoformat(), value],
+                    }
+                )
+            self._journaled_transitions[name] = len(runs)
+
+        capture = self._active_cook_capture
+        if polls := capture.rows(self._journaled_capture):
+            records.append(
+                {
+                    "type": "capture",
+                    "polls": encode_columns(polls, SAMPLE_DELTA_COLUMNS),
+                }
+            )
+        self._journaled_capture = capture.appended
+
+        return records
+
+    def _replay_active_cook_journal(
+        self, records: list[JournalRecord]
+    ) -> dict[str, Any] | None:
+        """Rebuild the serialized active cook from its journal records."""
+
+        session: dict[str, Any] | None = None
+        for record in records:
+            record_type = record.get("type")
+            if record_type == "header":
+                if session is None or session["id"] != record["cook"]["id"]:
+                    session = {
+                        "errors": [],
+                        "samples": [],
+                        "rollups": [],
+                        "state_transitions": {},
+                        "capture": [],
+                    }
+                session.update(record["cook"])
+            elif session is None:
+                continue
+            elif record_type == "summary":
+                session["summary"] = record["summary"]
+            elif record_type in ("error", "sample", "rollup"):
+                _put_journaled_value(
+                    session[f"{record_type}s"], record["index"], record[record_type]
+                )
+            elif record_type == "transition":
+                _put_journaled_value(
+                    session["state_transitions"].setdefault(record["name"], []),
+                    record["index"],
+                    record["transition"],
+                )
+            elif record_type == "capture":
+                session["capture"].append(record["polls"])
+
+        return session
+
+    def _serialize_cook_session(self, session: CookSession) -> dict[str, Any]:
         """Serialize a cook session for storage."""
 
         serialized = {
@@ -997,6 +2917,9 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
                 None if session["done_at"] is None else session["done_at"].isoformat()
             ),
             "summary": dict(session.get("summary", _default_cook_summary_metrics())),
+            "phases": [
+                self._serialize_cook_phase(phase) for phase in session.get("phases", [])
+            ],
             "annotations": {
                 "tags": list(
                     session.get("annotations", _default_cook_annotations())["tags"]
@@ -1010,32 +2933,72 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
             ],
         }
 
-        if include_config_entry:
-            serialized["config_entry_id"] = self.config_entry.entry_id
+        return serialized
+
+    def _serialize_cook_entry(self, session: CookIndexEntry) -> dict[str, Any]:
+        """Serialize a completed cook index entry for the API."""
 
+        serialized = session.as_api()
+        serialized["summary"] = {
+            **_default_cook_summary_metrics(),
+            **serialized["summary"],
+        }
+        serialized["config_entry_id"] = self.config_entry.entry_id
         return serialized
 
-    def _serialize_active_cook(self, session: CookSession) -> dict[str, Any]:
-        """Serialize the active cook including sampled trace data."""
+    def _serialize_cook_phase(self, phase: CookPhase) -> dict[str, Any]:
+        """Serialize one phase of a cook."""
 
         return {
-            **self._serialize_cook_session(session),
-            "samples": [
-                self._serialize_cook_sample(sample)
-                for sample in session.get("samples", [])
-            ],
-            "probe1_absent_since": (
-                None
-                if self._probe1_absent_since is None
-                else self._probe1_absent_since.isoformat()
-            ),
-            "last_sample_bucket": (
-                None
-                if session.get("last_sample_bucket") is None
-                else session["last_sample_bucket"].isoformat()
-            ),
+            **phase,
+            "start": phase["start"].isoformat(),
+            "end": None if phase["end"] is None else phase["end"].isoformat(),
         }
 
+    def _serialize_active_cook_event_header(self) -> dict[str, Any]:
+        """Serialize the active cook without its trace for subscribers."""
+
+        header = self._serialize_active_cook_header(self._active_cook)
+        header.pop("last_sample_bucket", None)
+        header["config_entry_id"] = self.config_entry.entry_id
+        return header
+
+    def _serialize_active_cook_header(self, session: CookSession) -> dict[str, Any]:
+        """Serialize the active cook without its summary and collections."""
+
+        header = self._serialize_cook_session(session)
+        for key in (
+            "summary",
+            "errors",
+            "samples",
+            "rollups",
+            "state_transitions",
+            "capture",
+        ):
+            header.pop(key, None)
+
+        header["probe1_absent_since"] = (
+            None
+            if self._probe1_absent_since is None
+            else self._probe1_absent_since.isoformat()
+        )
+        header["last_sample_bucket"] = (
+            None
+            if session.get("last_sample_bucket") is None
+            else session["last_sample_bucket"].isoformat()
+        )
+        return header
+
+    def _deserialize_cook_sessions(
+        self, sessions: list[dict[str, Any]]
+    ) -> list[CookIndexEntry]:
+        """Build index entries from stored cook sessions, oldest first."""
+
+        return sorted(
+            (CookIndexEntry.from_stored(session) for session in sessions),
+            key=lambda session: session.start,
+        )
+
     def _deserialize_cook_session(self, session: dict[str, Any]) -> CookSession:
         """Deserialize a cook session from storage."""
 
@@ -1062,6 +3025,18 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
                 **_default_cook_summary_metrics(),
                 **session.get("summary", {}),
             },
+            "phases": [
+                {
+                    **phase,
+                    "start": datetime.fromisoformat(phase["start"]),
+                    "end": (
+                        None
+                        if phase["end"] is None
+                        else datetime.fromisoformat(phase["end"])
+                    ),
+                }
+                for phase in session.get("phases", [])
+            ],
             "annotations": {
                 "tags": list(session.get("annotations", {}).get("tags", [])),
                 "notes": session.get("annotations", {}).get("notes"),
@@ -1080,6 +3055,13 @@ class PitbossDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):
             self._deserialize_cook_sample(sample)
             for sample in session.get("samples", [])
         ]
+        deserialized["rollups"] = [
+            self._deserialize_cook_rollup(rollup)
+            for rollup in session.get("rollups", [])
+        ]
+        deserialized["state_transitions"] = self._deserialize_state_transitions(
+            session.get("state_transitions", {})
+        )
         deserialized["last_sample_bucket"] = (
             None
             if session.get("last_sample_bucket") is None
@@ -0,0 +1,479 @@
+"""SQLite-backed archive for completed Pit Boss cooks."""
+
+import asyncio
+from collections.abc import Callable
+import contextlib
+import os
+import sqlite3
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util.json import json_loads
+
+from .codec import (
+    SAMPLE_DELTA_COLUMNS,
+    SAMPLE_PLAIN_COLUMNS,
+    decode_columns,
+    encode_epoch_rows,
+    to_epoch_microseconds,
+)
+from .const import COOK_SORT_DURATION, DOMAIN
+from .index import CookQuery
+
+type StoredCookDetail = dict[str, Any]
+type StoredCookSession = dict[str, Any]
+
+_SCHEMA = """
+PRAGMA foreign_keys = ON;
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    start_us INTEGER NOT NULL,
+    end_us INTEGER,
+    duration_seconds INTEGER,
+    record TEXT NOT NULL,
+    detail TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_start ON sessions (start_us);
+CREATE INDEX IF NOT EXISTS sessions_duration ON sessions (duration_seconds);
+CREATE TABLE IF NOT EXISTS session_tags (
+    session_id TEXT NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (session_id, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS session_tags_tag ON session_tags (tag, session_id);
+CREATE TABLE IF NOT EXISTS samples (
+    session_id TEXT NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    timestamp_us INTEGER NOT NULL,
+    grill_actual INTEGER NOT NULL,
+    grill_set INTEGER NOT NULL,
+    probe1_actual INTEGER NOT NULL,
+    probe2_actual INTEGER NOT NULL,
+    probe1_stalled INTEGER,
+    PRIMARY KEY (session_id, timestamp_us)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS errors (
+    session_id TEXT NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    end_timestamp TEXT,
+    source TEXT NOT NULL,
+    message TEXT NOT NULL,
+    PRIMARY KEY (session_id, position)
+) WITHOUT ROWID;
+"""
+_SAMPLE_COLUMNS = ("timestamp", *SAMPLE_DELTA_COLUMNS, *SAMPLE_PLAIN_COLUMNS)
+
+
+class SqliteCookArchive:
+    """Cook sessions and their sampled detail in one SQLite database per entry.
+
+    The connection is only used from the executor, one call at a time.
+    Sessions keep their stored JSON in ``record`` next to the indexed
+    columns, so listing never rebuilds them from the detail tables.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the archive for one config entry."""
+
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, f"{DOMAIN}_{entry_id}_cooks.db")
+        self._connection: sqlite3.Connection | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_open(self) -> None:
+        """Open the database and create its schema."""
+
+        await self._async_run(lambda connection: None)
+
+    async def async_close(self) -> None:
+        """Close the database connection."""
+
+        async with self._lock:
+            if self._connection is not None:
+                await self.hass.async_add_executor_job(self._connection.close)
+                self._connection = None
+
+    async def async_exists(self) -> bool:
+        """Return whether the database file has been created."""
+
+        return await self.hass.async_add_executor_job(os.path.exists, self.path)
+
+    async def async_remove_database(self) -> None:
+        """Close the database and delete its files."""
+
+        await self.async_close()
+        await self.hass.async_add_executor_job(self._remove_files)
+
+    async def async_count_sessions(self) -> int:
+        """Return the number of archived cooks."""
+
+        return await self._async_run(
+            lambda connection: connection.execute(
+                "SELECT COUNT(*) FROM sessions"
+            ).fetchone()[0]
+        )
+
+    async def async_list_sessions(
+        self, limit: int | None = None
+    ) -> list[StoredCookSession]:
+        """Return stored sessions newest first using the start-time index."""
+
+        def _list(connection: sqlite3.Connection) -> list[StoredCookSession]:
+            rows = connection.execute(
+                "SELECT record FROM sessions ORDER BY start_us DESC LIMIT ?",
+                (-1 if limit is None else limit,),
+            )
+            return [json_loads(record) for (record,) in rows]
+
+        return await self._async_run(_list)
+
+    async def async_list_retention_candidates(
+        self,
+        keep_cooks: int,
+        started_before: int | None,
+        drop_unannotated: bool,
+        limit: int,
+    ) -> list[StoredCookSession]:
+        """Return up to ``limit`` sessions, newest first, retention acts on.
+
+        Only sessions past the newest ``keep_cooks`` that started before
+        ``started_before`` qualify. Downsampled sessions are left out unless
+        they are unannotated and ``drop_unannotated`` is set.
+        """
+
+        pending = "NOT coalesce(json_extract(record, '$.detail_downsampled'), 0)"
+        if drop_unannotated:
+            pending = (
+                f"({pending} OR (NOT EXISTS (SELECT 1 FROM session_tags"
+                " WHERE session_id = expired.id)"
+                " AND coalesce(json_extract(record, '$.annotations.notes'), '')"
+                " = ''))"
+            )
+        clauses = [pending]
+        params: list[Any] = [keep_cooks]
+        if started_before is not None:
+            clauses.append("start_us < ?")
+            params.append(started_before)
+        params.append(limit)
+
+        def _list(connection: sqlite3.Connection) -> list[StoredCookSession]:
+            rows = connection.execute(
+                "SELECT record FROM (SELECT id, start_us, record FROM sessions"
+                " ORDER BY start_us DESC LIMIT -1 OFFSET ?) AS expired"
+                f" WHERE {' AND '.join(clauses)} ORDER BY start_us DESC LIMIT ?",
+                params,
+            )
+            return [json_loads(record) for (record,) in rows]
+
+        return await self._async_run(_list)
+
+    async def async_query_sessions(
+        self, query: CookQuery
+    ) -> list[StoredCookSession]:
+        """Return stored sessions matching a query, one more than its limit.
+
+        Filters and keyset paging are answered from the start, duration and
+        tag indexes.
+        """
+
+        column = "duration_seconds" if query.sort == COOK_SORT_DURATION else "start_us"
+        direction = "DESC" if query.descending else "ASC"
+        clauses: list[str] = []
+        params: list[Any] = []
+        if query.started_after is not None:
+            clauses.append("start_us > ?")
+            params.append(query.started_after)
+        if query.started_before is not None:
+            clauses.append("start_us < ?")
+            params.append(query.started_before)
+        if query.min_duration is not None:
+            clauses.append("duration_seconds >= ?")
+            params.append(query.min_duration)
+        for tag in sorted(query.tags):
+            clauses.append("id IN (SELECT session_id FROM session_tags WHERE tag = ?)")
+            params.append(tag)
+        if query.cursor is not None:
+            operator = "<" if query.descending else ">"
+            if query.cursor_inclusive:
+                operator += "="
+            clauses.append(f"({column}, id) {operator} (?, ?)")
+            params.extend(query.cursor)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(-1 if query.limit is None else query.limit + 1)
+
+        def _query(connection: sqlite3.Connection) -> list[StoredCookSession]:
+            rows = connection.execute(
+                f"SELECT record FROM sessions{where}"
+                f" ORDER BY {column} {direction}, id {direction} LIMIT ?",
+                params,
+            )
+            return [json_loads(record) for (record,) in rows]
+
+        return await self._async_run(_query)
+
+    async def async_get_session(self, cook_id: str) -> StoredCookSession | None:
+        """Return one stored session by id."""
+
+        def _get(connection: sqlite3.Connection) -> StoredCookSession | None:
+            row = connection.execute(
+                "SELECT record FROM sessions WHERE id = ?", (cook_id,)
+            ).fetchone()
+            return None if row is None else json_loads(row[0])
+
+        return await self._async_run(_get)
+
+    async def async_save_session(self, record: StoredCookSession) -> None:
+        """Insert or update one stored session and its tags."""
+
+        def _save(connection: sqlite3.Connection) -> None:
+            with connection:
+                self._upsert_session(connection, record)
+
+        await self._async_run(_save)
+
+    async def async_save_sessions(self, records: list[StoredCookSession]) -> None:
+        """Insert or update several stored sessions in one transaction."""
+
+        def _save(connection: sqlite3.Connection) -> None:
+            with connection:
+                for record in records:
+                    self._upsert_session(connection, record)
+
+        await self._async_run(_save)
+
+    async def async_save_cook(
+        self, record: StoredCookSession, detail: StoredCookDetail
+    ) -> None:
+        """Store a completed cook and its detail in one transaction."""
+
+        def _save(connection: sqlite3.Connection) -> None:
+            with connection:
+                self._upsert_session(connection, record)
+                self._replace_detail(connection, record["id"], detail)
+
+        await self._async_run(_save)
+
+    async def async_import_cooks(
+        self, cooks: list[tuple[StoredCookSession, StoredCookDetail | None]]
+    ) -> None:
+        """Store many completed cooks in one transaction."""
+
+        def _import(connection: sqlite3.Connection) -> None:
+            with connection:
+                for record, detail in cooks:
+                    self._upsert_session(connection, record)
+                    if detail is not None:
+                        self._replace_detail(connection, record["id"], detail)
+
+        await self._async_run(_import)
+
+    async def async_load(self, cook_id: str) -> StoredCookDetail | None:
+        """Return the detail for a cook in the columnar stored form."""
+
+        def _load(connection: sqlite3.Connection) -> StoredCookDetail | None:
+            row = connection.execute(
+                "SELECT detail FROM sessions WHERE id = ?", (cook_id,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            samples = encode_epoch_rows(
+                connection.execute(
+                    f"SELECT timestamp_us, {', '.join(_SAMPLE_COLUMNS[1:])}"
+                    " FROM samples WHERE session_id = ? ORDER BY timestamp_us",
+                    (cook_id,),
+                ).fetchall(),
+                SAMPLE_DELTA_COLUMNS,
+                SAMPLE_PLAIN_COLUMNS,
+            )
+            samples["probe1_stalled"] = [
+                None if stalled is None else bool(stalled)
+                for stalled in samples["probe1_stalled"]
+            ]
+            errors = [
+                {
+                    "timestamp": timestamp,
+                    "source": source,
+                    "message": message,
+                    **({} if end is None else {"end_timestamp": end}),
+                }
+                for timestamp, end, source, message in connection.execute(
+                    "SELECT timestamp, end_timestamp, source, message FROM errors"
+                    " WHERE session_id = ? ORDER BY position",
+                    (cook_id,),
+                )
+            ]
+            return {
+                **json_loads(row[0] or "{}"),
+                "id": cook_id,
+                "samples": samples,
+                "errors": errors,
+            }
+
+        return await self._async_run(_load)
+
+    async def async_detail_sizes(self, cook_ids: list[str]) -> dict[str, int]:
+        """Return the byte length of the values stored for each existing cook.
+
+        The record, detail, sample and error values are summed in SQL, so
+        nothing is decoded to measure them.
+        """
+
+        sample_lengths = " + ".join(
+            f"coalesce(length({column}), 0)"
+            for column in ("timestamp_us", *_SAMPLE_COLUMNS[1:])
+        )
+
+        def _sizes(connection: sqlite3.Connection) -> dict[str, int]:
+            return dict(
+                connection.execute(
+                    "SELECT id, length(record) + coalesce(length(detail), 0)"
+                    " + coalesce((SELECT SUM("
+                    f"{sample_lengths}"
+                    ") FROM samples WHERE session_id = id), 0)"
+                    " + coalesce((SELECT SUM(length(timestamp)"
+                    " + coalesce(length(end_timestamp), 0) + length(source)"
+                    " + length(message)) FROM errors WHERE session_id = id), 0)"
+                    f" FROM sessions WHERE id IN ({', '.join('?' * len(cook_ids))})",
+                    cook_ids,
+                )
+            )
+
+        return await self._async_run(_sizes)
+
+    async def async_remove(self, cook_id: str) -> bool:
+        """Delete a cook with its samples and errors; return whether it existed."""
+
+        def _remove(connection: sqlite3.Connection) -> bool:
+            with connection:
+                return (
+                    connection.execute(
+                        "DELETE FROM sessions WHERE id = ?", (cook_id,)
+                    ).rowcount
+                    > 0
+                )
+
+        return await self._async_run(_remove)
+
+    async def async_remove_many(self, cook_ids: list[str]) -> None:
+        """Delete several cooks with their samples and errors in one transaction."""
+
+        def _remove(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.executemany(
+                    "DELETE FROM sessions WHERE id = ?",
+                    [(cook_id,) for cook_id in cook_ids],
+                )
+
+        await self._async_run(_remove)
+
+    async def _async_run[_T](
+        self, func: Callable[[sqlite3.Connection], _T]
+    ) -> _T:
+        """Run one database call in the executor, opening the database first."""
+
+        async with self._lock:
+            return await self.hass.async_add_executor_job(self._run, func)
+
+    def _run[_T](self, func: Callable[[sqlite3.Connection], _T]) -> _T:
+        """Open the connection on first use and run one database call."""
+
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.executescript(_SCHEMA)
+        return func(self._connection)
+
+    def _remove_files(self) -> None:
+        """Delete the database file and any journal files SQLite left."""
+
+        for suffix in ("", "-journal", "-wal", "-shm"):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(f"{self.path}{suffix}")
+
+    @staticmethod
+    def _upsert_session(
+        connection: sqlite3.Connection, record: StoredCookSession
+    ) -> None:
+        """Write one session row and replace its tags."""
+
+        connection.execute(
+            "INSERT INTO sessions (id, start_us, end_us, duration_seconds, record)"
+            " VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (id) DO UPDATE SET start_us = excluded.start_us,"
+            " end_us = excluded.end_us,"
+            " duration_seconds = excluded.duration_seconds,"
+            " record = excluded.record",
+            (
+                record["id"],
+                record["start"],
+                record["end"],
+                record["duration_seconds"],
+                json_dumps(record),
+            ),
+        )
+        connection.execute(
+            "DELETE FROM session_tags WHERE session_id = ?", (record["id"],)
+        )
+        connection.executemany(
+            "INSERT INTO session_tags (session_id, tag) VALUES (?, ?)",
+            [(record["id"], tag) for tag in record["annotations"]["tags"]],
+        )
+
+    @staticmethod
+    def _replace_detail(
+        connection: sqlite3.Connection, cook_id: str, detail: StoredCookDetail
+    ) -> None:
+        """Replace the samples, errors and remaining detail of one cook."""
+
+        connection.execute("DELETE FROM samples WHERE session_id = ?", (cook_id,))
+        connection.execute("DELETE FROM errors WHERE session_id = ?", (cook_id,))
+        connection.executemany(
+            # A repeated timestamp keeps the later sample instead of failing.
+            "INSERT OR REPLACE INTO samples (session_id, timestamp_us,"
+            f" {', '.join(_SAMPLE_COLUMNS[1:])})"
+            f" VALUES (?, {', '.join('?' * len(_SAMPLE_COLUMNS))})",
+            [
+                (
+                    cook_id,
+                    to_epoch_microseconds(sample["timestamp"]),
+                    *(sample[column] for column in SAMPLE_DELTA_COLUMNS),
+                    sample["probe1_stalled"],
+                )
+                for sample in decode_columns(
+                    detail.get("samples", {}),
+                    SAMPLE_DELTA_COLUMNS,
+                    SAMPLE_PLAIN_COLUMNS,
+                )
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO errors (session_id, position, timestamp, end_timestamp,"
+            " source, message) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    cook_id,
+                    position,
+                    error["timestamp"],
+                    error.get("end_timestamp"),
+                    error["source"],
+                    error["message"],
+                )
+                for position, error in enumerate(detail.get("errors", []))
+            ],
+        )
+        connection.execute(
+            "UPDATE sessions SET detail = ? WHERE id = ?",
+            (
+                json_dumps(
+                    {
+                        key: value
+                        for key, value in detail.items()
+                        if key not in ("id", "samples", "errors")
+                    }
+                ),
+                cook_id,
+            ),
+        )
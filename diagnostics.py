@@ -0,0 +1,26 @@
+"""Diagnostics support for Pitboss."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from . import PitbossConfigEntry
+from .const import INFO_MAC
+
+TO_REDACT = {CONF_HOST, INFO_MAC}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: PitbossConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a Pit Boss config entry."""
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(config_entry.data), TO_REDACT),
+            "options": dict(config_entry.options),
+        },
+        "cook_archive": config_entry.runtime_data.get_cook_archive_diagnostics(),
+    }
@@ -0,0 +1,151 @@
+"""Shape-preserving downsampling of Pit Boss cook traces for display."""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from math import ceil
+
+from .codec import ROLLUP_CHANNELS, SAMPLE_DELTA_COLUMNS, Columns, Row
+
+_MIN_LTTB_POINTS = 3
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> list[int]:
+    """Return the indices kept by largest-triangle-three-buckets.
+
+    The first and last points are always kept. Every bucket in between keeps
+    the point forming the largest triangle with the point kept before it and
+    the average of the next bucket, which preserves peaks and steps.
+    """
+
+    count = len(xs)
+    if threshold >= count or threshold < _MIN_LTTB_POINTS:
+        return list(range(count))
+
+    kept = [0]
+    bucket_size = (count - 2) / (threshold - 2)
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        average_x = sum(xs[end:next_end]) / (next_end - end)
+        average_y = sum(ys[end:next_end]) / (next_end - end)
+        previous_x = xs[previous]
+        previous_y = ys[previous]
+
+        best = start
+        best_area = -1.0
+        for index in range(start, end):
+            area = abs(
+                (previous_x - average_x) * (ys[index] - previous_y)
+                - (previous_x - xs[index]) * (average_y - previous_y)
+            )
+            if area > best_area:
+                best = index
+                best_area = area
+        kept.append(best)
+        previous = best
+
+    kept.append(count - 1)
+    return kept
+
+
+def downsample_samples(samples: Sequence[Row], max_points: int) -> list[Row]:
+    """Return about ``max_points`` samples that keep the shape of every channel.
+
+    The first and last samples and every sample where the stall flag flips
+    are always kept, so stall spans survive exactly. The rest of the budget
+    is shared evenly between the temperature channels, each reduced with
+    LTTB, and the union of the chosen samples is returned in time order.
+    """
+
+    if len(samples) <= max_points:
+        return list(samples)
+
+    kept = {0, len(samples) - 1}
+    kept.update(
+        index
+        for index in range(1, len(samples))
+        if samples[index].get("probe1_stalled")
+        != samples[index - 1].get("probe1_stalled")
+    )
+    share = max(max_points - len(kept), 0) // len(SAMPLE_DELTA_COLUMNS)
+    if share >= _MIN_LTTB_POINTS:
+        xs = [sample["timestamp"].timestamp() for sample in samples]
+        for channel in SAMPLE_DELTA_COLUMNS:
+            kept.update(
+                lttb_indices(xs, [sample[channel] for sample in samples], share)
+            )
+    return [samples[index] for index in sorted(kept)]
+
+
+def downsample_rollups(rollups: Sequence[Row], max_points: int) -> list[Row]:
+    """Merge consecutive rollup buckets into at most ``max_points`` buckets.
+
+    Merged buckets keep the lowest minimum, the highest maximum and the
+    count-weighted mean of each channel, so no extreme is lost.
+    """
+
+    if len(rollups) <= max_points:
+        return list(rollups)
+
+    group_size = ceil(len(rollups) / max_points)
+    merged: list[Row] = []
+    for start in range(0, len(rollups), group_size):
+        group = rollups[start : start + group_size]
+        count = sum(rollup["count"] for rollup in group)
+        bucket: Row = {"timestamp": group[0]["timestamp"], "count": count}
+        for channel in ROLLUP_CHANNELS:
+            bucket[f"{channel}_min"] = min(rollup[f"{channel}_min"] for rollup in group)
+            bucket[f"{channel}_max"] = max(rollup[f"{channel}_max"] for rollup in group)
+            bucket[f"{channel}_mean"] = (
+                sum(rollup[f"{channel}_mean"] * rollup["count"] for rollup in group)
+                / count
+                if count
+                else group[0][f"{channel}_mean"]
+            )
+        merged.append(bucket)
+    return merged
+
+
+def resample_samples(
+    samples: Sequence[Row],
+    start: datetime,
+    step: timedelta,
+    channels: Sequence[str],
+) -> Columns:
+    """Return samples resampled onto a fixed grid as one array per channel.
+
+    Grid point ``i`` lies ``i * step`` after ``start`` and the grid ends at
+    the last sample, so traces resampled with the same step line up by index.
+    Numeric channels are interpolated linearly between the samples around a
+    point and flags hold the earlier sample's value; points before the first
+    sample are None.
+    """
+
+    columns: Columns = {channel: [] for channel in channels}
+    if not samples:
+        return columns
+
+    positions = [(sample["timestamp"] - start) / step for sample in samples]
+    for point in range(max(int(positions[-1]) + 1, 0)):
+        after = bisect_left(positions, point)
+        if positions[after] == point or after == 0:
+            row = samples[after] if positions[after] == point else {}
+            for channel in channels:
+                columns[channel].append(row.get(channel))
+            continue
+
+        before = samples[after - 1]
+        weight = (point - positions[after - 1]) / (
+            positions[after] - positions[after - 1]
+        )
+        for channel in channels:
+            low = before.get(channel)
+            high = samples[after].get(channel)
+            if isinstance(low, bool) or low is None or high is None:
+                columns[channel].append(low)
+            else:
+                columns[channel].append(round(low + (high - low) * weight, 2))
+    return columns
@@ -0,0 +1,444 @@
+"""Compact in-memory index records for completed Pit Boss cooks."""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Self
+
+from .codec import from_epoch_microseconds, to_epoch_microseconds
+from .const import COOK_SORT_DURATION, COOK_SORT_START
+
+_TIMESTAMP_FIELDS = ("start", "confirmed_start", "end", "done_at")
+
+type CookSortKey = tuple[int, str]
+type CookCursor = CookSortKey | tuple[int, str, str]
+
+
+def _to_epoch(value: datetime | int | str | None) -> int | None:
+    """Return a timestamp as epoch microseconds.
+
+    Index data written before epoch storage holds ISO strings instead.
+    """
+
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return to_epoch_microseconds(value)
+
+
+def _to_iso(value: int | None) -> str | None:
+    """Return epoch microseconds as an ISO 8601 string."""
+
+    return None if value is None else from_epoch_microseconds(value).isoformat()
+
+
+def _phase_to_epoch(phase: dict[str, Any]) -> dict[str, Any]:
+    """Return a cook phase with epoch-microsecond bounds."""
+
+    return {**phase, "start": _to_epoch(phase["start"]), "end": _to_epoch(phase["end"])}
+
+
+@dataclass(slots=True, kw_only=True)
+class CookIndexEntry:
+    """One completed cook as held in the archive index.
+
+    Timestamps are kept as epoch microseconds, in memory and in storage, and
+    only become datetimes or ISO strings when a caller asks for them.
+    """
+
+    id: str
+    start: int
+    confirmed_start: int | None
+    end: int | None
+    done_at: int | None
+    duration_seconds: int
+    stall_count: int
+    unit: str | None
+    summary: dict[str, Any]
+    phases: list[dict[str, Any]]
+    annotations: dict[str, Any]
+    detail_downsampled: bool = False
+
+    @classmethod
+    def from_cook(cls, cook: dict[str, Any]) -> Self:
+        """Build an index entry from a closed cook holding datetimes."""
+
+        return cls(
+            id=cook["id"],
+            start=_to_epoch(cook["start"]),
+            confirmed_start=_to_epoch(cook["confirmed_start"]),
+            end=_to_epoch(cook["end"]),
+            done_at=_to_epoch(cook["done_at"]),
+            duration_seconds=cook["duration_seconds"],
+            stall_count=cook["stall_count"],
+            unit=cook["unit"],
+            summary=dict(cook["summary"]),
+            phases=[_phase_to_epoch(phase) for phase in cook.get("phases", [])],
+            annotations={
+                "tags": list(cook["annotations"]["tags"]),
+                "notes": cook["annotations"]["notes"],
+            },
+        )
+
+    @classmethod
+    def from_stored(cls, stored: dict[str, Any]) -> Self:
+        """Build an index entry from its freshly loaded stored form.
+
+        The nested summary, phase and annotation containers are taken over
+        as they are, so loading does not copy them.
+        """
+
+        phases = stored.get("phases", [])
+        if phases and not isinstance(phases[0]["start"], int):
+            phases = [_phase_to_epoch(phase) for phase in phases]
+        annotations = stored.get("annotations", {})
+        annotations.setdefault("tags", [])
+        annotations.setdefault("notes", None)
+        return cls(
+            id=stored["id"],
+            start=_to_epoch(stored["start"]),
+            confirmed_start=_to_epoch(stored["confirmed_start"]),
+            end=_to_epoch(stored["end"]),
+            done_at=_to_epoch(stored["done_at"]),
+            duration_seconds=stored["duration_seconds"],
+            stall_count=stored["stall_count"],
+            unit=stored.get("unit"),
+            summary=stored.get("summary", {}),
+            phases=phases,
+            annotations=annotations,
+            detail_downsampled=stored.get("detail_downsampled", False),
+        )
+
+    @property
+    def start_datetime(self) -> datetime:
+        """Return the start of the cook."""
+
+        return from_epoch_microseconds(self.start)
+
+    @property
+    def end_datetime(self) -> datetime | None:
+        """Return the end of the cook."""
+
+        return None if self.end is None else from_epoch_microseconds(self.end)
+
+    def as_stored(self) -> dict[str, Any]:
+        """Return the stored form, with epoch-microsecond timestamps."""
+
+        return {
+            "id": self.id,
+            "start": self.start,
+            "confirmed_start": self.confirmed_start,
+            "end": self.end,
+            "done_at": self.done_at,
+            "duration_seconds": self.duration_seconds,
+            "stall_count": self.stall_count,
+            "unit": self.unit,
+            "summary": dict(self.summary),
+            "phases": [dict(phase) for phase in self.phases],
+            "annotations": {
+                "tags": list(self.annotations["tags"]),
+                "notes": self.annotations["notes"],
+            },
+            "detail_downsampled": self.detail_downsampled,
+        }
+
+    def as_api(self) -> dict[str, Any]:
+        """Return the API form, with ISO 8601 timestamps."""
+
+        serialized = self.as_stored()
+        for name in _TIMESTAMP_FIELDS:
+            serialized[name] = _to_iso(serialized[name])
+        serialized["phases"] = [
+            {**phase, "start": _to_iso(phase["start"]), "end": _to_iso(phase["end"])}
+            for phase in self.phases
+        ]
+        return serialized
+
+
+def encode_cursor(key: CookCursor) -> str:
+    """Return the opaque paging cursor for the sort key of the last listed cook.
+
+    Listings across config entries add the entry id, which breaks ties
+    between cooks of different entries with the same sort key.
+    """
+
+    if len(key) == 3:
+        return f"{key[0]}:{key[1]}/{key[2]}"
+    return f"{key[0]}:{key[1]}"
+
+
+def decode_cursor(cursor: str) -> CookCursor:
+    """Return the sort key held in a paging cursor.
+
+    Raises ValueError for a cursor that was not produced by ``encode_cursor``.
+    """
+
+    value, separator, cook_id = cursor.partition(":")
+    cook_id, entry_separator, entry_id = cook_id.rpartition("/")
+    if not entry_separator:
+        cook_id = entry_id
+    if not separator or not cook_id or (entry_separator and not entry_id):
+        raise ValueError(f"Invalid cook cursor: {cursor}")
+    if entry_separator:
+        return int(value), cook_id, entry_id
+    return int(value), cook_id
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class CookQuery:
+    """Filters, ordering and paging for a listing of completed cooks.
+
+    Start bounds are exclusive epoch microseconds. Cooks must carry every
+    requested tag. Pages continue after ``cursor``, the sort key of the last
+    cook of the previous page, so they stay stable while cooks are added.
+    With ``cursor_inclusive`` a cook with exactly that key is listed too.
+    """
+
+    started_after: int | None = None
+    started_before: int | None = None
+    tags: frozenset[str] = frozenset()
+    min_duration: int | None = None
+    sort: str = COOK_SORT_START
+    descending: bool = True
+    limit: int | None = None
+    cursor: CookCursor | None = None
+    cursor_inclusive: bool = False
+
+    def for_entry(self, entry_id: str) -> Self:
+        """Return the query one config entry answers for a cross-entry cursor.
+
+        Cooks of entries ordered after the cursor's entry are still due when
+        they share its sort key.
+        """
+
+        if self.cursor is None or len(self.cursor) == 2:
+            return self
+        value, cook_id, cursor_entry_id = self.cursor
+        return replace(
+            self,
+            cursor=(value, cook_id),
+            cursor_inclusive=(
+                entry_id < cursor_entry_id
+                if self.descending
+                else entry_id > cursor_entry_id
+            ),
+        )
+
+    def sort_key(self, entry: CookIndexEntry) -> CookSortKey:
+        """Return the key a cook is ordered and paged by."""
+
+        if self.sort == COOK_SORT_DURATION:
+            return entry.duration_seconds, entry.id
+        return entry.start, entry.id
+
+    def matches(self, entry: CookIndexEntry) -> bool:
+        """Return whether a cook passes the filters and lies past the cursor."""
+
+        if self.started_after is not None and entry.start <= self.started_after:
+            return False
+        if self.started_before is not None and entry.start >= self.started_before:
+            return False
+        if (
+            self.min_duration is not None
+            and entry.duration_seconds < self.min_duration
+        ):
+            return False
+        if self.tags and not self.tags.issubset(entry.annotations["tags"]):
+            return False
+        if self.cursor is not None:
+            key = self.sort_key(entry)
+            if key == self.cursor:
+                return self.cursor_inclusive
+            return key < self.cursor if self.descending else key > self.cursor
+        return True
+
+    def page(
+        self, entries: list[CookIndexEntry]
+    ) -> tuple[list[CookIndexEntry], str | None]:
+        """Cut matching cooks, in order, down to one page and its next cursor.
+
+        Callers pass up to one cook more than the limit, so a further page is
+        only announced when one exists.
+        """
+
+        if self.limit is None or len(entries) <= self.limit:
+            return entries, None
+        entries = entries[: self.limit]
+        return entries, encode_cursor(self.sort_key(entries[-1]))
+
+
+def key_range(keys: Sequence[tuple[Any, ...]], query: CookQuery) -> tuple[int, int]:
+    """Return the bounds within sorted sort keys that a query can match.
+
+    Keys start with the sort value and cook id. The bounds only narrow the
+    walk; ``CookQuery.matches`` still decides each cook.
+    """
+
+    low, high = 0, len(keys)
+    if query.sort == COOK_SORT_DURATION:
+        if query.min_duration is not None:
+            low = bisect_left(keys, (query.min_duration,))
+    else:
+        if query.started_after is not None:
+            low = bisect_left(keys, (query.started_after + 1,))
+        if query.started_before is not None:
+            high = bisect_left(keys, (query.started_before,))
+    if query.cursor is not None:
+        if query.descending:
+            bisect = bisect_right if query.cursor_inclusive else bisect_left
+            high = min(high, bisect(keys, query.cursor))
+        else:
+            bisect = bisect_left if query.cursor_inclusive else bisect_right
+            low = max(low, bisect(keys, query.cursor))
+    return low, high
+
+
+@dataclass(slots=True)
+class CookIndex:
+    """Completed cooks with the secondary indexes used to list them.
+
+    Cooks are held by id, with their start and duration sort keys kept in
+    sorted lists and a tag to ids map, so a filtered page is answered by
+    bisecting instead of scanning the archive. Iteration and positional
+    access follow start order, oldest first.
+    """
+
+    _by_id: dict[str, CookIndexEntry] = field(default_factory=dict)
+    _by_start: list[CookSortKey] = field(default_factory=list)
+    _by_duration: list[CookSortKey] = field(default_factory=list)
+    _by_tag: dict[str, set[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[CookIndexEntry]) -> Self:
+        """Build an index holding the given cooks."""
+
+        index = cls()
+        for entry in entries:
+            index.add(entry)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed cooks."""
+
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[CookIndexEntry]:
+        """Iterate over the cooks, oldest first."""
+
+        return (self._by_id[cook_id] for _, cook_id in self._by_start)
+
+    def __reversed__(self) -> Iterator[CookIndexEntry]:
+        """Iterate over the cooks, newest first."""
+
+        return (self._by_id[cook_id] for _, cook_id in reversed(self._by_start))
+
+    def __getitem__(self, position: int) -> CookIndexEntry:
+        """Return the cook at a position in start order."""
+
+        return self._by_id[self._by_start[position][1]]
+
+    def __contains__(self, cook_id: object) -> bool:
+        """Return whether a cook id is indexed."""
+
+        return cook_id in self._by_id
+
+    @property
+    def start_keys(self) -> list[CookSortKey]:
+        """Return the start sort keys of the cooks, oldest first."""
+
+        return self._by_start
+
+    def get(self, cook_id: str) -> CookIndexEntry | None:
+        """Return a cook by id."""
+
+        return self._by_id.get(cook_id)
+
+    def add(self, entry: CookIndexEntry) -> None:
+        """Index a cook, replacing any cook with the same id."""
+
+        self.remove(entry.id)
+        self._by_id[entry.id] = entry
+        insort(self._by_start, (entry.start, entry.id))
+        insort(self._by_duration, (entry.duration_seconds, entry.id))
+        self._index_tags(entry)
+
+    def remove(self, cook_id: str) -> CookIndexEntry | None:
+        """Drop a cook from every index and return it, if it was indexed."""
+
+        if (entry := self._by_id.pop(cook_id, None)) is None:
+            return None
+
+        for keys, key in (
+            (self._by_start, (entry.start, cook_id)),
+            (self._by_duration, (entry.duration_seconds, cook_id)),
+        ):
+            del keys[bisect_left(keys, key)]
+        self._unindex_tags(entry)
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cook."""
+
+        self._by_id.clear()
+        self._by_start.clear()
+        self._by_duration.clear()
+        self._by_tag.clear()
+
+    def set_tags(self, entry: CookIndexEntry, tags: list[str]) -> None:
+        """Replace the tags of an indexed cook."""
+
+        self._unindex_tags(entry)
+        entry.annotations["tags"] = tags
+        self._index_tags(entry)
+
+    def query(self, query: CookQuery) -> tuple[list[CookIndexEntry], str | None]:
+        """Return one page of cooks matching a query and the next cursor."""
+
+        keys = self._by_duration if query.sort == COOK_SORT_DURATION else self._by_start
+        low, high = key_range(keys, query)
+
+        candidates: Iterable[CookSortKey]
+        tagged = self._tagged_ids(query.tags)
+        if tagged is not None and len(tagged) < high - low:
+            candidates = sorted(
+                (query.sort_key(self._by_id[cook_id]) for cook_id in tagged),
+                reverse=query.descending,
+            )
+        elif query.descending:
+            candidates = (keys[position] for position in range(high - 1, low - 1, -1))
+        else:
+            candidates = (keys[position] for position in range(low, high))
+
+        wanted = None if query.limit is None else query.limit + 1
+        matched: list[CookIndexEntry] = []
+        for _, cook_id in candidates:
+            if query.matches(entry := self._by_id[cook_id]):
+                matched.append(entry)
+                if len(matched) == wanted:
+                    break
+        return query.page(matched)
+
+    def _tagged_ids(self, tags: frozenset[str]) -> set[str] | None:
+        """Return the ids of cooks carrying every tag, or None without tags."""
+
+        if not tags:
+            return None
+        tagged = [self._by_tag.get(tag, set()) for tag in tags]
+        return set.intersection(*sorted(tagged, key=len))
+
+    def _index_tags(self, entry: CookIndexEntry) -> None:
+        """Add a cook to the tag map."""
+
+        for tag in entry.annotations["tags"]:
+            self._by_tag.setdefault(tag, set()).add(entry.id)
+
+    def _unindex_tags(self, entry: CookIndexEntry) -> None:
+        """Remove a cook from the tag map."""
+
+        for tag in entry.annotations["tags"]:
+            if (cook_ids := self._by_tag.get(tag)) is not None:
+                cook_ids.discard(entry.id)
+                if not cook_ids:
+                    del self._by_tag[tag]
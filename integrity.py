@@ -0,0 +1,111 @@
+"""Integrity scan and orphan cleanup for Pit Boss cook storage."""
+
+import asyncio
+import contextlib
+import os
+import re
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util.dt import utcnow
+
+from .const import (
+    COOK_STORAGE_SCAN_BATCH_DELAY,
+    COOK_STORAGE_SCAN_BATCH_SIZE,
+    DOMAIN,
+)
+
+# Only the files a config entry writes itself; other files named after the
+# domain, such as integration-wide stores, are never treated as leftovers.
+_STORAGE_FILE = re.compile(
+    rf"^{DOMAIN}_(?P<entry_id>[^_]+)_(?:"
+    r"cook_sessions(?:_\d{4}-\d{2})?"
+    r"|cook_detail_[0-9a-f]{40}"
+    r"|cook_archive_index"
+    r"|cook_archive\.\d+\.pack"
+    r"|cooks\.db(?:-wal|-shm|-journal)?"
+    r"|active_cook\.journal"
+    r")$"
+)
+
+
+def _list_storage_files(storage_dir: str) -> dict[str, int]:
+    """Return the size of every Pit Boss file in the storage directory."""
+
+    try:
+        entries = list(os.scandir(storage_dir))
+    except FileNotFoundError:
+        return {}
+
+    return {
+        entry.name: entry.stat().st_size
+        for entry in entries
+        if entry.name.startswith(f"{DOMAIN}_") and entry.is_file()
+    }
+
+
+def _remove_files(paths: list[str]) -> None:
+    """Delete files that are no longer referenced."""
+
+    for path in paths:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+async def async_scan_cook_storage(
+    hass: HomeAssistant,
+    entry_id: str,
+    expected_detail: dict[str, str],
+    known_entry_ids: set[str],
+) -> dict[str, Any]:
+    """Cross-check stored cook files against the index and remove orphans.
+
+    ``expected_detail`` maps each per-cook detail file this entry's index
+    relies on to its cook id. Other per-cook detail files of the entry are
+    orphans, and every per-entry file of an entry that no longer exists is a
+    leftover. ``known_entry_ids`` should hold every config entry of the
+    domain, disabled ones included.
+    Listing and removal run in the executor, a batch at a time with a pause
+    in between, so a large cleanup never competes with normal storage writes.
+    """
+
+    storage_dir = hass.config.path(STORAGE_DIR)
+    files = await hass.async_add_executor_job(_list_storage_files, storage_dir)
+
+    detail_prefix = f"{DOMAIN}_{entry_id}_cook_detail_"
+    orphans = [
+        name
+        for name in files
+        if name.startswith(detail_prefix) and name not in expected_detail
+    ]
+    leftovers = [
+        name
+        for name in files
+        if (match := _STORAGE_FILE.match(name)) is not None
+        and match["entry_id"] not in known_entry_ids
+    ]
+    missing_detail = sorted(
+        cook_id for key, cook_id in expected_detail.items() if key not in files
+    )
+
+    removals = [*orphans, *leftovers]
+    for start in range(0, len(removals), COOK_STORAGE_SCAN_BATCH_SIZE):
+        if start:
+            await asyncio.sleep(COOK_STORAGE_SCAN_BATCH_DELAY)
+        await hass.async_add_executor_job(
+            _remove_files,
+            [
+                os.path.join(storage_dir, name)
+                for name in removals[start : start + COOK_STORAGE_SCAN_BATCH_SIZE]
+            ],
+        )
+
+    return {
+        "last_run": utcnow().isoformat(),
+        "files_scanned": len(files),
+        "orphans_removed": len(orphans),
+        "leftover_files_removed": len(leftovers),
+        "bytes_reclaimed": sum(files[name] for name in removals),
+        "missing_detail": missing_detail,
+    }
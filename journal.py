@@ -0,0 +1,145 @@
+"""Append-only journal for the active Pit Boss cook."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import contextlib
+import logging
+import os
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+type JournalRecord = dict[str, Any]
+
+
+class CookJournal:
+    """JSON-lines file that only grows by appended records until it is compacted.
+
+    Unlike a ``Store``, a write never rewrites earlier records, so the cost of
+    persisting a poll does not depend on how much has already been recorded.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the journal for one storage key."""
+
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, key)
+        self._lock = asyncio.Lock()
+        self._records_func: Callable[[], list[JournalRecord]] | None = None
+        self._unsub_delay: CALLBACK_TYPE | None = None
+        self._unsub_final_write: CALLBACK_TYPE | None = None
+
+    async def async_load(self) -> list[JournalRecord]:
+        """Return every record written since the last compaction."""
+
+        return await self.hass.async_add_executor_job(self._read_records)
+
+    @callback
+    def async_delay_append(
+        self, records_func: Callable[[], list[JournalRecord]], delay: float
+    ) -> None:
+        """Append the records returned by ``records_func`` after a delay.
+
+        Later calls before the write only replace the callback; they do not
+        postpone the pending write.
+        """
+
+        self._records_func = records_func
+        if self._unsub_delay is None:
+            self._unsub_delay = async_call_later(
+                self.hass, delay, self._async_handle_delay
+            )
+        if self._unsub_final_write is None:
+            self._unsub_final_write = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_handle_final_write
+            )
+
+    async def async_flush(self) -> None:
+        """Write any pending records now."""
+
+        if self._unsub_delay is not None:
+            self._unsub_delay()
+            self._unsub_delay = None
+
+        async with self._lock:
+            if (records_func := self._records_func) is None:
+                return
+            self._records_func = None
+            if records := records_func():
+                await self.hass.async_add_executor_job(self._append_records, records)
+
+    async def async_close(self) -> None:
+        """Write any pending records and stop listening for the final write."""
+
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        await self.async_flush()
+
+    async def async_compact(self, persist: Callable[[], Awaitable[None]]) -> None:
+        """Persist the journaled state elsewhere, then discard the journal.
+
+        Appends scheduled meanwhile wait for the compaction and start a new file.
+        """
+
+        async with self._lock:
+            await persist()
+            await self.hass.async_add_executor_job(self._remove)
+
+    @callback
+    def _async_handle_delay(self, _now: Any) -> None:
+        """Write pending records once the append delay has passed."""
+
+        self._unsub_delay = None
+        self.hass.async_create_task(self.async_flush())
+
+    async def _async_handle_final_write(self, _event: Event) -> None:
+        """Write pending records before Home Assistant stops."""
+
+        self._unsub_final_write = None
+        await self.async_flush()
+
+    def _read_records(self) -> list[JournalRecord]:
+        """Read journal records, dropping a partially written final line."""
+
+        try:
+            with open(self.path, encoding="utf-8") as journal_file:
+                lines = journal_file.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+        records: list[JournalRecord] = []
+        for line_number, line in enumerate(lines, start=1):
+            if not line:
+                continue
+            try:
+                records.append(json_loads(line))
+            except ValueError:
+                _LOGGER.warning(
+                    "Ignoring unreadable line %s in cook journal %s",
+                    line_number,
+                    self.path,
+                )
+        return records
+
+    def _append_records(self, records: list[JournalRecord]) -> None:
+        """Append records to the journal file and sync them to disk."""
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as journal_file:
+            journal_file.write("".join(f"{json_dumps(record)}\n" for record in records))
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def _remove(self) -> None:
+        """Delete the journal file."""
+
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
@@ -116,6 +116,7 @@ class PitbossCookPanel extends HTMLElement {
         type: "pitboss/get_cook",
         config_entry_id: this._configEntryId,
         cook_id: cookId,
+        max_points: CHART_WIDTH,
       });
       if (
         requestId !== this._cookLoadRequestId
@@ -727,6 +728,7 @@ class PitbossCookPanel extends HTMLElement {
         <div><span>Peak Grill</span><strong>${escapeHtml(summary.peak_grill_actual ?? "-")}</strong></div>
         <div><span>Peak Probe 1</span><strong>${escapeHtml(summary.peak_probe1_actual ?? "-")}</strong></div>
         <div><span>Peak Probe 2</span><strong>${escapeHtml(summary.peak_probe2_actual ?? "-")}</strong></div>
+        <div><span>Auger On</span><strong>${escapeHtml(summary.auger_duty_cycle == null ? "-" : `${summary.auger_duty_cycle}%`)}</strong></div>
       </div>
     `;
   }
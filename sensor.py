@@ -236,6 +236,8 @@ async def async_setup_entry(
             PitbossTimeSinceTargetReachedSensor(
                 coordinator, device_id, "P2ActTemp", "P2SetTemp"
             ),
+            PitbossProbeEtaSensor(coordinator, device_id, "P1ActTemp", "P1SetTemp"),
+            PitbossProbeEtaSensor(coordinator, device_id, "P2ActTemp", "P2SetTemp"),
             PitbossLastSuccessfulUpdateSensor(coordinator, device_id),
         ]
     )
@@ -599,3 +601,44 @@ class PitbossTimeSinceTargetReachedSensor(PitbossEntity, SensorEntity):
         ) is None:
             return None
         return round(elapsed.total_seconds() / 60, 1)
+
+
+class PitbossProbeEtaSensor(PitbossEntity, SensorEntity):
+    """Estimated time a probe reaches its target temperature."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:timer-sand"
+    _translation_keys = {
+        "P1ActTemp": "p1_eta",
+        "P2ActTemp": "p2_eta",
+    }
+
+    def __init__(
+        self,
+        coordinator: PitbossDataUpdateCoordinator,
+        device_id: str,
+        actual_key: str,
+        target_key: str,
+    ) -> None:
+        """Initialize the probe ETA sensor."""
+        self._target_key = target_key
+        super().__init__(
+            coordinator,
+            device_id,
+            SensorEntityDescription(
+                key=self._translation_keys[actual_key],
+                translation_key=self._translation_keys[actual_key],
+            ),
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True if a target is available for the probe."""
+        return super().available and (
+            self.coordinator.get_probe_target_temperature(self._target_key) is not None
+        )
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the projected time the probe reaches its target."""
+        return self.coordinator.get_probe_eta(self._target_key)
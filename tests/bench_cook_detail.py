@@ -0,0 +1,131 @@
+"""Benchmark how long cook detail conversions block the event loop.
+
+Not collected by default; run with ``pytest tests/bench_cook_detail.py -s``.
+Each trace length reports the median over rounds of the longest gap between
+event loop iterations while its detail is decoded and encoded, once inline
+and once offloaded to the executor, along with the median wall time. Reading
+the detail Store is left out; it happens the same way either side of the
+threshold.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+
+from custom_components.pitboss.const import DOMAIN
+from custom_components.pitboss.coordinator import PitbossDataUpdateCoordinator
+
+ROUNDS = 9
+
+
+class FakePitbossApi:
+    """Minimal fake API for detail benchmarks."""
+
+    def get_state_value(self, key: str) -> int | bool:
+        """Return a fake state value."""
+        return 0
+
+    def is_fahrenheit(self) -> bool:
+        """Return True if the fake device is in Fahrenheit mode."""
+        return True
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Keep cook detail written during benchmarks out of the config dir."""
+    hass.config.config_dir = str(tmp_path)
+
+
+async def _measure(convert: Callable[[], Awaitable[object]]) -> tuple[float, float]:
+    """Return the median longest loop stall and wall time of a conversion."""
+    longest_stall = 0.0
+    running = True
+
+    async def _spin() -> None:
+        nonlocal longest_stall
+        last = perf_counter()
+        while running:
+            await asyncio.sleep(0)
+            now = perf_counter()
+            longest_stall = max(longest_stall, now - last)
+            last = now
+
+    await convert()
+    spinner = asyncio.create_task(_spin())
+    stalls: list[float] = []
+    times: list[float] = []
+    for _ in range(ROUNDS):
+        await asyncio.sleep(0)
+        longest_stall = 0.0
+        began = perf_counter()
+        await convert()
+        times.append(perf_counter() - began)
+        await asyncio.sleep(0)
+        stalls.append(longest_stall)
+    running = False
+    await spinner
+    return median(stalls), median(times)
+
+
+@pytest.mark.parametrize("sample_count", [1000, 5760, 17280])
+async def test_detail_conversion_loop_stall(
+    hass: HomeAssistant, sample_count: int
+) -> None:
+    """Print loop stalls of detail decoding and encoding, inline and offloaded."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, title="Pit Boss", data={}, unique_id="pitboss-bench"
+    )
+    coordinator = PitbossDataUpdateCoordinator(hass, FakePitbossApi(), config_entry)
+    start = datetime(2024, 6, 1, 12, tzinfo=UTC)
+    cook = {
+        "id": start.isoformat(),
+        "samples": [
+            {
+                "timestamp": start + index * timedelta(seconds=15),
+                "grill_actual": 225 + index % 4,
+                "grill_set": 250,
+                "probe1_actual": 100 + index // 80,
+                "probe2_actual": 60 + index // 120,
+                "probe1_stalled": False,
+            }
+            for index in range(sample_count)
+        ],
+    }
+    detail = coordinator._serialize_cook_detail(cook)
+
+    async def _decode() -> None:
+        await coordinator._async_convert_cook_data(
+            sample_count, coordinator._deserialize_cook_detail, detail
+        )
+
+    async def _encode() -> None:
+        await coordinator._async_convert_cook_data(
+            sample_count, coordinator._serialize_cook_detail, cook
+        )
+
+    for name, convert in (("decode", _decode), ("encode", _encode)):
+        with patch(
+            "custom_components.pitboss.coordinator.COOK_EXECUTOR_ROW_THRESHOLD",
+            sample_count + 1,
+        ):
+            inline_stall, inline_time = await _measure(convert)
+        offloaded_stall, offloaded_time = await _measure(convert)
+        print(
+            f"\n{sample_count:>6} rows {name}:"
+            f" inline stall {inline_stall * 1000:6.2f} ms"
+            f" ({inline_time * 1000:6.2f} ms),"
+            f" offloaded stall {offloaded_stall * 1000:6.2f} ms"
+            f" ({offloaded_time * 1000:6.2f} ms)"
+        )
+
+    assert coordinator._deserialize_cook_detail(detail)["samples"] == cook["samples"]
@@ -0,0 +1,98 @@
+"""Benchmark index saves for annotation edits as the cook archive grows.
+
+Not collected by default; run with ``pytest tests/bench_cook_index.py -s``.
+Each size reports the best time of an annotation edit, which rewrites one
+month segment, next to a rewrite of the whole index in one Store.
+"""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from unittest.mock import AsyncMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+
+from custom_components.pitboss.const import COOK_CONFIRMATION_WINDOW, DOMAIN
+from custom_components.pitboss.coordinator import PitbossDataUpdateCoordinator
+
+ROUNDS = 20
+
+
+class FakePitbossApi:
+    """Minimal fake API for index benchmarks."""
+
+    def get_state_value(self, key: str) -> int | bool:
+        """Return a fake state value."""
+        return 0
+
+    def is_fahrenheit(self) -> bool:
+        """Return True if the fake device is in Fahrenheit mode."""
+        return True
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Keep cook journals written during benchmarks out of the config dir."""
+    hass.config.config_dir = str(tmp_path)
+
+
+def _stored_cook_session(start: datetime) -> dict[str, object]:
+    """Return a completed cook session in its stored form."""
+    end = start + timedelta(hours=8)
+    return {
+        "id": start.isoformat(),
+        "start": start.isoformat(),
+        "confirmed_start": (start + COOK_CONFIRMATION_WINDOW).isoformat(),
+        "end": end.isoformat(),
+        "duration_seconds": int((end - start).total_seconds()),
+        "done_at": None,
+        "stall_count": 0,
+        "summary": {"sample_count": 96, "probe1_peak": 203.0},
+        "annotations": {"tags": ["brisket"], "notes": "Wrapped at 165"},
+    }
+
+
+@pytest.mark.parametrize("archive_size", [120, 1000, 3000, 10000])
+async def test_annotation_save_cost(hass: HomeAssistant, archive_size: int) -> None:
+    """Print the cost of saving one annotation edit next to a full rewrite."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, title="Pit Boss", data={}, unique_id="pitboss-bench"
+    )
+    coordinator = PitbossDataUpdateCoordinator(hass, FakePitbossApi(), config_entry)
+    starts = [
+        datetime(2000 + month // 12, month % 12 + 1, day + 1, 12, tzinfo=UTC)
+        for month, day in (divmod(index, 10) for index in range(archive_size))
+    ]
+    coordinator._store.async_load = AsyncMock(
+        return_value={"sessions": [_stored_cook_session(start) for start in starts]}
+    )
+    await coordinator.async_initialize()
+    cook_id = starts[-1].isoformat()
+
+    segment_save = full_rewrite = float("inf")
+    for round_ in range(ROUNDS):
+        began = perf_counter()
+        await coordinator.async_update_cook_annotations(
+            cook_id, tags=["brisket", f"round-{round_}"]
+        )
+        segment_save = min(segment_save, perf_counter() - began)
+
+        began = perf_counter()
+        await coordinator._store.async_save(
+            {
+                "sessions": [
+                    session.as_stored() for session in coordinator._cook_sessions
+                ]
+            }
+        )
+        full_rewrite = min(full_rewrite, perf_counter() - began)
+
+    print(
+        f"\n{archive_size:>6} cooks: annotation edit {segment_save * 1000:7.3f} ms,"
+        f" full index rewrite {full_rewrite * 1000:7.3f} ms"
+    )
+    assert len(coordinator.list_cooks()) == archive_size
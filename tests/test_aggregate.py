@@ -0,0 +1,47 @@
+"""Tests for Pitboss percentile reference curves."""
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.pitboss.aggregate import aggregate_traces
+
+
+def _trace(start: datetime, minutes: range, slope: int) -> list[dict[str, object]]:
+    """Return a straight-line probe trace sampled at the given minutes."""
+    return [
+        {
+            "timestamp": start + timedelta(minutes=minute),
+            "probe1_actual": 100 + slope * minute,
+        }
+        for minute in minutes
+    ]
+
+
+def test_aggregate_traces_aligns_cooks_on_their_start() -> None:
+    """Percentiles should be taken across cooks at equal minutes from start."""
+    starts = [datetime(2024, 6, day, 10, tzinfo=UTC) for day in (1, 2, 3)]
+    traces = [
+        _trace(starts[0], range(0, 21, 10), 1),
+        _trace(starts[1], range(0, 41, 10), 2),
+        _trace(starts[2], range(10, 41, 10), 3),
+    ]
+
+    aggregate = aggregate_traces(
+        starts, traces, timedelta(minutes=5), ["probe1_actual"], (0, 50, 100)
+    )
+
+    assert aggregate["cook_count"] == 3
+    assert aggregate["count"] == [2, 2, 3, 3, 3, 2, 2, 2, 2]
+    bands = aggregate["channels"]["probe1_actual"]
+    assert bands["p0"][:3] == [100.0, 105.0, 110.0]
+    assert bands["p100"][:3] == [100.0, 110.0, 130.0]
+    assert bands["p50"][2] == 120.0
+    assert bands["p50"][8] == 200.0
+
+
+def test_aggregate_traces_without_samples() -> None:
+    """Cooks without samples should be left out of the aggregate."""
+    start = datetime(2024, 6, 1, tzinfo=UTC)
+
+    assert aggregate_traces(
+        [start], [[]], timedelta(minutes=5), ["grill_actual"], (50,)
+    ) == {"cook_count": 0, "count": [], "channels": {"grill_actual": {"p50": []}}}
@@ -0,0 +1,222 @@
+"""Tests for the Pitboss cook detail archive backends."""
+
+from datetime import UTC, datetime, timedelta
+import os
+from pathlib import Path
+import threading
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.pitboss.archive import (
+    CookDetailArchive,
+    PackedCookDetailArchive,
+    cook_detail_key,
+)
+from custom_components.pitboss.codec import (
+    SAMPLE_DELTA_COLUMNS,
+    SAMPLE_PLAIN_COLUMNS,
+    encode_columns,
+    to_epoch_microseconds,
+)
+from custom_components.pitboss.const import COOK_DETAIL_STORE_CACHE_SIZE
+from custom_components.pitboss.database import SqliteCookArchive
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Keep packed archive files written during tests out of the shared config dir."""
+    hass.config.config_dir = str(tmp_path)
+
+
+def _detail(cook_id: str, size: int) -> dict[str, Any]:
+    """Return a stored cook detail with a given number of samples."""
+    return {
+        "id": cook_id,
+        "samples": {"timestamp": [300_000_000] * size, "grill_actual": [1] * size},
+        "errors": [],
+    }
+
+
+async def test_packed_archive_reads_records_and_compacts_deleted_space(
+    hass: HomeAssistant,
+) -> None:
+    """Deleted cooks should be dropped from the data file by compaction."""
+    archive = PackedCookDetailArchive(hass, "entry")
+    for cook_id, size in (("a", 10), ("b", 200), ("c", 30)):
+        await archive.async_save(cook_id, _detail(cook_id, size))
+
+    first_path = archive.path
+    assert await archive.async_load("b") == _detail("b", 200)
+
+    await archive.async_remove("a")
+    await archive.async_remove("b")
+    await archive.async_compact()
+
+    assert archive.path != first_path
+    assert not os.path.exists(first_path)
+    assert os.path.getsize(archive.path) == archive._offsets["c"][1]
+    assert await archive.async_load("c") == _detail("c", 30)
+    assert await archive.async_load("b") is None
+
+    reopened = PackedCookDetailArchive(hass, "entry")
+    assert await reopened.async_load("c") == _detail("c", 30)
+
+
+async def test_packed_archive_keeps_compacted_file_until_reads_finish(
+    hass: HomeAssistant,
+) -> None:
+    """A read in flight during compaction should finish from the old file."""
+    archive = PackedCookDetailArchive(hass, "entry")
+    for cook_id, size in (("a", 10), ("b", 20)):
+        await archive.async_save(cook_id, _detail(cook_id, size))
+    await archive.async_remove("a")
+    first_path = archive.path
+    read_record = PackedCookDetailArchive._read_record
+    read_started = threading.Event()
+    release_read = threading.Event()
+
+    def _slow_read(path: str, offset: int, length: int) -> dict[str, Any]:
+        read_started.set()
+        release_read.wait(5)
+        return read_record(path, offset, length)
+
+    with patch.object(
+        PackedCookDetailArchive, "_read_record", staticmethod(_slow_read)
+    ):
+        load = hass.async_create_task(archive.async_load("b"))
+        await hass.async_add_executor_job(read_started.wait, 5)
+        await archive.async_compact()
+        assert archive.path != first_path
+        assert os.path.exists(first_path)
+
+        release_read.set()
+        assert await load == _detail("b", 20)
+
+    assert not os.path.exists(first_path)
+
+
+async def test_packed_archive_moves_per_cook_files_on_first_read(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Detail saved by the per-cook backend should migrate into the packed file."""
+    per_cook = CookDetailArchive(hass, "entry")
+    await per_cook.async_save("old", _detail("old", 5))
+    old_key = per_cook._get_store("old").key
+    assert old_key in hass_storage
+
+    archive = PackedCookDetailArchive(hass, "entry")
+
+    assert await archive.async_load("old") == _detail("old", 5)
+    assert "old" in archive._offsets
+    assert old_key not in hass_storage
+
+
+async def test_packed_archive_removes_many_cooks_with_one_index_write(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Bulk removal should drop packed and per-cook detail in one pass."""
+    per_cook = CookDetailArchive(hass, "entry")
+    await per_cook.async_save("old", _detail("old", 5))
+    old_key = per_cook._get_store("old").key
+    archive = PackedCookDetailArchive(hass, "entry")
+    for cook_id in ("a", "b", "c"):
+        await archive.async_save(cook_id, _detail(cook_id, 10))
+
+    with patch.object(
+        archive, "_async_save_index", wraps=archive._async_save_index
+    ) as save_index:
+        await archive.async_remove_many(["a", "old", "c", "missing"])
+
+    assert save_index.call_count == 1
+    assert set(archive._offsets) == {"b"}
+    assert old_key not in hass_storage
+    assert await archive.async_load("a") is None
+    assert await archive.async_load("b") == _detail("b", 10)
+
+
+async def test_archive_reports_detail_sizes_without_decoding(
+    hass: HomeAssistant,
+) -> None:
+    """Sizes should come from record lengths and file sizes, not re-encoding."""
+    archive = PackedCookDetailArchive(hass, "entry")
+    await archive.async_save("a", _detail("a", 10))
+    unpacked_path = hass.config.path(".storage", cook_detail_key("entry", "old"))
+    os.makedirs(os.path.dirname(unpacked_path), exist_ok=True)
+    with open(unpacked_path, "wb") as unpacked_file:
+        unpacked_file.write(b"{}" * 20)
+
+    with patch.object(archive, "_read_record") as read_record:
+        sizes = await archive.async_detail_sizes(["a", "old", "missing"])
+
+    read_record.assert_not_called()
+    assert sizes == {"a": archive._offsets["a"][1], "old": 40}
+
+
+async def test_per_cook_store_handles_are_bounded(hass: HomeAssistant) -> None:
+    """Only recently used per-cook store handles should stay open."""
+    archive = CookDetailArchive(hass, "entry")
+    cook_ids = [f"cook-{index}" for index in range(COOK_DETAIL_STORE_CACHE_SIZE * 2)]
+    for cook_id in cook_ids:
+        await archive.async_save(cook_id, _detail(cook_id, 3))
+
+    assert archive.store_cache_stats()["size"] == COOK_DETAIL_STORE_CACHE_SIZE
+    assert await archive.async_load(cook_ids[0]) == _detail(cook_ids[0], 3)
+    assert archive.store_cache_stats()["size"] == COOK_DETAIL_STORE_CACHE_SIZE
+
+
+async def test_sqlite_archive_round_trips_columns_with_a_repeated_timestamp(
+    hass: HomeAssistant,
+) -> None:
+    """A repeated sample timestamp should keep the later sample, not fail."""
+    archive = SqliteCookArchive(hass, "entry")
+    start = datetime(2024, 6, 1, 12, tzinfo=UTC)
+    samples = [
+        {
+            "timestamp": start + timedelta(minutes=minute),
+            "grill_actual": grill_actual,
+            "grill_set": 250,
+            "probe1_actual": 120 + minute,
+            "probe2_actual": 90,
+            "probe1_stalled": stalled,
+        }
+        for minute, grill_actual, stalled in (
+            (0, 230, None),
+            (5, 240, False),
+            (5, 245, True),
+            (10, 250, False),
+        )
+    ]
+    await archive.async_save_cook(
+        {
+            "id": "cook",
+            "start": to_epoch_microseconds(start),
+            "end": None,
+            "duration_seconds": 600,
+            "annotations": {"tags": [], "notes": None},
+        },
+        {
+            "id": "cook",
+            "samples": encode_columns(
+                samples, SAMPLE_DELTA_COLUMNS, SAMPLE_PLAIN_COLUMNS
+            ),
+            "errors": [],
+        },
+    )
+
+    detail = await archive.async_load("cook")
+    sizes = await archive.async_detail_sizes(["cook", "missing"])
+    await archive.async_close()
+
+    assert list(sizes) == ["cook"]
+    # Four samples of 7 values, with a NULL stalled flag counted as 0 bytes.
+    assert sizes["cook"] > 3 * 7 + 6
+
+    assert detail["samples"] == encode_columns(
+        [samples[0], *samples[2:]], SAMPLE_DELTA_COLUMNS, SAMPLE_PLAIN_COLUMNS
+    )
@@ -1,27 +1,57 @@
 """Tests for the Pitboss coordinator cook-session tracking."""
 
+import asyncio
 from collections.abc import Iterable
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import ANY, AsyncMock, call, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 
+from homeassistant.config_entries import ConfigEntryDisabler
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util.dt import utcnow
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 
 from custom_components.pitboss.const import (
+    ARCHIVE_BACKEND_PACKED,
+    ARCHIVE_BACKEND_SQLITE,
+    ARCHIVE_BACKEND_STORE,
     COOK_CONFIRMATION_WINDOW,
+    COOK_DETAIL_CACHE_SIZE,
+    CONF_ARCHIVE_BACKEND,
+    CONF_CAPTURE_POLL_LIMIT,
+    CONF_DETAIL_RETENTION_COOKS,
+    CONF_DETAIL_RETENTION_DAYS,
+    CONF_DROP_UNANNOTATED_COOKS,
     COOK_END_GRACE_PERIOD,
+    COOK_EXECUTOR_ROW_THRESHOLD,
+    COOK_RETENTION_SAMPLE_INTERVAL,
+    COOK_SORT_DURATION,
     DONE_CONFIRMATION_WINDOW,
     DOMAIN,
+    FLAME_OUT_POLL_INTERVAL,
     STALL_CONFIRMATION_WINDOW,
     TEMPERATURE_TREND_WINDOW,
 )
+from custom_components.pitboss.archive import cook_detail_key
 from custom_components.pitboss.binary_sensor import PitbossCookActiveBinarySensor
-from custom_components.pitboss.coordinator import PitbossDataUpdateCoordinator
+from custom_components.pitboss.coordinator import (
+    CookPhaseTracker,
+    PitbossDataUpdateCoordinator,
+)
+from custom_components.pitboss.codec import (
+    SAMPLE_DELTA_COLUMNS,
+    decode_columns,
+    to_epoch_microseconds,
+)
+from custom_components.pitboss.index import CookIndexEntry, CookQuery, decode_cursor
 from custom_components.pitboss.sensor import (
     PitbossCurrentCookDurationSensor,
     PitbossLastCookDurationSensor,
@@ -42,6 +72,11 @@ class FakePitbossApi:
             "GrillSetTemp": 0,
             "GrillActTemp": 0,
             "IsFarenheit": True,
+            "FanOn": False,
+            "IgniterOn": False,
+            "MotorOn": False,
+            "LightOn": False,
+            "Priming": False,
             "Error": False,
             "ErrorStr": "",
         }
@@ -69,6 +104,12 @@ class FakePitbossApi:
         return self._device_info.get(key)
 
 
+@pytest.fixture(autouse=True)
+def isolated_config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Keep cook journals written during tests out of the shared config dir."""
+    hass.config.config_dir = str(tmp_path)
+
+
 @pytest.fixture
 def coordinator(hass: HomeAssistant) -> PitbossDataUpdateCoordinator:
     """Return a coordinator backed by a fake API."""
@@ -153,6 +194,81 @@ def _complete_confirmed_cook(
     return probe_removed_at
 
 
+def test_probe_eta_follows_trend_within_tolerance(
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """The probe ETA should extrapolate the trend and ignore small movements."""
+
+    start = utcnow()
+    coordinator.api._state["P1SetTemp"] = 190
+    _record_probe1_history(
+        coordinator,
+        start,
+        (
+            (timedelta(0), 150),
+            (timedelta(minutes=10), 155),
+            (timedelta(minutes=20), 160),
+        ),
+    )
+    coordinator._update_probe_etas(start + timedelta(minutes=20))
+
+    eta = coordinator.get_probe_eta("P1SetTemp")
+    assert eta is not None
+    assert abs(eta - (start + timedelta(minutes=80))) < timedelta(seconds=1)
+
+    _record_probe1_history(coordinator, start, ((timedelta(minutes=22), 161),))
+    coordinator._update_probe_etas(start + timedelta(minutes=22))
+    assert coordinator.get_probe_eta("P1SetTemp") == eta
+
+    coordinator.api._state["P1SetTemp"] = 220
+    coordinator._update_probe_etas(start + timedelta(minutes=22))
+    assert coordinator.get_probe_eta("P1SetTemp") > eta + timedelta(minutes=30)
+
+    coordinator.api._state["P1SetTemp"] = 0
+    coordinator._update_probe_etas(start + timedelta(minutes=22))
+    assert coordinator.get_probe_eta("P1SetTemp") is None
+
+
+def test_flame_out_detector_confirms_with_fast_polling_and_clears(
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """A cooling grill with a feeding auger should raise and clear a flame-out."""
+
+    start = utcnow()
+    _confirm_cook(coordinator, start)
+    default_interval = coordinator.update_interval
+    coordinator.api._state.update({"GrillSetTemp": 250, "MotorOn": True})
+
+    detect_start = start + COOK_CONFIRMATION_WINDOW
+    for minute in range(6):
+        coordinator.api._state["GrillActTemp"] = 240 - 2 * minute
+        coordinator._update_flame_out_detector(detect_start + timedelta(minutes=minute))
+
+    assert coordinator.update_interval == FLAME_OUT_POLL_INTERVAL
+    assert coordinator.is_flame_out_detected() is False
+
+    for minute in (6, 7):
+        coordinator.api._state["GrillActTemp"] = 240 - 2 * minute
+        coordinator._update_flame_out_detector(detect_start + timedelta(minutes=minute))
+
+    assert coordinator.is_flame_out_detected() is True
+    assert coordinator.update_interval == default_interval
+
+    coordinator.api._state["GrillActTemp"] = 245
+    coordinator._update_flame_out_detector(detect_start + timedelta(minutes=8))
+
+    assert coordinator.is_flame_out_detected() is False
+    assert coordinator._active_cook is not None
+    assert coordinator._active_cook["errors"] == [
+        {
+            "timestamp": detect_start + timedelta(minutes=5),
+            "source": "flame_out",
+            "message": "Grill temperature is falling while the auger is feeding",
+            "end": detect_start + timedelta(minutes=8),
+        }
+    ]
+
+
 def test_current_cook_duration_starts_at_probe_insertion(
     coordinator: PitbossDataUpdateCoordinator,
     freezer: FrozenDateTimeFactory,
@@ -535,6 +651,200 @@ async def test_async_initialize_restores_probe_absent_grace_window(
     assert coordinator.get_last_cook_end() == absent_since
 
 
+async def test_active_cook_journal_replays_and_compacts_on_close(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """The active cook should survive a restart from its append-only journal."""
+
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    confirmed_at = start + COOK_CONFIRMATION_WINDOW
+    coordinator.api._state.update(
+        {"GrillSetTemp": 250, "GrillActTemp": 230, "FanOn": True}
+    )
+    _confirm_cook(coordinator, start)
+    coordinator.api._state["GrillActTemp"] = 240
+    coordinator._update_cook_tracking(confirmed_at + timedelta(minutes=2))
+    await coordinator.async_flush_cook_journal()
+
+    coordinator.api._state.update({"GrillActTemp": 245, "MotorOn": True})
+    coordinator._update_cook_tracking(confirmed_at + timedelta(minutes=6))
+    await coordinator.async_flush_cook_journal()
+
+    journal_path = Path(coordinator._journal.path)
+    records = coordinator._journal._read_records()
+    assert [record["index"] for record in records if record["type"] == "sample"] == [
+        0,
+        1,
+        1,
+        2,
+    ]
+
+    restored = PitbossDataUpdateCoordinator(
+        hass, FakePitbossApi(), coordinator.config_entry
+    )
+    await restored.async_initialize()
+
+    assert restored._active_cook is not None
+    assert restored._active_cook["confirmed_start"] == confirmed_at
+    assert restored._active_cook["samples"] == coordinator._active_cook["samples"]
+    assert (
+        restored._active_cook["state_transitions"]
+        == coordinator._active_cook["state_transitions"]
+    )
+
+    probe_removed_at = confirmed_at + timedelta(minutes=10)
+    coordinator.api._state["P1ActTemp"] = 0
+    coordinator._update_cook_tracking(probe_removed_at)
+    coordinator._update_cook_tracking(probe_removed_at + COOK_END_GRACE_PERIOD)
+    await hass.async_block_till_done()
+
+    assert not journal_path.exists()
+    cook = await coordinator.async_get_cook(start.isoformat())
+    assert cook is not None
+    assert len(cook["samples"]) == 3
+
+
+async def test_closing_the_archive_releases_the_journal_final_write_listener(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """Unloading should flush the journal and stop listening for the final write."""
+
+    def _final_write_listeners() -> int:
+        return hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_FINAL_WRITE, 0)
+
+    listeners = _final_write_listeners()
+    coordinator.api._state["P1ActTemp"] = 120
+    coordinator._update_cook_tracking(utcnow())
+    assert _final_write_listeners() == listeners + 1
+
+    await coordinator.async_close_cook_archive()
+
+    assert _final_write_listeners() == listeners
+    assert coordinator._journal._read_records()
+
+
+async def test_closing_the_archive_waits_for_the_completed_cook_to_be_saved(
+    hass: HomeAssistant,
+) -> None:
+    """A cook that ends right before unload should be archived before closing."""
+    coordinator = _sqlite_coordinator(hass, "pitboss-entry")
+    await coordinator.async_initialize()
+    database = coordinator._cook_database
+    calls: list[str] = []
+    save_cook = database.async_save_cook
+    close = database.async_close
+
+    async def _save_cook(*args: Any) -> None:
+        await save_cook(*args)
+        calls.append("save_cook")
+
+    async def _close() -> None:
+        calls.append("close")
+        await close()
+
+    def _create_task(target: Any, name: str | None = None) -> asyncio.Task[Any]:
+        # Start the task lazily, so it has not taken the journal lock yet.
+        return create_task(target, name, eager_start=False)
+
+    create_task = hass.async_create_task
+    start = utcnow().replace(microsecond=0) - timedelta(days=1)
+    with (
+        patch.object(database, "async_save_cook", side_effect=_save_cook),
+        patch.object(database, "async_close", side_effect=_close),
+        patch.object(hass, "async_create_task", side_effect=_create_task),
+    ):
+        _complete_confirmed_cook(coordinator, start)
+        await coordinator.async_close_cook_archive()
+
+    assert calls == ["save_cook", "close"]
+    assert not coordinator._journal._read_records()
+
+
+async def test_active_cook_errors_are_journaled_as_their_own_records(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """Errors should be journaled one record each and kept out of the header."""
+
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    coordinator.api._state["P1ActTemp"] = 120
+    coordinator._update_cook_tracking(start)
+    coordinator.api._state.update({"Error": True, "ErrorStr": "Flame out"})
+    coordinator._update_cook_tracking(start + timedelta(minutes=1))
+    await coordinator.async_flush_cook_journal()
+
+    coordinator.api._state.update({"Error": False, "ErrorStr": ""})
+    coordinator._update_cook_tracking(start + timedelta(minutes=2))
+    for minute in range(5, 30, 5):
+        coordinator.api._state["P1ActTemp"] = 120 + minute
+        coordinator._update_cook_tracking(start + timedelta(minutes=minute))
+        await coordinator.async_flush_cook_journal()
+
+    records = coordinator._journal._read_records()
+    assert all(
+        "errors" not in record["cook"] and "summary" not in record["cook"]
+        for record in records
+        if record["type"] == "header"
+    )
+    assert [
+        (record["index"], "end_timestamp" in record["error"])
+        for record in records
+        if record["type"] == "error"
+    ] == [(0, False), (0, True)]
+
+    replayed = coordinator._replay_active_cook_journal(records)
+    assert replayed["errors"] == [
+        coordinator._serialize_cook_error(error)
+        for error in coordinator._active_cook["errors"]
+    ]
+    assert replayed["summary"] == coordinator._active_cook["summary"]
+
+
+def test_phase_tracker_matches_full_segmentation(
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """The incrementally tracked phase should match segmenting every sample."""
+
+    start = datetime(2024, 6, 1, 12, tzinfo=UTC)
+    cook = coordinator._create_active_cook(start)
+    tracker = CookPhaseTracker()
+    steps = [
+        (False, 150, False),
+        (False, 240, False),
+        (False, 245, True),
+        (True, 245, False),
+        (True, 245, True),
+        (False, 250, True),
+        (False, 250, False),
+    ]
+    for replace_last, grill_actual, stalled in steps:
+        bucket = len(cook["samples"]) - 1 if replace_last else len(cook["samples"])
+        sample = {
+            "timestamp": start + timedelta(minutes=5 * bucket),
+            "grill_actual": grill_actual,
+            "grill_set": 250,
+            "probe1_actual": 150,
+            "probe2_actual": 0,
+            "probe1_stalled": stalled,
+        }
+        if replace_last:
+            cook["samples"][-1] = sample
+        else:
+            cook["samples"].append(sample)
+
+        phases = coordinator._segment_cook_phases(cook)
+        assert tracker.current(cook) == (len(phases) - 1, phases[-1])
+
+    assert [phase["phase"] for phase in phases] == [
+        "preheat",
+        "smoke",
+        "stall",
+        "finish",
+    ]
+
+
 def test_cook_samples_are_downsampled_to_five_minute_buckets(
     coordinator: PitbossDataUpdateCoordinator,
 ) -> None:
@@ -579,6 +889,124 @@ def test_cook_samples_are_downsampled_to_five_minute_buckets(
     assert coordinator._active_cook["summary"]["peak_grill_set"] == 250
 
 
+async def test_every_poll_is_captured_in_ring_and_folded_into_rollups(
+    hass: HomeAssistant,
+) -> None:
+    """Every poll should reach the bounded ring, its journal and the rollup."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Pit Boss",
+        data={},
+        options={CONF_CAPTURE_POLL_LIMIT: 3},
+        unique_id="pitboss-test",
+        minor_version=2,
+    )
+    coordinator = PitbossDataUpdateCoordinator(hass, FakePitbossApi(), config_entry)
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    coordinator.api._state.update(
+        {"P1ActTemp": 120, "P2ActTemp": 90, "GrillSetTemp": 250}
+    )
+
+    for minute, grill_actual in enumerate((230, 240, 250, 226)):
+        coordinator.api._state["GrillActTemp"] = grill_actual
+        coordinator._update_cook_tracking(start + timedelta(minutes=minute))
+
+    capture = coordinator.get_active_cook_capture()
+    assert capture["polls"]["grill_actual"] == [240, 250, 226]
+    assert capture["polls"]["offsets"][0] == 60_000
+
+    assert coordinator._active_cook is not None
+    assert len(coordinator._active_cook["samples"]) == 1
+    [rollup] = coordinator._active_cook["rollups"]
+    assert rollup["count"] == 4
+    assert rollup["grill_actual_min"] == 226
+    assert rollup["grill_actual_max"] == 250
+    assert rollup["grill_actual_mean"] == pytest.approx(236.5)
+    assert rollup["probe1_actual_mean"] == pytest.approx(120)
+
+    records = coordinator._active_cook_journal_records()
+    coordinator._update_cook_tracking(start + timedelta(minutes=4))
+    records += coordinator._active_cook_journal_records()
+    assert [
+        len(record["polls"]["timestamp"])
+        for record in records
+        if record["type"] == "capture"
+    ] == [3, 1]
+    replayed = coordinator._replay_active_cook_journal(records)
+    assert [
+        decode_columns(polls, SAMPLE_DELTA_COLUMNS)[-1]["grill_actual"]
+        for polls in replayed["capture"]
+    ] == [226, 226]
+
+
+def test_unchanged_polls_do_not_schedule_a_save(
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """Only polls that change the bucket sample should be persisted."""
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    coordinator.api._state["P1ActTemp"] = 120
+    coordinator._update_cook_tracking(start)
+
+    with patch.object(coordinator, "_schedule_store_save") as schedule_save:
+        coordinator._update_cook_tracking(start + timedelta(minutes=1))
+        assert schedule_save.call_count == 0
+
+        coordinator.api._state["P1ActTemp"] = 125
+        coordinator._update_cook_tracking(start + timedelta(minutes=2))
+        assert schedule_save.call_count == 1
+
+    assert coordinator._active_cook["rollups"][0]["count"] == 3
+
+
+def test_completed_cook_is_segmented_into_phases(
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """Closing a cook should store phase boundaries with its summary."""
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    cook = coordinator._create_active_cook(start)
+    for minutes, grill_actual, stalled in (
+        (0, 150, False),
+        (20, 245, False),
+        (60, 250, False),
+        (90, 250, True),
+        (120, 250, True),
+        (150, 250, False),
+        (180, 250, False),
+    ):
+        cook["samples"].append(
+            {
+                "timestamp": start + timedelta(minutes=minutes),
+                "grill_actual": grill_actual,
+                "grill_set": 250,
+                "probe1_actual": 165,
+                "probe2_actual": 0,
+                "probe1_stalled": stalled,
+            }
+        )
+    cook["done_at"] = start + timedelta(minutes=180)
+    cook["end"] = start + timedelta(minutes=200)
+
+    cook["phases"] = coordinator._segment_cook_phases(cook)
+    phases = coordinator._serialize_cook_entry(
+        coordinator._cook_summary_from_active_cook(cook)
+    )["phases"]
+
+    assert [(phase["phase"], phase["start"], phase["end"]) for phase in phases] == [
+        (
+            name,
+            (start + timedelta(minutes=begin)).isoformat(),
+            (start + timedelta(minutes=end)).isoformat(),
+        )
+        for name, begin, end in (
+            ("preheat", 0, 20),
+            ("smoke", 20, 90),
+            ("stall", 90, 150),
+            ("finish", 150, 180),
+            ("rest", 180, 200),
+        )
+    ]
+
+
 async def test_update_cook_annotations_only_changes_mutable_fields(
     coordinator: PitbossDataUpdateCoordinator,
 ) -> None:
@@ -600,6 +1028,649 @@ async def test_update_cook_annotations_only_changes_mutable_fields(
     assert updated["start"] == start.isoformat()
 
 
+def _stored_cook_session(start: datetime) -> dict[str, object]:
+    """Return a completed cook session in its stored form."""
+    end = start + timedelta(hours=8)
+    return {
+        "id": start.isoformat(),
+        "start": start.isoformat(),
+        "confirmed_start": (start + COOK_CONFIRMATION_WINDOW).isoformat(),
+        "end": end.isoformat(),
+        "duration_seconds": int((end - start).total_seconds()),
+        "done_at": None,
+        "stall_count": 0,
+        "summary": {"sample_count": 96},
+        "annotations": {"tags": [], "notes": None},
+    }
+
+
+@pytest.mark.parametrize("archive_size", [120, 3000])
+async def test_annotation_save_only_rewrites_its_month_segment(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+    archive_size: int,
+) -> None:
+    """Index save cost should stay flat as the archive grows."""
+    starts = [
+        datetime(2000 + month // 12, month % 12 + 1, day + 1, 12, tzinfo=UTC)
+        for month, day in (divmod(index, 10) for index in range(archive_size))
+    ]
+    coordinator._store.async_load = AsyncMock(
+        return_value={"sessions": [_stored_cook_session(start) for start in starts]}
+    )
+    await coordinator.async_initialize()
+
+    assert len(coordinator._cook_segments) == archive_size // 10
+    assert len(coordinator.list_cooks()) == archive_size
+
+    coordinator._store.async_save = AsyncMock()
+    with patch.object(
+        CookIndexEntry, "as_stored", autospec=True, side_effect=CookIndexEntry.as_stored
+    ) as as_stored:
+        await coordinator.async_update_cook_annotations(
+            starts[-1].isoformat(), tags=["brisket"]
+        )
+
+    # Ten sessions in the edited month plus the returned summary.
+    assert as_stored.call_count == 11
+    coordinator._store.async_save.assert_not_awaited()
+
+    assert await coordinator.async_delete_cook(starts[0].isoformat()) is True
+    assert len(coordinator._cook_segments[starts[0].strftime("%Y-%m")]) == 9
+    coordinator._store.async_save.assert_not_awaited()
+
+    restored = PitbossDataUpdateCoordinator(
+        hass, FakePitbossApi(), coordinator.config_entry
+    )
+    await restored.async_initialize()
+
+    cooks = restored.list_cooks()
+    assert len(cooks) == archive_size - 1
+    assert cooks[0]["annotations"]["tags"] == ["brisket"]
+
+
+async def test_index_entries_keep_epoch_timestamps_until_the_api(
+    coordinator: PitbossDataUpdateCoordinator,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Index segments should load into slotted entries and store epoch times."""
+    start = datetime(2024, 6, 1, 12, tzinfo=UTC)
+    entry_id = coordinator.config_entry.entry_id
+    index_key = f"{DOMAIN}_{entry_id}_cook_sessions"
+    segment_key = f"{index_key}_2024-06"
+    hass_storage[index_key] = {
+        "version": 3,
+        "minor_version": 1,
+        "key": index_key,
+        "data": {"segments": ["2024-06"]},
+    }
+    hass_storage[segment_key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": segment_key,
+        "data": {"sessions": [_stored_cook_session(start)]},
+    }
+    await coordinator.async_initialize()
+
+    entry = coordinator._cook_sessions[0]
+    assert isinstance(entry, CookIndexEntry)
+    assert not hasattr(entry, "__dict__")
+    assert entry.start == to_epoch_microseconds(start)
+    assert coordinator.get_last_cook_start() == start
+    assert coordinator.list_cooks()[0]["start"] == start.isoformat()
+
+    await coordinator.async_update_cook_annotations(start.isoformat(), tags=["ribs"])
+
+    assert hass_storage[segment_key]["version"] == 2
+    stored_session = hass_storage[segment_key]["data"]["sessions"][0]
+    assert stored_session["start"] == to_epoch_microseconds(start)
+    assert stored_session["end"] == to_epoch_microseconds(start + timedelta(hours=8))
+
+
+async def test_storage_scan_removes_orphans_and_flags_missing_detail(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """The scan should delete unreferenced cook files and report absent detail."""
+    starts = [datetime(2024, 6, day, 12, tzinfo=UTC) for day in (1, 2)]
+    coordinator._store.async_load = AsyncMock(
+        return_value={"sessions": [_stored_cook_session(start) for start in starts]}
+    )
+    await coordinator.async_initialize()
+    entry_id = coordinator.config_entry.entry_id
+    storage_dir = Path(hass.config.path(".storage"))
+    storage_dir.mkdir(exist_ok=True)
+    kept = storage_dir / cook_detail_key(entry_id, starts[0].isoformat())
+    disabled_entry = MockConfigEntry(
+        domain=DOMAIN, disabled_by=ConfigEntryDisabler.USER
+    )
+    disabled_entry.add_to_hass(hass)
+    orphans = [
+        storage_dir / cook_detail_key(entry_id, "deleted-cook"),
+        storage_dir / f"{DOMAIN}_removedentry_cook_sessions",
+        storage_dir / f"{DOMAIN}_removedentry_active_cook.journal",
+    ]
+    unrelated = [
+        storage_dir / "core.config_entries",
+        storage_dir / f"{DOMAIN}_shared_settings",
+        storage_dir / f"{DOMAIN}_{disabled_entry.entry_id}_cook_sessions",
+    ]
+    for path in (kept, *orphans, *unrelated):
+        path.write_text("{}")
+
+    with (
+        patch("custom_components.pitboss.integrity.COOK_STORAGE_SCAN_BATCH_SIZE", 2),
+        patch("custom_components.pitboss.integrity.COOK_STORAGE_SCAN_BATCH_DELAY", 0),
+    ):
+        summary = await coordinator.async_scan_cook_storage()
+
+    assert kept.exists()
+    assert all(path.exists() for path in unrelated)
+    assert not any(path.exists() for path in orphans)
+    assert summary["orphans_removed"] == 1
+    assert summary["leftover_files_removed"] == 2
+    assert summary["bytes_reclaimed"] == 6
+    assert summary["missing_detail"] == [starts[1].isoformat()]
+    assert coordinator.get_cook_archive_diagnostics()["integrity"] == summary
+
+
+async def test_row_cook_detail_migrates_to_smaller_columnar_format(
+    coordinator: PitbossDataUpdateCoordinator,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Row-per-sample detail should load through migration and shrink on save."""
+    start = datetime(2024, 6, 1, 12, tzinfo=UTC)
+    cook_id = start.isoformat()
+    coordinator._store.async_load = AsyncMock(
+        return_value={"sessions": [_stored_cook_session(start)]}
+    )
+    await coordinator.async_initialize()
+
+    row_samples = [
+        {
+            "timestamp": (start + index * timedelta(minutes=5, seconds=1)).isoformat(),
+            "grill_actual": 225 + index % 4,
+            "grill_set": 250,
+            "probe1_actual": 100 + index // 2,
+            "probe2_actual": 0,
+            "probe1_stalled": 40 <= index < 60,
+        }
+        for index in range(96)
+    ]
+    detail_key = coordinator._detail_archive._get_store(cook_id).key
+    hass_storage[detail_key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": detail_key,
+        "data": {"id": cook_id, "samples": row_samples, "errors": []},
+    }
+
+    cook = await coordinator.async_get_cook(cook_id)
+
+    assert cook is not None
+    assert cook["samples"] == row_samples
+
+    detail = await coordinator._async_load_cook_detail(cook_id)
+    columnar = coordinator._serialize_cook_detail({"id": cook_id, **detail})
+    assert columnar["samples"]["grill_set"][1:] == [0] * 95
+    assert len(json_dumps(columnar["samples"])) * 3 < len(json_dumps(row_samples))
+
+
+async def test_cook_detail_cache_serves_repeat_reads_until_cook_changes(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """Repeat reads should skip the archive until the cook is edited or deleted."""
+    await coordinator.async_initialize()
+    start = utcnow().replace(microsecond=0) - timedelta(days=1)
+    cook_id = start.isoformat()
+    _complete_confirmed_cook(coordinator, start)
+    await hass.async_block_till_done()
+
+    with patch.object(
+        coordinator._detail_archive,
+        "async_load",
+        wraps=coordinator._detail_archive.async_load,
+    ) as async_load:
+        first = await coordinator.async_get_cook(cook_id)
+        assert await coordinator.async_get_cook(cook_id) == first
+        assert async_load.await_count == 1
+
+        await coordinator.async_update_cook_annotations(cook_id, tags=["ribs"])
+        await coordinator.async_get_cook(cook_id)
+        assert async_load.await_count == 2
+
+    assert coordinator.get_cook_archive_diagnostics()["detail_cache"] == {
+        "size": 1,
+        "max_size": COOK_DETAIL_CACHE_SIZE,
+        "hits": 1,
+        "misses": 2,
+    }
+    assert await coordinator.async_delete_cook(cook_id) is True
+    assert coordinator.get_cook_archive_diagnostics()["detail_cache"]["size"] == 0
+
+
+@pytest.mark.parametrize(
+    ("sample_count", "offloaded"),
+    [(10, False), (COOK_EXECUTOR_ROW_THRESHOLD, True)],
+)
+async def test_large_cook_detail_is_decoded_in_executor(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+    sample_count: int,
+    offloaded: bool,
+) -> None:
+    """Only detail above the row threshold should leave the event loop."""
+    start = datetime(2024, 6, 1, 12, tzinfo=UTC)
+    cook_id = start.isoformat()
+    samples = [
+        {
+            "timestamp": start + index * timedelta(seconds=15),
+            "grill_actual": 225 + index % 4,
+            "grill_set": 250,
+            "probe1_actual": 100 + index // 40,
+            "probe2_actual": 0,
+            "probe1_stalled": False,
+        }
+        for index in range(sample_count)
+    ]
+    await coordinator._detail_archive.async_save(
+        cook_id, coordinator._serialize_cook_detail({"id": cook_id, "samples": samples})
+    )
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as add_executor_job:
+        detail = await coordinator._async_load_cook_detail(cook_id)
+
+    assert detail["samples"] == samples
+    assert (
+        call(coordinator._deserialize_cook_detail, ANY)
+        in add_executor_job.call_args_list
+    ) is offloaded
+
+
+def _complete_sampled_cook(
+    coordinator: PitbossDataUpdateCoordinator, start: datetime
+) -> None:
+    """Run a three-hour cook polled every five minutes."""
+    coordinator.api._state["P1ActTemp"] = 165
+    for minutes in range(0, 181, 5):
+        coordinator._update_cook_tracking(start + timedelta(minutes=minutes))
+    probe_removed_at = start + timedelta(minutes=185)
+    coordinator.api._state["P1ActTemp"] = 0
+    coordinator._update_cook_tracking(probe_removed_at)
+    coordinator._update_cook_tracking(probe_removed_at + COOK_END_GRACE_PERIOD)
+
+
+def _retention_coordinator(
+    hass: HomeAssistant, options: dict[str, Any]
+) -> PitbossDataUpdateCoordinator:
+    """Return a coordinator with archive retention options."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Pit Boss",
+        data={},
+        options=options,
+        unique_id="pitboss-test",
+        minor_version=2,
+    )
+    return PitbossDataUpdateCoordinator(hass, FakePitbossApi(), config_entry)
+
+
+async def test_retention_downsamples_detail_beyond_kept_cooks(
+    hass: HomeAssistant,
+) -> None:
+    """Only cooks past the kept count should lose their full-resolution detail."""
+    coordinator = _retention_coordinator(hass, {CONF_DETAIL_RETENTION_COOKS: 1})
+    await coordinator.async_initialize()
+    first_start = utcnow().replace(microsecond=0) - timedelta(days=3)
+    starts = [first_start + timedelta(days=day) for day in range(3)]
+    for start in starts:
+        _complete_sampled_cook(coordinator, start)
+    await hass.async_block_till_done()
+    full_samples = (await coordinator.async_get_cook(starts[-1].isoformat()))[
+        "samples"
+    ]
+
+    assert await coordinator.async_enforce_retention() > 0
+    assert await coordinator.async_enforce_retention() == 0
+
+    for start in starts[:-1]:
+        cook = await coordinator.async_get_cook(start.isoformat())
+        assert cook["detail_downsampled"] is True
+        assert cook["rollups"] == []
+        timestamps = [
+            datetime.fromisoformat(sample["timestamp"]) for sample in cook["samples"]
+        ]
+        assert 1 < len(timestamps) < len(full_samples)
+        assert all(
+            later - earlier >= COOK_RETENTION_SAMPLE_INTERVAL
+            for earlier, later in zip(timestamps, timestamps[1:], strict=False)
+        )
+    newest = await coordinator.async_get_cook(starts[-1].isoformat())
+    assert newest["detail_downsampled"] is False
+    assert newest["samples"] == full_samples
+    assert coordinator.get_cook_archive_diagnostics()["retention"][
+        "cooks_downsampled"
+    ] == 2
+
+
+async def test_retention_drops_old_unannotated_cooks_in_batches(
+    hass: HomeAssistant,
+) -> None:
+    """Old cooks without annotations should be deleted a batch at a time."""
+    coordinator = _retention_coordinator(
+        hass,
+        {CONF_DETAIL_RETENTION_DAYS: 7, CONF_DROP_UNANNOTATED_COOKS: True},
+    )
+    await coordinator.async_initialize()
+    first_start = utcnow().replace(microsecond=0) - timedelta(days=30)
+    starts = [first_start + timedelta(days=day) for day in (0, 1, 2, 29)]
+    for start in starts:
+        _complete_confirmed_cook(coordinator, start)
+    await hass.async_block_till_done()
+    await coordinator.async_update_cook_annotations(
+        starts[0].isoformat(), notes="Competition brisket"
+    )
+
+    with (
+        patch(
+            "custom_components.pitboss.coordinator.COOK_RETENTION_BATCH_SIZE", 2
+        ),
+        patch.object(
+            coordinator,
+            "async_bulk_delete_cooks",
+            wraps=coordinator.async_bulk_delete_cooks,
+        ) as bulk_delete,
+        patch.object(
+            coordinator._detail_archive,
+            "async_load",
+            wraps=coordinator._detail_archive.async_load,
+        ) as load_detail,
+    ):
+        await coordinator.async_enforce_retention()
+        bulk_delete.assert_awaited_once_with(
+            [starts[2].isoformat(), starts[1].isoformat()]
+        )
+        load_detail.assert_not_called()
+        assert [cook["detail_downsampled"] for cook in coordinator.list_cooks()] == [
+            False,
+            False,
+        ]
+        await coordinator.async_enforce_retention()
+
+    cooks = coordinator.list_cooks()
+    assert [cook["id"] for cook in cooks] == [
+        starts[-1].isoformat(),
+        starts[0].isoformat(),
+    ]
+    assert [cook["detail_downsampled"] for cook in cooks] == [False, True]
+    assert coordinator.get_cook_archive_diagnostics()["retention"][
+        "cooks_deleted"
+    ] == 2
+
+
+def _archive_coordinator(
+    hass: HomeAssistant, entry_id: str, backend: str
+) -> PitbossDataUpdateCoordinator:
+    """Return a coordinator using one archive backend for a config entry id."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Pit Boss",
+        data={},
+        options={CONF_ARCHIVE_BACKEND: backend},
+        entry_id=entry_id,
+        unique_id="pitboss-test",
+        minor_version=2,
+    )
+    return PitbossDataUpdateCoordinator(hass, FakePitbossApi(), config_entry)
+
+
+def _sqlite_coordinator(
+    hass: HomeAssistant, entry_id: str
+) -> PitbossDataUpdateCoordinator:
+    """Return a coordinator using the SQLite archive for a config entry id."""
+    return _archive_coordinator(hass, entry_id, ARCHIVE_BACKEND_SQLITE)
+
+
+async def test_json_archive_is_imported_into_sqlite(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Switching to SQLite should import cooks and drop the JSON stores."""
+    await coordinator.async_initialize()
+    first_start = utcnow().replace(microsecond=0) - timedelta(days=2)
+    second_start = first_start + timedelta(days=1)
+    _complete_confirmed_cook(coordinator, first_start)
+    _complete_confirmed_cook(coordinator, second_start)
+    await hass.async_block_till_done()
+    expected = await coordinator.async_get_cook(first_start.isoformat())
+
+    database_coordinator = _sqlite_coordinator(hass, coordinator.config_entry.entry_id)
+    await database_coordinator.async_initialize()
+
+    assert not [key for key in hass_storage if key.startswith(DOMAIN)]
+    assert [cook["id"] for cook in await database_coordinator.async_list_cooks()] == [
+        second_start.isoformat(),
+        first_start.isoformat(),
+    ]
+    assert database_coordinator.get_last_cook_start() == second_start
+    assert await database_coordinator.async_get_cook(first_start.isoformat()) == (
+        expected
+    )
+    await database_coordinator.async_close_cook_archive()
+
+
+@pytest.mark.parametrize(
+    ("source", "target"),
+    [
+        (ARCHIVE_BACKEND_PACKED, ARCHIVE_BACKEND_STORE),
+        (ARCHIVE_BACKEND_SQLITE, ARCHIVE_BACKEND_STORE),
+        (ARCHIVE_BACKEND_SQLITE, ARCHIVE_BACKEND_PACKED),
+    ],
+)
+async def test_switching_archive_backend_keeps_every_cook(
+    hass: HomeAssistant,
+    source: str,
+    target: str,
+) -> None:
+    """Cooks archived by one backend should stay readable after a switch."""
+    coordinator = _archive_coordinator(hass, "pitboss-entry", source)
+    await coordinator.async_initialize()
+    first_start = utcnow().replace(microsecond=0) - timedelta(days=2)
+    starts = [first_start, first_start + timedelta(days=1)]
+    for start in starts:
+        _complete_confirmed_cook(coordinator, start)
+    await hass.async_block_till_done()
+    expected = [await coordinator.async_get_cook(start.isoformat()) for start in starts]
+    await coordinator.async_close_cook_archive()
+
+    switched = _archive_coordinator(hass, "pitboss-entry", target)
+    await switched.async_initialize()
+
+    assert [cook["id"] for cook in await switched.async_list_cooks()] == [
+        start.isoformat() for start in reversed(starts)
+    ]
+    assert [
+        await switched.async_get_cook(start.isoformat()) for start in starts
+    ] == expected
+    storage_dir = Path(hass.config.path(".storage"))
+    assert not list(storage_dir.glob(f"{DOMAIN}_pitboss-entry_cooks.db*"))
+    if target == ARCHIVE_BACKEND_STORE:
+        assert not list(storage_dir.glob("*.pack"))
+
+
+async def test_sqlite_archive_annotates_and_deletes_across_restarts(
+    hass: HomeAssistant,
+) -> None:
+    """Completed cooks should round-trip through the database."""
+    coordinator = _sqlite_coordinator(hass, "pitboss-entry")
+    await coordinator.async_initialize()
+    first_start = utcnow().replace(microsecond=0) - timedelta(days=2)
+    second_start = first_start + timedelta(days=1)
+    _complete_confirmed_cook(coordinator, first_start)
+    _complete_confirmed_cook(coordinator, second_start)
+    await hass.async_block_till_done()
+
+    annotated = await coordinator.async_update_cook_annotations(
+        first_start.isoformat(), tags=["Brisket"], notes="Wrapped at 165"
+    )
+    assert annotated is not None
+    assert annotated["annotations"] == {"tags": ["brisket"], "notes": "Wrapped at 165"}
+    assert await coordinator.async_delete_cook(second_start.isoformat()) is True
+    assert await coordinator.async_delete_cook(second_start.isoformat()) is False
+    assert coordinator.get_last_cook_start() == first_start
+    await coordinator.async_close_cook_archive()
+
+    restored = _sqlite_coordinator(hass, "pitboss-entry")
+    await restored.async_initialize()
+
+    cooks = await restored.async_list_cooks()
+    assert [cook["id"] for cook in cooks] == [first_start.isoformat()]
+    assert cooks[0]["annotations"]["tags"] == ["brisket"]
+    cook = await restored.async_get_cook(first_start.isoformat())
+    assert cook is not None
+    assert cook["samples"][0]["timestamp"] == first_start.isoformat()
+    await restored.async_close_cook_archive()
+
+
+async def test_sqlite_retention_only_reads_cooks_it_acts_on(
+    hass: HomeAssistant,
+) -> None:
+    """SQLite retention should fetch one batch of pending cooks, not every one."""
+    coordinator = _retention_coordinator(
+        hass,
+        {
+            CONF_ARCHIVE_BACKEND: ARCHIVE_BACKEND_SQLITE,
+            CONF_DETAIL_RETENTION_DAYS: 7,
+            CONF_DROP_UNANNOTATED_COOKS: True,
+        },
+    )
+    await coordinator.async_initialize()
+    first_start = utcnow().replace(microsecond=0) - timedelta(days=30)
+    starts = [first_start + timedelta(days=day) for day in (0, 1, 2, 29)]
+    for start in starts:
+        _complete_sampled_cook(coordinator, start)
+    await hass.async_block_till_done()
+    await coordinator.async_update_cook_annotations(
+        starts[0].isoformat(), notes="Competition brisket"
+    )
+
+    with (
+        patch(
+            "custom_components.pitboss.coordinator.COOK_RETENTION_BATCH_SIZE", 1
+        ),
+        patch.object(
+            coordinator._cook_database,
+            "async_list_sessions",
+            side_effect=AssertionError("every session was listed"),
+        ),
+    ):
+        for _ in range(3):
+            assert await coordinator.async_enforce_retention() > 0
+        assert await coordinator._async_cooks_past_detail_retention(True) == []
+        assert await coordinator.async_enforce_retention() == 0
+
+    cooks = await coordinator.async_list_cooks()
+    assert [cook["id"] for cook in cooks] == [
+        starts[-1].isoformat(),
+        starts[0].isoformat(),
+    ]
+    assert [cook["detail_downsampled"] for cook in cooks] == [False, True]
+    await coordinator.async_close_cook_archive()
+
+
+@pytest.mark.parametrize("sqlite", [False, True])
+async def test_cook_queries_filter_sort_and_page(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+    sqlite: bool,
+) -> None:
+    """Both backends should answer filtered, paged listings the same way."""
+    if sqlite:
+        coordinator = _sqlite_coordinator(hass, coordinator.config_entry.entry_id)
+    starts = [datetime(2024, 6, day, 12, tzinfo=UTC) for day in range(1, 7)]
+    sessions = []
+    for start, hours in zip(starts, (5, 2, 8, 3, 8, 1), strict=True):
+        session = _stored_cook_session(start)
+        session["duration_seconds"] = hours * 3600
+        if start.day % 2 == 0 or start.day == 3:
+            session["annotations"] = {"tags": ["brisket"], "notes": None}
+        sessions.append(session)
+    coordinator._store.async_load = AsyncMock(return_value={"sessions": sessions})
+    await coordinator.async_initialize()
+
+    async def _days(query: CookQuery) -> list[list[int]]:
+        pages = []
+        while True:
+            cooks, cursor = await coordinator.async_query_cooks(query)
+            pages.append([datetime.fromisoformat(cook["start"]).day for cook in cooks])
+            if cursor is None:
+                return pages
+            query = replace(query, cursor=decode_cursor(cursor))
+
+    assert await _days(CookQuery(limit=2)) == [[6, 5], [4, 3], [2, 1]]
+    assert await _days(CookQuery(tags=frozenset({"brisket"}))) == [[6, 4, 3, 2]]
+    assert await _days(
+        CookQuery(sort=COOK_SORT_DURATION, min_duration=3 * 3600, limit=3)
+    ) == [[5, 3, 1], [4]]
+    assert await _days(
+        CookQuery(
+            started_after=to_epoch_microseconds(starts[1]),
+            started_before=to_epoch_microseconds(starts[4]),
+            descending=False,
+        )
+    ) == [[3, 4]]
+    await coordinator.async_close_cook_archive()
+
+
+@pytest.mark.parametrize("sqlite", [False, True])
+async def test_bulk_cook_edits_persist_and_notify_once(
+    hass: HomeAssistant,
+    coordinator: PitbossDataUpdateCoordinator,
+    sqlite: bool,
+) -> None:
+    """Bulk annotation and deletion should write and notify once per call."""
+    if sqlite:
+        coordinator = _sqlite_coordinator(hass, coordinator.config_entry.entry_id)
+    await coordinator.async_initialize()
+    starts = [
+        utcnow().replace(microsecond=0) - timedelta(days=day) for day in (3, 2, 1)
+    ]
+    for start in starts:
+        _complete_confirmed_cook(coordinator, start)
+    await hass.async_block_till_done()
+    cook_ids = [start.isoformat() for start in starts]
+    changes: list[dict[str, Any]] = []
+    coordinator.async_subscribe_cook_changes(changes.append)
+
+    with patch.object(
+        coordinator,
+        "_async_save_cook_index",
+        wraps=coordinator._async_save_cook_index,
+    ) as save_index:
+        updated = await coordinator.async_bulk_update_cook_annotations(
+            [*cook_ids[:2], "missing"], tags=["Test"]
+        )
+        deleted = await coordinator.async_bulk_delete_cooks(
+            [cook_ids[0], cook_ids[2], "missing"]
+        )
+
+    assert [cook["id"] for cook in updated] == cook_ids[:2]
+    assert deleted == [cook_ids[0], cook_ids[2]]
+    assert save_index.call_count == (1 if sqlite else 2)
+    assert [len(change["cooks"]) for change in changes] == [2, 0]
+    assert changes[1]["deleted_cook_ids"] == deleted
+    assert [
+        (cook["id"], cook["annotations"]["tags"])
+        for cook in await coordinator.async_list_cooks()
+    ] == [(cook_ids[1], ["test"])]
+    assert await coordinator._detail_archive.async_load(cook_ids[0]) is None
+    await coordinator.async_close_cook_archive()
+
+
 async def test_async_get_cook_returns_saved_stall_samples_and_errors(
     coordinator: PitbossDataUpdateCoordinator,
 ) -> None:
@@ -644,6 +1715,43 @@ async def test_async_get_cook_returns_saved_stall_samples_and_errors(
     ]
 
 
+async def test_device_states_are_run_length_encoded_with_duty_cycles(
+    coordinator: PitbossDataUpdateCoordinator,
+) -> None:
+    """On/off device states should be stored as transitions and summarized."""
+
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    coordinator.api._state.update({"P1ActTemp": 165, "FanOn": True})
+    coordinator._update_cook_tracking(start)
+
+    auger_on = start + COOK_CONFIRMATION_WINDOW
+    coordinator.api._state["MotorOn"] = True
+    coordinator._update_cook_tracking(auger_on)
+    coordinator._update_cook_tracking(auger_on + timedelta(minutes=10))
+    coordinator.api._state["MotorOn"] = False
+    coordinator._update_cook_tracking(auger_on + timedelta(minutes=30))
+
+    probe_removed_at = start + timedelta(hours=2)
+    coordinator.api._state["P1ActTemp"] = 0
+    coordinator._update_cook_tracking(probe_removed_at)
+    coordinator._update_cook_tracking(probe_removed_at + COOK_END_GRACE_PERIOD)
+
+    summary = coordinator.list_cooks()[0]["summary"]
+    assert summary["auger_duty_cycle"] == 25.0
+    assert summary["fan_duty_cycle"] == 100.0
+    assert summary["light_duty_cycle"] == 0.0
+
+    cook = await coordinator.async_get_cook(start.isoformat())
+
+    assert cook is not None
+    assert cook["state_transitions"]["auger"] == [
+        [start.isoformat(), False],
+        [auger_on.isoformat(), True],
+        [(auger_on + timedelta(minutes=30)).isoformat(), False],
+    ]
+    assert cook["state_transitions"]["fan"] == [[start.isoformat(), True]]
+
+
 async def test_device_error_range_closes_without_duplicate_when_update_error_occurs(
     coordinator: PitbossDataUpdateCoordinator,
 ) -> None:
@@ -0,0 +1,110 @@
+"""Tests for Pitboss cook trace downsampling."""
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.pitboss.downsample import (
+    downsample_rollups,
+    downsample_samples,
+    lttb_indices,
+    resample_samples,
+)
+
+
+def _sample(minute: int, probe1: int, stalled: bool) -> dict[str, object]:
+    """Return one sampled trace point."""
+    return {
+        "timestamp": datetime(2024, 6, 1, tzinfo=UTC) + timedelta(minutes=minute),
+        "grill_actual": 225,
+        "grill_set": 225,
+        "probe1_actual": probe1,
+        "probe2_actual": 0,
+        "probe1_stalled": stalled,
+    }
+
+
+def test_lttb_keeps_endpoints_and_peaks() -> None:
+    """LTTB should keep the first, last and most prominent points."""
+    xs = list(range(100))
+    ys = [0] * 100
+    ys[37] = 50
+
+    kept = lttb_indices(xs, ys, 10)
+
+    assert len(kept) == 10
+    assert kept[0] == 0
+    assert kept[-1] == 99
+    assert 37 in kept
+    assert lttb_indices(xs, ys, 200) == xs
+
+
+def test_downsample_samples_preserves_shape_and_stall_flags() -> None:
+    """Downsampled traces should stay bounded and keep stalls and extremes."""
+    samples = [
+        _sample(minute, 100 + minute // 4, 300 <= minute < 420)
+        for minute in range(1000)
+    ]
+    samples[640]["probe1_actual"] = 400
+
+    downsampled = downsample_samples(samples, 50)
+
+    assert len(downsampled) <= 50
+    assert downsampled[0] is samples[0]
+    assert downsampled[-1] is samples[-1]
+    assert samples[300] in downsampled
+    assert samples[420] in downsampled
+    assert samples[640] in downsampled
+    assert downsample_samples(samples[:10], 50) == samples[:10]
+
+
+def test_downsample_rollups_keeps_extremes_and_weighted_means() -> None:
+    """Merged rollup buckets should keep the extremes of their members."""
+    start = datetime(2024, 6, 1, tzinfo=UTC)
+    rollups = [
+        {
+            "timestamp": start + timedelta(minutes=5 * index),
+            "count": index + 1,
+            **{
+                f"{channel}_{stat}": value
+                for channel in ("grill_actual", "probe1_actual", "probe2_actual")
+                for stat, value in (
+                    ("min", 100 - index),
+                    ("max", 200 + index),
+                    ("mean", 150.0 + index),
+                )
+            },
+        }
+        for index in range(4)
+    ]
+
+    merged = downsample_rollups(rollups, 2)
+
+    assert [bucket["timestamp"] for bucket in merged] == [
+        rollups[0]["timestamp"],
+        rollups[2]["timestamp"],
+    ]
+    assert merged[0]["count"] == 3
+    assert merged[0]["probe1_actual_min"] == 99
+    assert merged[0]["probe1_actual_max"] == 201
+    assert merged[0]["probe1_actual_mean"] == (150.0 * 1 + 151.0 * 2) / 3
+
+
+def test_resample_samples_interpolates_onto_grid() -> None:
+    """Resampled traces should interpolate values and hold flags per point."""
+    start = datetime(2024, 6, 1, tzinfo=UTC)
+    samples = [
+        _sample(2, 100, False),
+        _sample(6, 120, True),
+        _sample(10, 120, False),
+    ]
+
+    columns = resample_samples(
+        samples, start, timedelta(minutes=4), ("probe1_actual", "probe1_stalled")
+    )
+
+    assert columns == {
+        "probe1_actual": [None, 110.0, 120.0],
+        "probe1_stalled": [None, False, True],
+    }
+    assert resample_samples([], start, timedelta(minutes=1), ("grill_set",)) == {
+        "grill_set": []
+    }
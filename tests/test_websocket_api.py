@@ -1,7 +1,9 @@
 """Tests for the Pitboss websocket cook archive API."""
 
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock
+from itertools import count
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -37,6 +39,11 @@ class FakePitbossApi:
             "GrillSetTemp": 225,
             "GrillActTemp": 215,
             "IsFarenheit": True,
+            "FanOn": False,
+            "IgniterOn": False,
+            "MotorOn": False,
+            "LightOn": False,
+            "Priming": False,
             "Error": False,
             "ErrorStr": "",
         }
@@ -63,15 +70,21 @@ class FakePitbossApi:
         return None
 
 
+@pytest.fixture(autouse=True)
+def isolated_config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Keep cook journals written during tests out of the shared config dir."""
+    hass.config.config_dir = str(tmp_path)
+
+
 def _create_coordinator(
-    hass: HomeAssistant,
+    hass: HomeAssistant, unique_id: str = "pitboss-test"
 ) -> tuple[MockConfigEntry, PitbossDataUpdateCoordinator]:
     """Create a config entry and coordinator for websocket tests."""
     config_entry = MockConfigEntry(
         domain=DOMAIN,
         title="Pit Boss",
         data={},
-        unique_id="pitboss-test",
+        unique_id=unique_id,
         minor_version=2,
     )
     config_entry.add_to_hass(hass)
@@ -125,6 +138,350 @@ async def test_list_cooks(
     assert msg["result"]["cooks"][0]["config_entry_id"] == config_entry.entry_id
 
 
+async def test_list_cooks_filters_and_pages(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Listing should filter by tag and hand out cursors for further pages."""
+    config_entry, coordinator = _create_coordinator(hass)
+    first_start = utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        days=3
+    )
+    cook_ids = [
+        _complete_confirmed_cook(coordinator, first_start + timedelta(days=day))
+        for day in range(3)
+    ]
+    await coordinator.async_update_cook_annotations(cook_ids[0], tags=["Brisket"])
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "pitboss/list_cooks",
+            "config_entry_id": config_entry.entry_id,
+            "limit": 2,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert [cook["id"] for cook in msg["result"]["cooks"]] == cook_ids[:0:-1]
+    assert msg["result"]["next_cursor"] is not None
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "pitboss/list_cooks",
+            "config_entry_id": config_entry.entry_id,
+            "limit": 2,
+            "cursor": msg["result"]["next_cursor"],
+        }
+    )
+    msg = await client.receive_json()
+    assert [cook["id"] for cook in msg["result"]["cooks"]] == cook_ids[:1]
+    assert msg["result"]["next_cursor"] is None
+
+    await client.send_json(
+        {"id": 3, "type": "pitboss/list_cooks", "tags": ["brisket"], "limit": 1}
+    )
+    msg = await client.receive_json()
+    assert [cook["id"] for cook in msg["result"]["cooks"]] == cook_ids[:1]
+    assert msg["result"]["next_cursor"] is None
+
+    await client.send_json({"id": 4, "type": "pitboss/list_cooks", "cursor": "bad"})
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == websocket_api_const.ERR_INVALID_FORMAT
+
+
+async def test_list_cooks_pages_across_entries(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Listing without an entry should page through one merged order."""
+    coordinators = [
+        _create_coordinator(hass, unique_id)[1]
+        for unique_id in ("pitboss-patio", "pitboss-garage")
+    ]
+    for coordinator in coordinators:
+        await coordinator.async_initialize()
+    first_start = utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        days=4
+    )
+    cook_ids = [
+        _complete_confirmed_cook(
+            coordinators[day % 2], first_start + timedelta(days=day)
+        )
+        for day in range(4)
+    ]
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+    message_ids = count(1)
+
+    async def _list_all() -> list[list[str]]:
+        pages: list[list[str]] = []
+        message = {"type": "pitboss/list_cooks", "limit": 3}
+        while True:
+            await client.send_json({"id": next(message_ids), **message})
+            result = (await client.receive_json())["result"]
+            pages.append([cook["id"] for cook in result["cooks"]])
+            if result["next_cursor"] is None:
+                return pages
+            message["cursor"] = result["next_cursor"]
+
+    assert await _list_all() == [cook_ids[:0:-1], cook_ids[:1]]
+
+    assert await coordinators[1].async_delete_cook(cook_ids[3])
+    assert await _list_all() == [cook_ids[2::-1]]
+
+
+async def test_list_cooks_pages_across_entries_with_equal_sort_keys(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Cooks of two entries with the same start should each be listed once."""
+    entries = [
+        _create_coordinator(hass, unique_id)
+        for unique_id in ("pitboss-patio", "pitboss-garage")
+    ]
+    start = utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(days=1)
+    for _, coordinator in entries:
+        await coordinator.async_initialize()
+        _complete_confirmed_cook(coordinator, start)
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+    message_ids = count(1)
+
+    async def _list_entry_ids(**options: str | bool) -> list[str]:
+        entry_ids: list[str] = []
+        message = {"type": "pitboss/list_cooks", "limit": 1, **options}
+        while True:
+            await client.send_json({"id": next(message_ids), **message})
+            result = (await client.receive_json())["result"]
+            entry_ids.extend(cook["config_entry_id"] for cook in result["cooks"])
+            if result["next_cursor"] is None:
+                return entry_ids
+            message["cursor"] = result["next_cursor"]
+
+    entry_ids = sorted(config_entry.entry_id for config_entry, _ in entries)
+    assert await _list_entry_ids() == entry_ids[::-1]
+    assert await _list_entry_ids(descending=False) == entry_ids
+    assert await _list_entry_ids(sort="duration") == entry_ids[::-1]
+    assert await _list_entry_ids(sort="duration", descending=False) == entry_ids
+
+
+async def test_cook_changes_are_pushed_and_listed_since_a_version(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Clients should stay in sync from archive versions and pushed changes."""
+    config_entry, coordinator = _create_coordinator(hass)
+    first_start = utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        days=2
+    )
+    first_id = _complete_confirmed_cook(coordinator, first_start)
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "pitboss/subscribe_cook_changes",
+            "config_entry_id": config_entry.entry_id,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    synced_version = msg["result"]["version"]
+
+    second_id = _complete_confirmed_cook(coordinator, first_start + timedelta(days=1))
+    msg = await client.receive_json()
+    assert msg["event"]["version"] == synced_version + 1
+    assert [cook["id"] for cook in msg["event"]["cooks"]] == [second_id]
+    assert msg["event"]["deleted_cook_ids"] == []
+
+    assert await coordinator.async_delete_cook(first_id)
+    msg = await client.receive_json()
+    assert msg["event"] == {
+        "version": synced_version + 2,
+        "cooks": [],
+        "deleted_cook_ids": [first_id],
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "pitboss/list_cooks",
+            "config_entry_id": config_entry.entry_id,
+            "since_version": synced_version,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["result"]["reset"] is False
+    assert msg["result"]["version"] == synced_version + 2
+    assert [cook["id"] for cook in msg["result"]["cooks"]] == [second_id]
+    assert msg["result"]["deleted_cook_ids"] == [first_id]
+
+    with patch("custom_components.pitboss.coordinator.COOK_ARCHIVE_CHANGELOG_SIZE", 1):
+        await coordinator.async_update_cook_annotations(second_id, notes="Juicy")
+    await client.receive_json()
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "pitboss/list_cooks",
+            "config_entry_id": config_entry.entry_id,
+            "since_version": synced_version,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["result"]["reset"] is True
+    assert msg["result"]["version"] == synced_version + 3
+    assert [cook["id"] for cook in msg["result"]["cooks"]] == [second_id]
+
+
+async def test_subscribe_active_cook_pushes_incremental_changes(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Subscribers should get the trace once and then one event per change."""
+    config_entry, coordinator = _create_coordinator(hass)
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "pitboss/subscribe_active_cook",
+            "config_entry_id": config_entry.entry_id,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"cook": None}
+
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    coordinator.api._state["P1ActTemp"] = 150
+    coordinator._update_cook_tracking(start)
+    cook = (await client.receive_json())["event"]
+    assert cook["type"] == "cook"
+    assert cook["cook"]["id"] == start.isoformat()
+    sample = (await client.receive_json())["event"]
+    assert (sample["type"], sample["index"]) == ("sample", 0)
+    assert sample["sample"]["probe1_actual"] == 150
+    phase = (await client.receive_json())["event"]
+    assert (phase["type"], phase["index"]) == ("phase", 0)
+
+    coordinator.api._state["P1ActTemp"] = 152
+    coordinator._update_cook_tracking(start + timedelta(minutes=1))
+    replaced = (await client.receive_json())["event"]
+    assert (replaced["type"], replaced["index"]) == ("sample", 0)
+    assert replaced["sample"]["probe1_actual"] == 152
+
+    coordinator.api._state["Error"] = True
+    coordinator.api._state["ErrorStr"] = "Auger jam"
+    coordinator._update_cook_tracking(start + timedelta(minutes=5))
+    error = (await client.receive_json())["event"]
+    assert (error["type"], error["index"]) == ("error", 0)
+    assert error["error"]["message"] == "Auger jam"
+    appended = (await client.receive_json())["event"]
+    assert (appended["type"], appended["index"]) == ("sample", 1)
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "pitboss/subscribe_active_cook",
+            "config_entry_id": config_entry.entry_id,
+        }
+    )
+    msg = await client.receive_json()
+    assert len(msg["result"]["cook"]["samples"]) == 2
+    assert len(msg["result"]["cook"]["phases"]) == 1
+
+    await client.send_json({"id": 3, "type": "unsubscribe_events", "subscription": 2})
+    assert (await client.receive_json())["success"]
+    coordinator.api._state["P1ActTemp"] = 0
+    coordinator._update_cook_tracking(start + timedelta(minutes=10))
+    coordinator._update_cook_tracking(
+        start + timedelta(minutes=10) + COOK_END_GRACE_PERIOD
+    )
+    msg = await client.receive_json()
+    assert msg["id"] == 1
+    assert msg["event"] == {"type": "cook", "cook": None}
+
+
+async def test_subscribe_active_cook_skips_unchanged_polls(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """A poll repeating the stored readings should not push an event."""
+    config_entry, coordinator = _create_coordinator(hass)
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "pitboss/subscribe_active_cook",
+            "config_entry_id": config_entry.entry_id,
+        }
+    )
+    assert (await client.receive_json())["success"]
+
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    coordinator.api._state["P1ActTemp"] = 150
+    coordinator._update_cook_tracking(start)
+    assert [(await client.receive_json())["event"]["type"] for _ in range(3)] == [
+        "cook",
+        "sample",
+        "phase",
+    ]
+
+    coordinator._update_cook_tracking(start + timedelta(minutes=1))
+    coordinator.api._state["P1ActTemp"] = 151
+    coordinator._update_cook_tracking(start + timedelta(minutes=2))
+
+    # The unchanged poll sent nothing, so the next event is the changed one.
+    event = (await client.receive_json())["event"]
+    assert (event["type"], event["index"]) == ("sample", 0)
+    assert event["sample"]["probe1_actual"] == 151
+
+
+async def test_subscriptions_end_when_the_entry_unloads(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Subscribers should get an error when the archive closes on unload."""
+    config_entry, coordinator = _create_coordinator(hass)
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+
+    for msg_id, command in enumerate(
+        ("pitboss/subscribe_cook_changes", "pitboss/subscribe_active_cook"), 1
+    ):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": command,
+                "config_entry_id": config_entry.entry_id,
+            }
+        )
+        assert (await client.receive_json())["success"]
+
+    await coordinator.async_close_cook_archive()
+
+    ended = [await client.receive_json() for _ in range(2)]
+    assert sorted(msg["id"] for msg in ended) == [1, 2]
+    for msg in ended:
+        assert not msg["success"]
+        assert msg["error"]["code"] == websocket_api_const.ERR_NOT_FOUND
+    assert not coordinator._active_cook_listeners
+    assert not coordinator._cook_change_listeners
+    assert not coordinator._subscription_closers
+
+    await client.send_json({"id": 3, "type": "unsubscribe_events", "subscription": 1})
+    assert not (await client.receive_json())["success"]
+
+
 async def test_archive_read_commands_require_admin(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
@@ -195,6 +552,263 @@ async def test_get_cook(
     assert msg["result"]["cook"]["errors"] == []
 
 
+async def test_get_cook_window(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test fetching the part of an archived cook inside a time window."""
+    config_entry, coordinator = _create_coordinator(hass)
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    cook_id = _complete_confirmed_cook(coordinator, start)
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+    message_id = count(1)
+
+    async def _get(**window: str) -> dict:
+        await client.send_json(
+            {
+                "id": next(message_id),
+                "type": "pitboss/get_cook_window",
+                "config_entry_id": config_entry.entry_id,
+                "cook_id": cook_id,
+                **window,
+            }
+        )
+        return await client.receive_json()
+
+    full = await coordinator.async_get_cook(cook_id)
+    second_sample = full["samples"][1]["timestamp"]
+
+    msg = await _get(start=second_sample, end=(start + timedelta(days=1)).isoformat())
+    assert msg["success"]
+    assert msg["result"]["cook"]["id"] == cook_id
+    assert msg["result"]["cook"]["samples"] == full["samples"][1:]
+
+    msg = await _get(
+        start=(start - timedelta(hours=2)).isoformat(),
+        end=(start - timedelta(hours=1)).isoformat(),
+    )
+    assert msg["success"]
+    assert msg["result"]["cook"]["samples"] == []
+
+    msg = await _get(start=second_sample, end=start.isoformat())
+    assert not msg["success"]
+    assert msg["error"]["code"] == websocket_api_const.ERR_INVALID_FORMAT
+
+
+async def test_get_cook_columnar(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test fetching a cook as one array per requested channel."""
+    config_entry, coordinator = _create_coordinator(hass)
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    cook_id = _complete_confirmed_cook(coordinator, start)
+    async_setup_websocket_api(hass)
+
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "pitboss/get_cook",
+            "config_entry_id": config_entry.entry_id,
+            "cook_id": cook_id,
+            "format": "columnar",
+            "channels": ["probe1_actual", "probe1_stalled"],
+        }
+    )
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    cook = msg["result"]["cook"]
+    rows = (await coordinator.async_get_cook(cook_id))["samples"]
+    assert cook["format"] == "columnar"
+    assert cook["time_base"] == int(start.timestamp() * 1000)
+    assert cook["samples"] == {
+        "offsets": [
+            int(datetime.fromisoformat(row["timestamp"]).timestamp() * 1000)
+            - cook["time_base"]
+            for row in rows
+        ],
+        "probe1_actual": [row["probe1_actual"] for row in rows],
+        "probe1_stalled": [row["probe1_stalled"] for row in rows],
+    }
+    assert set(cook["rollups"]) == {
+        "offsets",
+        "count",
+        "probe1_actual_min",
+        "probe1_actual_max",
+        "probe1_actual_mean",
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "pitboss/get_cook",
+            "config_entry_id": config_entry.entry_id,
+            "cook_id": cook_id,
+            "format": "columnar",
+            "channels": ["smoke"],
+        }
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == websocket_api_const.ERR_INVALID_FORMAT
+
+
+async def test_get_cook_capture(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Only the active cook's capture ring should be served."""
+    config_entry, coordinator = _create_coordinator(hass)
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    cook_id = _complete_confirmed_cook(coordinator, start)
+    await hass.async_block_till_done()
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+    message_id = count(1)
+
+    async def _get() -> dict:
+        await client.send_json(
+            {
+                "id": next(message_id),
+                "type": "pitboss/get_cook_capture",
+                "config_entry_id": config_entry.entry_id,
+                "channels": ["probe1_actual"],
+            }
+        )
+        return await client.receive_json()
+
+    msg = await _get()
+    assert not msg["success"]
+    assert msg["error"]["code"] == websocket_api_const.ERR_NOT_FOUND
+    stored_detail = await coordinator._detail_archive.async_load(cook_id)
+    assert "capture" not in stored_detail
+    assert stored_detail["rollups"]["timestamp"]
+
+    next_start = start + timedelta(days=1)
+    coordinator.api._state["P1ActTemp"] = 140
+    coordinator._update_cook_tracking(next_start)
+    msg = await _get()
+    assert msg["success"]
+    assert msg["result"]["capture"] == {
+        "id": next_start.isoformat(),
+        "format": "columnar",
+        "time_base": int(next_start.timestamp() * 1000),
+        "polls": {"offsets": [0], "probe1_actual": [140]},
+    }
+
+
+async def test_get_cooks_aligns_cooks_across_entries(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Several cooks should load in one request on a shared minute grid."""
+    entries = [
+        _create_coordinator(hass, unique_id)
+        for unique_id in ("pitboss-patio", "pitboss-garage")
+    ]
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    requests = [
+        {
+            "config_entry_id": config_entry.entry_id,
+            "cook_id": _complete_confirmed_cook(
+                coordinator, start - timedelta(days=day + 1)
+            ),
+        }
+        for day, (config_entry, coordinator) in enumerate(entries)
+    ]
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "pitboss/get_cooks",
+            "cooks": requests,
+            "interval_minutes": 1,
+            "channels": ["probe1_actual"],
+        }
+    )
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    cooks = msg["result"]["cooks"]
+    assert [(cook["config_entry_id"], cook["id"]) for cook in cooks] == [
+        (request["config_entry_id"], request["cook_id"]) for request in requests
+    ]
+    assert msg["result"]["minutes"][:3] == [0, 1, 2]
+    for cook in cooks:
+        assert set(cook["samples"]) == {"probe1_actual"}
+        assert len(cook["samples"]["probe1_actual"]) == len(msg["result"]["minutes"])
+        assert cook["samples"]["probe1_actual"][:3] == [None, None, 165]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "pitboss/get_cooks",
+            "cooks": [*requests, {**requests[0], "cook_id": "missing"}],
+        }
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == websocket_api_const.ERR_NOT_FOUND
+
+
+async def test_aggregate_cooks_by_tag(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Tagged cooks should aggregate into cached percentile curves."""
+    config_entry, coordinator = _create_coordinator(hass)
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    cook_ids = [
+        _complete_confirmed_cook(coordinator, start - timedelta(days=day + 1))
+        for day in range(3)
+    ]
+    for cook_id in cook_ids[:2]:
+        await coordinator.async_update_cook_annotations(cook_id, tags=["brisket"])
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+    message_ids = count(1)
+
+    async def _aggregate() -> dict:
+        await client.send_json(
+            {
+                "id": next(message_ids),
+                "type": "pitboss/aggregate_cooks",
+                "config_entry_id": config_entry.entry_id,
+                "tags": ["Brisket"],
+                "interval_minutes": 1,
+                "channels": ["probe1_actual"],
+            }
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+        return msg["result"]
+
+    result = await _aggregate()
+    assert result["cook_count"] == 2
+    assert result["minutes"][:3] == [0, 1, 2]
+    assert result["count"][:3] == [0, 0, 2]
+    assert result["channels"]["probe1_actual"]["p50"][:3] == [None, None, 165]
+    assert result["truncated"] is False
+    assert len(coordinator._cook_detail_cache) == 0
+
+    assert await _aggregate() == result
+    assert coordinator._cook_aggregate_cache.hits == 1
+
+    await coordinator.async_update_cook_annotations(cook_ids[2], tags=["brisket"])
+    assert (await _aggregate())["cook_count"] == 3
+
+    await coordinator.async_update_cook_annotations(cook_ids[0], tags=["ribs"])
+    with patch("custom_components.pitboss.coordinator.COOK_AGGREGATE_MAX_COOKS", 1):
+        result = await _aggregate()
+    assert result["cook_count"] == 1
+    assert result["truncated"] is True
+
+
 async def test_update_cook_annotations(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
@@ -334,3 +948,56 @@ async def test_get_cook_includes_recorded_device_and_update_errors(
             "message": "Communication error while updating Pit Boss state: boom",
         },
     ]
+
+
+async def test_bulk_update_and_delete_cooks(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test annotating and deleting several cooks in one request each."""
+    config_entry, coordinator = _create_coordinator(hass)
+    start = utcnow().replace(minute=0, second=0, microsecond=0)
+    cook_ids = [
+        _complete_confirmed_cook(coordinator, start - timedelta(days=day + 1))
+        for day in range(3)
+    ]
+    async_setup_websocket_api(hass)
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "pitboss/bulk_update_cook_annotations",
+            "config_entry_id": config_entry.entry_id,
+            "cook_ids": [*cook_ids[:2], "missing"],
+            "tags": ["Test Cook"],
+        }
+    )
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert [cook["id"] for cook in msg["result"]["cooks"]] == cook_ids[:2]
+    assert all(
+        cook["annotations"]["tags"] == ["test cook"]
+        for cook in msg["result"]["cooks"]
+    )
+    assert msg["result"]["missing_cook_ids"] == ["missing"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "pitboss/bulk_delete_cooks",
+            "config_entry_id": config_entry.entry_id,
+            "cook_ids": [*cook_ids[:2], "missing", cook_ids[0]],
+        }
+    )
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"] == {
+        "deleted_cook_ids": cook_ids[:2],
+        "missing_cook_ids": ["missing"],
+    }
+    assert [cook["id"] for cook in await coordinator.async_list_cooks()] == [
+        cook_ids[2]
+    ]
@@ -1,14 +1,33 @@
 """Websocket API for the Pit Boss cook archive."""
 
+import asyncio
+from datetime import datetime, timedelta
+from heapq import merge
+from itertools import islice
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant, callback
-
-from .const import DOMAIN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util.dt import as_utc
+
+from .catalog import async_get_cook_catalog
+from .codec import SAMPLE_CHANNELS, SAMPLE_DELTA_COLUMNS, to_epoch_microseconds
+from .const import (
+    COOK_BATCH_MAX_COOKS,
+    COOK_BATCH_PARALLELISM,
+    COOK_FORMAT_COLUMNAR,
+    COOK_FORMAT_ROWS,
+    COOK_LIST_MAX_LIMIT,
+    COOK_SAMPLE_INTERVAL,
+    COOK_SORT_DURATION,
+    COOK_SORT_START,
+    DOMAIN,
+)
 from .coordinator import PitbossDataUpdateCoordinator
+from .index import CookQuery, CookSortKey, decode_cursor, encode_cursor
 
 
 @callback
@@ -16,9 +35,17 @@ def async_setup(hass: HomeAssistant) -> None:
     """Register the Pit Boss websocket commands."""
 
     websocket_api.async_register_command(hass, ws_list_cooks)
+    websocket_api.async_register_command(hass, ws_subscribe_cook_changes)
     websocket_api.async_register_command(hass, ws_get_cook)
+    websocket_api.async_register_command(hass, ws_get_cook_window)
+    websocket_api.async_register_command(hass, ws_get_cook_capture)
+    websocket_api.async_register_command(hass, ws_get_cooks)
+    websocket_api.async_register_command(hass, ws_aggregate_cooks)
+    websocket_api.async_register_command(hass, ws_subscribe_active_cook)
     websocket_api.async_register_command(hass, ws_update_cook_annotations)
     websocket_api.async_register_command(hass, ws_delete_cook)
+    websocket_api.async_register_command(hass, ws_bulk_update_cook_annotations)
+    websocket_api.async_register_command(hass, ws_bulk_delete_cooks)
 
 
 def _get_coordinator(
@@ -34,11 +61,87 @@ def _get_coordinator(
     return entry.runtime_data
 
 
+def _async_end_subscription(
+    connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> CALLBACK_TYPE:
+    """Return a callback that ends a subscription when its entry unloads.
+
+    The subscriber gets an error for the subscription id and can subscribe
+    again once the config entry is loaded.
+    """
+
+    @callback
+    def _end() -> None:
+        if (unsubscribe := connection.subscriptions.pop(msg["id"], None)) is None:
+            return
+        unsubscribe()
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Pit Boss config entry {msg['config_entry_id']} was unloaded",
+        )
+
+    return _end
+
+
+def _build_cook_query(msg: dict[str, Any]) -> CookQuery:
+    """Build a cook listing query from a websocket message.
+
+    Raises ValueError for a paging cursor that was not issued by this API.
+    """
+
+    started_after = msg.get("started_after")
+    started_before = msg.get("started_before")
+    return CookQuery(
+        started_after=(
+            None
+            if started_after is None
+            else to_epoch_microseconds(as_utc(started_after))
+        ),
+        started_before=(
+            None
+            if started_before is None
+            else to_epoch_microseconds(as_utc(started_before))
+        ),
+        tags=frozenset(
+            tag.strip().casefold() for tag in msg.get("tags", []) if tag.strip()
+        ),
+        min_duration=msg.get("min_duration_seconds"),
+        sort=msg["sort"],
+        descending=msg["descending"],
+        limit=msg.get("limit"),
+        cursor=None if (cursor := msg.get("cursor")) is None else decode_cursor(cursor),
+    )
+
+
+def _cook_sort_key(query: CookQuery, cook: dict[str, Any]) -> CookSortKey:
+    """Return the sort key of a serialized cook summary."""
+
+    if query.sort == COOK_SORT_DURATION:
+        return cook["duration_seconds"], cook["id"]
+    return to_epoch_microseconds(datetime.fromisoformat(cook["start"])), cook["id"]
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "pitboss/list_cooks",
         vol.Optional("config_entry_id"): str,
+        vol.Optional("limit"): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=COOK_LIST_MAX_LIMIT)
+        ),
+        vol.Optional("cursor"): str,
+        vol.Optional("started_after"): cv.datetime,
+        vol.Optional("started_before"): cv.datetime,
+        vol.Optional("tags"): [str],
+        vol.Optional("min_duration_seconds"): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional("sort", default=COOK_SORT_START): vol.In(
+            [COOK_SORT_START, COOK_SORT_DURATION]
+        ),
+        vol.Optional("descending", default=True): bool,
+        vol.Optional("since_version"): vol.Coerce(int),
     }
 )
 @websocket_api.async_response
@@ -47,7 +150,23 @@ async def ws_list_cooks(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """List completed cooks, optionally filtered by config entry."""
+    """List a page of completed cooks, optionally filtered by config entry.
+
+    Cooks can be narrowed by start time, tags and minimum duration, and are
+    ordered by start or duration. With a ``limit`` the result carries a
+    ``next_cursor`` to pass back for the following page.
+
+    Listing one entry also returns its archive ``version``. Passing it back
+    as ``since_version`` returns only the cooks added or changed since then
+    and the ids of deleted cooks, regardless of filters. When those changes
+    are no longer known the listing is sent in full, with ``reset`` set.
+    """
+
+    try:
+        query = _build_cook_query(msg)
+    except ValueError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, str(err))
+        return
 
     if config_entry_id := msg.get("config_entry_id"):
         if (coordinator := _get_coordinator(hass, config_entry_id)) is None:
@@ -58,17 +177,97 @@ async def ws_list_cooks(
             )
             return
 
-        cooks = coordinator.list_cooks()
-    else:
-        cooks = []
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            if entry.runtime_data is None:
-                continue
-            cooks.extend(entry.runtime_data.list_cooks())
+        if "since_version" in msg and (
+            changes := coordinator.get_cook_changes(msg["since_version"])
+        ) is not None:
+            connection.send_result(msg["id"], {**changes, "reset": False})
+            return
+
+        version = coordinator.archive_version
+        cooks, next_cursor = await coordinator.async_query_cooks(query)
+        result = {"cooks": cooks, "next_cursor": next_cursor, "version": version}
+        if "since_version" in msg:
+            result["reset"] = True
+        connection.send_result(msg["id"], result)
+        return
+
+    if "since_version" in msg:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_INVALID_FORMAT,
+            "since_version requires a config_entry_id",
+        )
+        return
+
+    # Entries held in the catalog are listed from its merged order; the
+    # rest contribute a page each, and the ordered pages are merged.
+    catalog = async_get_cook_catalog(hass)
+    use_catalog = catalog.covers(query)
+    pages: list[list[dict[str, Any]]] = []
+    more = False
+    if use_catalog:
+        page, page_cursor = catalog.query(query)
+        pages.append(page)
+        more = page_cursor is not None
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.runtime_data is None or (use_catalog and entry.entry_id in catalog):
+            continue
+        page, page_cursor = await entry.runtime_data.async_query_cooks(query)
+        pages.append(page)
+        more = more or page_cursor is not None
+
+    merged = merge(
+        *pages,
+        key=lambda cook: (*_cook_sort_key(query, cook), cook["config_entry_id"]),
+        reverse=query.descending,
+    )
+    cooks = list(islice(merged, query.limit))
+    next_cursor = None
+    if cooks and (more or next(merged, None) is not None):
+        next_cursor = encode_cursor(
+            (*_cook_sort_key(query, cooks[-1]), cooks[-1]["config_entry_id"])
+        )
+
+    connection.send_result(msg["id"], {"cooks": cooks, "next_cursor": next_cursor})
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pitboss/subscribe_cook_changes",
+        vol.Required("config_entry_id"): str,
+    }
+)
+@callback
+def ws_subscribe_cook_changes(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Push each change to the completed-cook archive of a config entry.
+
+    The result carries the current archive version; every event carries the
+    new version with the changed cooks and the ids of deleted cooks.
+    """
+
+    if (coordinator := _get_coordinator(hass, msg["config_entry_id"])) is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Pit Boss config entry {msg['config_entry_id']} was not found",
+        )
+        return
+
+    @callback
+    def _forward_changes(changes: dict[str, Any]) -> None:
+        """Send one archive change to the subscriber."""
 
-        cooks.sort(key=lambda cook: cook["start"], reverse=True)
+        connection.send_message(websocket_api.event_message(msg["id"], changes))
 
-    connection.send_result(msg["id"], {"cooks": cooks})
+    connection.subscriptions[msg["id"]] = coordinator.async_subscribe_cook_changes(
+        _forward_changes, _async_end_subscription(connection, msg)
+    )
+    connection.send_result(msg["id"], {"version": coordinator.archive_version})
 
 
 @websocket_api.require_admin
@@ -77,6 +276,13 @@ async def ws_list_cooks(
         vol.Required("type"): "pitboss/get_cook",
         vol.Required("config_entry_id"): str,
         vol.Required("cook_id"): str,
+        vol.Optional("max_points"): vol.All(vol.Coerce(int), vol.Range(min=2)),
+        vol.Optional("format", default=COOK_FORMAT_ROWS): vol.In(
+            [COOK_FORMAT_ROWS, COOK_FORMAT_COLUMNAR]
+        ),
+        vol.Optional("channels", default=list(SAMPLE_CHANNELS)): [
+            vol.In(SAMPLE_CHANNELS)
+        ],
     }
 )
 @websocket_api.async_response
@@ -85,7 +291,13 @@ async def ws_get_cook(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Return one completed cook with its sampled trace."""
+    """Return one completed cook with its sampled trace.
+
+    With ``max_points`` the trace is downsampled to about that many points,
+    keeping peaks, stall flag changes and every error span. The ``columnar``
+    format sends one array per requested channel with timestamps as offsets
+    from a base epoch, which is far smaller for long cooks.
+    """
 
     if (coordinator := _get_coordinator(hass, msg["config_entry_id"])) is None:
         connection.send_error(
@@ -95,7 +307,14 @@ async def ws_get_cook(
         )
         return
 
-    if (cook := await coordinator.async_get_cook(msg["cook_id"])) is None:
+    if (
+        cook := await coordinator.async_get_cook(
+            msg["cook_id"],
+            max_points=msg.get("max_points"),
+            data_format=msg["format"],
+            channels=msg["channels"],
+        )
+    ) is None:
         connection.send_error(
             msg["id"],
             websocket_api.ERR_NOT_FOUND,
@@ -106,6 +325,278 @@ async def ws_get_cook(
     connection.send_result(msg["id"], {"cook": cook})
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pitboss/get_cook_window",
+        vol.Required("config_entry_id"): str,
+        vol.Required("cook_id"): str,
+        vol.Required("start"): cv.datetime,
+        vol.Required("end"): cv.datetime,
+        vol.Optional("max_points"): vol.All(vol.Coerce(int), vol.Range(min=2)),
+        vol.Optional("format", default=COOK_FORMAT_ROWS): vol.In(
+            [COOK_FORMAT_ROWS, COOK_FORMAT_COLUMNAR]
+        ),
+        vol.Optional("channels", default=list(SAMPLE_CHANNELS)): [
+            vol.In(SAMPLE_CHANNELS)
+        ],
+    }
+)
+@websocket_api.async_response
+async def ws_get_cook_window(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return one completed cook with the part of its trace inside a window.
+
+    Samples, rollups, errors and state runs are limited to ``start`` through
+    ``end``; ``max_points`` and ``format`` then apply as for ``get_cook``.
+    """
+
+    start = as_utc(msg["start"])
+    end = as_utc(msg["end"])
+    if end < start:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_INVALID_FORMAT,
+            "The window end must not be before its start",
+        )
+        return
+
+    if (coordinator := _get_coordinator(hass, msg["config_entry_id"])) is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Pit Boss config entry {msg['config_entry_id']} was not found",
+        )
+        return
+
+    if (
+        cook := await coordinator.async_get_cook_window(
+            msg["cook_id"],
+            start,
+            end,
+            max_points=msg.get("max_points"),
+            data_format=msg["format"],
+            channels=msg["channels"],
+        )
+    ) is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Cook {msg['cook_id']} was not found",
+        )
+        return
+
+    connection.send_result(msg["id"], {"cook": cook})
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pitboss/get_cook_capture",
+        vol.Required("config_entry_id"): str,
+        vol.Optional("channels", default=list(SAMPLE_DELTA_COLUMNS)): [
+            vol.In(SAMPLE_DELTA_COLUMNS)
+        ],
+    }
+)
+@callback
+def ws_get_cook_capture(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return every poll captured for the active cook in the columnar format."""
+
+    if (coordinator := _get_coordinator(hass, msg["config_entry_id"])) is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Pit Boss config entry {msg['config_entry_id']} was not found",
+        )
+        return
+
+    if (capture := coordinator.get_active_cook_capture(msg["channels"])) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "No cook is in progress"
+        )
+        return
+
+    connection.send_result(msg["id"], {"capture": capture})
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pitboss/get_cooks",
+        vol.Required("cooks"): vol.All(
+            [
+                {
+                    vol.Required("config_entry_id"): str,
+                    vol.Required("cook_id"): str,
+                }
+            ],
+            vol.Length(min=1, max=COOK_BATCH_MAX_COOKS),
+        ),
+        vol.Optional(
+            "interval_minutes",
+            default=int(COOK_SAMPLE_INTERVAL.total_seconds() // 60),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("channels", default=list(SAMPLE_CHANNELS)): vol.All(
+            [vol.In(SAMPLE_CHANNELS)], vol.Length(min=1)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_get_cooks(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return several completed cooks aligned on a common grid for overlays.
+
+    Every trace is resampled to ``interval_minutes`` steps from its own start,
+    so index ``i`` of each channel array is minute ``i * interval_minutes`` of
+    every cook. Details load concurrently, a few at a time.
+    """
+
+    step = timedelta(minutes=msg["interval_minutes"])
+    semaphore = asyncio.Semaphore(COOK_BATCH_PARALLELISM)
+
+    async def _fetch(request: dict[str, str]) -> dict[str, Any] | None:
+        if (coordinator := _get_coordinator(hass, request["config_entry_id"])) is None:
+            return None
+        async with semaphore:
+            return await coordinator.async_get_cook_resampled(
+                request["cook_id"], step, msg["channels"]
+            )
+
+    cooks = await asyncio.gather(*(_fetch(request) for request in msg["cooks"]))
+    if missing := [
+        request["cook_id"]
+        for request, cook in zip(msg["cooks"], cooks, strict=True)
+        if cook is None
+    ]:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Cooks {', '.join(missing)} were not found",
+        )
+        return
+
+    points = max(len(cook["samples"][msg["channels"][0]]) for cook in cooks)
+    connection.send_result(
+        msg["id"],
+        {
+            "minutes": [point * msg["interval_minutes"] for point in range(points)],
+            "cooks": cooks,
+        },
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pitboss/aggregate_cooks",
+        vol.Required("config_entry_id"): str,
+        vol.Optional("started_after"): cv.datetime,
+        vol.Optional("started_before"): cv.datetime,
+        vol.Optional("tags"): [str],
+        vol.Optional("min_duration_seconds"): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(
+            "interval_minutes",
+            default=int(COOK_SAMPLE_INTERVAL.total_seconds() // 60),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("channels", default=list(SAMPLE_DELTA_COLUMNS)): vol.All(
+            [vol.In(SAMPLE_DELTA_COLUMNS)], vol.Length(min=1)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_aggregate_cooks(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return percentile curves across every completed cook matching a filter.
+
+    Cooks are filtered like ``list_cooks`` and aligned on ``interval_minutes``
+    steps from their own start. Each channel carries one array per percentile
+    and ``count`` holds how many cooks cover each point. Only the newest
+    matching cooks are aggregated, up to a fixed cap; ``truncated`` is set
+    when more matched.
+    """
+
+    if (coordinator := _get_coordinator(hass, msg["config_entry_id"])) is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Pit Boss config entry {msg['config_entry_id']} was not found",
+        )
+        return
+
+    aggregate = await coordinator.async_aggregate_cooks(
+        _build_cook_query({**msg, "sort": COOK_SORT_START, "descending": False}),
+        timedelta(minutes=msg["interval_minutes"]),
+        msg["channels"],
+    )
+    connection.send_result(
+        msg["id"],
+        {
+            "minutes": [
+                point * msg["interval_minutes"]
+                for point in range(len(aggregate["count"]))
+            ],
+            **aggregate,
+        },
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pitboss/subscribe_active_cook",
+        vol.Required("config_entry_id"): str,
+    }
+)
+@callback
+def ws_subscribe_active_cook(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the active cook trace once, then push each change to it.
+
+    Events are typed: ``cook`` carries the cook without its trace when it
+    starts or its state changes, and None once it ends; ``sample`` and
+    ``error`` carry the item and its index, replacing an existing item when
+    the index is already known; ``phase`` carries the phase just entered.
+    """
+
+    if (coordinator := _get_coordinator(hass, msg["config_entry_id"])) is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Pit Boss config entry {msg['config_entry_id']} was not found",
+        )
+        return
+
+    @callback
+    def _forward_event(event: dict[str, Any]) -> None:
+        """Send one active-cook change to the subscriber."""
+
+        connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    connection.subscriptions[msg["id"]] = coordinator.async_subscribe_active_cook(
+        _forward_event, _async_end_subscription(connection, msg)
+    )
+    connection.send_result(msg["id"], {"cook": coordinator.get_active_cook_trace()})
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
@@ -190,3 +681,100 @@ async def ws_delete_cook(
         return
 
     connection.send_result(msg["id"], {"cook_id": msg["cook_id"]})
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pitboss/bulk_update_cook_annotations",
+        vol.Required("config_entry_id"): str,
+        vol.Required("cook_ids"): vol.All([str], vol.Length(min=1)),
+        vol.Optional("tags"): [str],
+        vol.Optional("notes"): vol.Any(str, None),
+    }
+)
+@websocket_api.async_response
+async def ws_bulk_update_cook_annotations(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Set the same notes and/or tags on several completed cooks at once.
+
+    Cook ids that do not exist are reported in ``missing_cook_ids``.
+    """
+
+    if (coordinator := _get_coordinator(hass, msg["config_entry_id"])) is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Pit Boss config entry {msg['config_entry_id']} was not found",
+        )
+        return
+
+    if not ({"tags", "notes"} & msg.keys()):
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_INVALID_FORMAT,
+            "At least one of tags or notes must be provided",
+        )
+        return
+
+    updated_cooks = await coordinator.async_bulk_update_cook_annotations(
+        msg["cook_ids"],
+        tags=msg.get("tags"),
+        notes=msg["notes"] if "notes" in msg else ...,
+    )
+    updated_ids = {cook["id"] for cook in updated_cooks}
+    connection.send_result(
+        msg["id"],
+        {
+            "cooks": updated_cooks,
+            "missing_cook_ids": [
+                cook_id
+                for cook_id in dict.fromkeys(msg["cook_ids"])
+                if cook_id not in updated_ids
+            ],
+        },
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pitboss/bulk_delete_cooks",
+        vol.Required("config_entry_id"): str,
+        vol.Required("cook_ids"): vol.All([str], vol.Length(min=1)),
+    }
+)
+@websocket_api.async_response
+async def ws_bulk_delete_cooks(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Delete several completed cooks from the archive at once.
+
+    Cook ids that do not exist are reported in ``missing_cook_ids``.
+    """
+
+    if (coordinator := _get_coordinator(hass, msg["config_entry_id"])) is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Pit Boss config entry {msg['config_entry_id']} was not found",
+        )
+        return
+
+    deleted = await coordinator.async_bulk_delete_cooks(msg["cook_ids"])
+    connection.send_result(
+        msg["id"],
+        {
+            "deleted_cook_ids": deleted,
+            "missing_cook_ids": [
+                cook_id
+                for cook_id in dict.fromkeys(msg["cook_ids"])
+                if cook_id not in deleted
+            ],
+        },
+    )